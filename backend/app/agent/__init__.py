@@ -1,6 +1,18 @@
 """Agent module."""
 
-from app.agent.executor import AgentExecutor
+from app.agent.executor import AgentEvent, AgentExecutor
 from app.agent.memory import ConversationMemory, Message
+from app.agent.router import IntentRouter, RouteMatch, intent_router
+from app.agent.tool_selection import ToolSelector, tool_selector
 
-__all__ = ["AgentExecutor", "ConversationMemory", "Message"]
+__all__ = [
+    "AgentEvent",
+    "AgentExecutor",
+    "ConversationMemory",
+    "IntentRouter",
+    "Message",
+    "RouteMatch",
+    "ToolSelector",
+    "intent_router",
+    "tool_selector",
+]
@@ -0,0 +1,157 @@
+"""Admission control for chat requests."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class AdmissionRejected(Exception):
+    """Raised when a chat request is not admitted."""
+
+    def __init__(self, status_code: int, detail: str, retry_after: int) -> None:
+        """Initialize the error."""
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+@dataclass
+class _ConversationSlot:
+    """Serializes the requests of one conversation."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    pending: int = 0
+
+
+class Admission:
+    """An admitted request. Call ``release`` when it is done (idempotent)."""
+
+    def __init__(self, controller: "AdmissionController", conversation_id: str) -> None:
+        """Initialize the admission."""
+        self._controller = controller
+        self._conversation_id = conversation_id
+        self._released = False
+
+    def release(self) -> None:
+        """Give back the global slot and the conversation's turn."""
+        if self._released:
+            return
+        self._released = True
+        self._controller._release(self._conversation_id)
+
+
+class AdmissionController:
+    """Limits how many agent loops run at once.
+
+    At most ``max_concurrency`` requests run; up to ``max_queue`` more wait
+    for a slot, for at most ``queue_timeout`` seconds. Requests on the same
+    conversation run one at a time, so they never interleave writes into
+    its memory, and at most ``max_pending_per_conversation`` of them may be
+    running or waiting. Limits are per worker process, including the one
+    turn at a time rule: with the database conversation store and several
+    workers, two turns of a conversation can run at once on different
+    workers. The store's version check then makes the later save append
+    its turn to the other's state (see ``save_conversation``) rather than
+    overwrite it; the two turns still do not see each other's messages.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+        max_pending_per_conversation: int,
+        retry_after: int,
+    ) -> None:
+        """Initialize the controller."""
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_pending_per_conversation = max_pending_per_conversation
+        self.retry_after = retry_after
+        self.active = 0
+        self.waiting = 0
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._conversations: dict[str, _ConversationSlot] = {}
+
+    async def acquire(self, conversation_id: str) -> Admission:
+        """Wait for the conversation's turn and a global slot.
+
+        Raises AdmissionRejected (429 if the conversation already has too
+        many requests pending, 503 if the queue is full or the wait timed out).
+        """
+        deadline = time.monotonic() + self.queue_timeout
+
+        slot = self._conversations.setdefault(conversation_id, _ConversationSlot())
+        if slot.pending >= self.max_pending_per_conversation:
+            raise AdmissionRejected(
+                429,
+                "Too many requests in progress for this conversation",
+                self.retry_after,
+            )
+        slot.pending += 1
+
+        try:
+            await self._wait(slot.lock.acquire(), deadline)
+            try:
+                await self._acquire_slot(deadline)
+            except BaseException:
+                slot.lock.release()
+                raise
+        except BaseException:
+            self._leave(conversation_id, slot)
+            raise
+
+        self.active += 1
+        return Admission(self, conversation_id)
+
+    async def _acquire_slot(self, deadline: float) -> None:
+        """Take a global slot, queueing if none is free."""
+        if self._slots.locked() and self.waiting >= self.max_queue:
+            raise AdmissionRejected(503, "Server is busy", self.retry_after)
+
+        self.waiting += 1
+        try:
+            await self._wait(self._slots.acquire(), deadline)
+        finally:
+            self.waiting -= 1
+
+    async def _wait(self, acquire: Awaitable[bool], deadline: float) -> None:
+        """Await ``acquire`` until the deadline."""
+        try:
+            await asyncio.wait_for(acquire, timeout=max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            logger.warning(f"Chat request timed out in the admission queue ({self.waiting} waiting)")
+            raise AdmissionRejected(503, "Server is busy", self.retry_after) from None
+
+    def _release(self, conversation_id: str) -> None:
+        """Release an admitted request."""
+        self.active -= 1
+        self._slots.release()
+        slot = self._conversations[conversation_id]
+        slot.lock.release()
+        self._leave(conversation_id, slot)
+
+    def _leave(self, conversation_id: str, slot: _ConversationSlot) -> None:
+        """Drop a request from its conversation's pending count."""
+        slot.pending -= 1
+        if slot.pending == 0:
+            del self._conversations[conversation_id]
+
+
+# Global admission controller for the chat endpoints
+admission_controller = AdmissionController(
+    max_concurrency=settings.chat_max_concurrency,
+    max_queue=settings.chat_max_queue,
+    queue_timeout=settings.chat_queue_timeout_seconds,
+    max_pending_per_conversation=settings.chat_max_pending_per_conversation,
+    retry_after=settings.chat_retry_after_seconds,
+)
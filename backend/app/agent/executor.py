@@ -1,15 +1,104 @@
 """Agent executor for running the tool-using agent."""
 
+import asyncio
+import datetime
 import logging
+import time
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from typing import Any
 
 from app.agent.memory import ConversationMemory
-from app.agent.prompts.system import BUDGET_SYSTEM_PROMPT
+from app.agent.prompts.system import (
+    CURRENT_TIME_PROMPT,
+    GUIDED_TOOL_CALL_PROMPT,
+    build_system_prompt,
+)
+from app.agent.router import IntentRouter, RouteMatch, intent_router
+from app.agent.scheduler import ToolCallScheduler
+from app.agent.tool_selection import ToolSelector, tool_selector
+from app.agent.tokens import get_token_counter
+from app.config import get_settings
 from app.llm.client import VLLMClient, vllm_client
-from app.llm.parser import ParsedResponse, parse_response
-from app.tools.registry import ToolRegistry, tool_registry
+from app.llm.parser import ParsedResponse, StreamAccumulator, ToolCall, parse_response
+from app.monitoring.metrics import agent_iterations, agent_run_seconds, llm_invalid_tool_calls
+from app.monitoring.tracing import tracer
+from app.tools.registry import ToolRegistry, canonical_json, tool_registry
+from app.tools.validation import ArgumentError, format_argument_errors
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+WEEKDAYS = "월화수목금토일"
+
+NO_RESPONSE_MESSAGE = "응답을 생성할 수 없습니다."
+MAX_ITERATIONS_MESSAGE = "처리 중 최대 반복 횟수에 도달했습니다. 다시 시도해주세요."
+
+
+@dataclass
+class AgentEvent:
+    """Event emitted while streaming an agent run.
+
+    Types are ``token`` (content delta), ``tool_start``, ``tool_result``
+    and ``done`` (final answer).
+    """
+
+    type: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+# Marks the end of the LLM stream in the queue of _interleave_calls
+_STREAM_END = object()
+
+
+async def _interleave_calls(
+    chunks: AsyncGenerator[dict[str, Any], None],
+    next_call: Callable[[], asyncio.Task[str] | None],
+) -> AsyncIterator[dict[str, Any] | None]:
+    """Yield the chunks of an LLM stream, and None whenever ``next_call()`` finishes first.
+
+    The stream is read by a task of its own through a queue, so that it
+    keeps one context (its tracing span) while the caller also waits for
+    the tool call whose result is due next.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+
+    async def read() -> None:
+        try:
+            async with aclosing(chunks):
+                async for chunk in chunks:
+                    queue.put_nowait(chunk)
+        except Exception as e:
+            queue.put_nowait(e)
+        queue.put_nowait(_STREAM_END)
+
+    reader = asyncio.create_task(read())
+    get: asyncio.Future[Any] | None = None
+    try:
+        while True:
+            call = next_call()
+            if call is not None and call.done():
+                yield None
+                continue
+            if call is not None:
+                get = get or asyncio.ensure_future(queue.get())
+                await asyncio.wait((get, call), return_when=asyncio.FIRST_COMPLETED)
+                if not get.done():
+                    yield None
+                    continue
+            item = await get if get is not None else await queue.get()
+            get = None
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        reader.cancel()
+        if get is not None:
+            get.cancel()
 
 
 class AgentExecutor:
@@ -21,55 +110,350 @@ class AgentExecutor:
         tools: ToolRegistry | None = None,
         system_prompt: str | None = None,
         max_iterations: int = 10,
+        max_tool_concurrency: int | None = None,
+        conversation_id: str | None = None,
+        router: IntentRouter | None = None,
+        selector: ToolSelector | None = None,
     ) -> None:
-        """Initialize the executor."""
+        """Initialize the executor.
+
+        ``router`` answers simple lookups without the LLM; by default the
+        global intent router is used if ``intent_router_enabled`` is set.
+        ``selector`` picks the tools each message needs (default: the
+        global selector if ``tool_selection_enabled`` is set); the
+        conversation keeps being offered every tool it was offered before.
+        Unless a ``system_prompt`` is given, the system prompt is generated
+        from the registry and lists just the offered tools.
+        """
         self.llm_client = llm_client or vllm_client
         self.tools = tools or tool_registry
-        self.system_prompt = system_prompt or BUDGET_SYSTEM_PROMPT
+        self.fixed_system_prompt = system_prompt is not None
+        self.system_prompt = system_prompt or build_system_prompt(self.tools.get_all())
         self.max_iterations = max_iterations
-        self.memory = ConversationMemory(system_prompt=self.system_prompt)
+        self.conversation_id = conversation_id
+        self.router = router or (intent_router if settings.intent_router_enabled else None)
+        self.selector = selector or (tool_selector if settings.tool_selection_enabled else None)
+        self.max_tool_concurrency = (
+            max_tool_concurrency or settings.agent_max_tool_concurrency
+        )
+        self.memory = ConversationMemory(
+            system_prompt=self.system_prompt,
+            max_tokens=settings.context_max_tokens,
+            token_counter=get_token_counter(settings.context_tokenizer, settings.vllm_model),
+            summarize=settings.context_summary_enabled,
+        )
 
     async def run(self, user_input: str) -> str:
         """Run the agent with user input."""
+        with tracer.span("agent.run", **{"conversation.id": self.conversation_id or ""}):
+            return await self._run(user_input)
+
+    async def _run(self, user_input: str) -> str:
+        """Run the agent loop, returning the final answer."""
         self.memory.add_user_message(user_input)
+        started_at = time.perf_counter()
+
+        routed = await self._route(user_input)
+        if routed is not None:
+            _, answer = routed
+            self.memory.add_assistant_message(content=answer)
+            self._record_run("routed", started_at, 0)
+            return answer
 
+        tools_json = self._select_tools(user_input)
         for iteration in range(self.max_iterations):
             logger.info(f"Agent iteration {iteration + 1}")
 
-            # Get LLM response
-            response = await self.llm_client.chat_completion(
-                messages=self.memory.get_messages(),
-                tools=self.tools.get_openai_tools(),
-            )
+            with tracer.span("agent.iteration", iteration=iteration + 1):
+                # Get LLM response
+                response = await self.llm_client.chat_completion(
+                    messages=self._prompt_messages(),
+                    tools_json=tools_json,
+                    conversation_id=self.conversation_id,
+                )
+
+                parsed = parse_response(response)
+                await self._guide_invalid_calls(parsed.tool_calls)
+                logger.info(f"Parsed response: content={parsed.content}, tool_calls={len(parsed.tool_calls)}")
+
+                # No tool calls - return the response
+                if not parsed.tool_calls:
+                    self.memory.add_assistant_message(content=parsed.content)
+                    self._record_run("complete", started_at, iteration + 1)
+                    return parsed.content or NO_RESPONSE_MESSAGE
+
+                # Process tool calls
+                tool_calls_for_memory = self._format_tool_calls(parsed)
+                self.memory.add_assistant_message(
+                    content=parsed.content,
+                    tool_calls=tool_calls_for_memory,
+                )
+
+                # Execute the tools and add results in call order
+                scheduler = self._new_scheduler()
+                for tc in parsed.tool_calls:
+                    scheduler.submit(tc)
+                try:
+                    results = await scheduler.results()
+                finally:
+                    scheduler.cancel()
 
-            parsed = parse_response(response)
-            logger.info(f"Parsed response: content={parsed.content}, tool_calls={len(parsed.tool_calls)}")
+                for tc, result in zip(parsed.tool_calls, results):
+                    self.memory.add_tool_result(
+                        tool_call_id=tc.id,
+                        name=tc.name,
+                        content=result,
+                    )
+
+        # Max iterations reached
+        self._record_run("complete", started_at, self.max_iterations)
+        return MAX_ITERATIONS_MESSAGE
 
-            # No tool calls - return the response
-            if not parsed.tool_calls:
-                self.memory.add_assistant_message(content=parsed.content)
-                return parsed.content or "응답을 생성할 수 없습니다."
+    async def run_stream(self, user_input: str) -> AsyncIterator[AgentEvent]:
+        """Run the agent with user input, yielding events as they happen.
+
+        Tool calls are scheduled as soon as their arguments are complete in
+        the stream, while the rest of the response is still being generated,
+        and each result is sent as soon as it and every earlier call are done.
+        """
+        with tracer.span("agent.run", **{"conversation.id": self.conversation_id or ""}):
+            async for event in self._run_stream(user_input):
+                yield event
+
+    async def _run_stream(self, user_input: str) -> AsyncIterator[AgentEvent]:
+        """Run the agent loop, streaming its events."""
+        self.memory.add_user_message(user_input)
+        started_at = time.perf_counter()
 
-            # Process tool calls
-            tool_calls_for_memory = self._format_tool_calls(parsed)
-            self.memory.add_assistant_message(
-                content=parsed.content,
-                tool_calls=tool_calls_for_memory,
+        routed = await self._route(user_input)
+        if routed is not None:
+            match, answer = routed
+            call_id = f"route_{uuid.uuid4().hex[:12]}"
+            yield AgentEvent(
+                "tool_start",
+                {"id": call_id, "name": match.tool, "arguments": match.arguments},
             )
+            yield AgentEvent(
+                "tool_result",
+                {"id": call_id, "name": match.tool, "content": answer},
+            )
+            self.memory.add_assistant_message(content=answer)
+            self._record_run("routed", started_at, 0)
+            yield AgentEvent("done", {"content": answer})
+            return
 
-            # Execute each tool and add results
-            for tc in parsed.tool_calls:
-                logger.info(f"Executing tool: {tc.name} with args: {tc.arguments}")
-                result = await self.tools.execute(tc.name, **tc.arguments)
-                logger.info(f"Tool result: {result}")
-                self.memory.add_tool_result(
-                    tool_call_id=tc.id,
-                    name=tc.name,
-                    content=result,
-                )
+        tools_json = self._select_tools(user_input)
+        for iteration in range(self.max_iterations):
+            logger.info(f"Agent iteration {iteration + 1} (streaming)")
+
+            with tracer.span("agent.iteration", iteration=iteration + 1):
+                accumulator = StreamAccumulator()
+                scheduler = self._new_scheduler()
+                pending: list[tuple[ToolCall, asyncio.Task[str]]] = []
+                # Calls held back until the stream ends, from the first one
+                # whose arguments are to be regenerated, to keep call order
+                deferred: list[ToolCall] = []
+                # Number of pending calls whose results were sent
+                sent = 0
+
+                def start(tc: ToolCall) -> AgentEvent:
+                    pending.append((tc, scheduler.submit(tc)))
+                    return AgentEvent(
+                        "tool_start",
+                        {"id": tc.id, "name": tc.name, "arguments": tc.arguments},
+                    )
+
+                def next_call() -> asyncio.Task[str] | None:
+                    return pending[sent][1] if sent < len(pending) else None
+
+                def finished() -> Iterator[AgentEvent]:
+                    """Results of the calls finished so far, in call order."""
+                    nonlocal sent
+                    while sent < len(pending) and pending[sent][1].done():
+                        tc, task = pending[sent]
+                        sent += 1
+                        yield AgentEvent(
+                            "tool_result",
+                            {"id": tc.id, "name": tc.name, "content": task.result()},
+                        )
+
+                try:
+                    stream = self.llm_client.chat_completion_stream(
+                        messages=self._prompt_messages(),
+                        tools_json=tools_json,
+                        conversation_id=self.conversation_id,
+                    )
+                    async for chunk in _interleave_calls(stream, next_call):
+                        if chunk is None:
+                            for event in finished():
+                                yield event
+                            continue
+                        token, completed = accumulator.feed(chunk)
+                        if token:
+                            yield AgentEvent("token", {"content": token})
+                        for tc in completed:
+                            if self._should_defer(tc, deferred):
+                                deferred.append(tc)
+                            else:
+                                yield start(tc)
+
+                    for tc in accumulator.finish():
+                        if self._should_defer(tc, deferred):
+                            deferred.append(tc)
+                        else:
+                            yield start(tc)
+
+                    # Only once the stream is done, so it never sits idle
+                    await self._guide_invalid_calls(deferred)
+                    for tc in deferred:
+                        yield start(tc)
+
+                    parsed = accumulator.to_response()
+                    logger.info(f"Parsed response: content={parsed.content}, tool_calls={len(parsed.tool_calls)}")
+
+                    # No tool calls - return the response
+                    if not parsed.tool_calls:
+                        self.memory.add_assistant_message(content=parsed.content)
+                        self._record_run("stream", started_at, iteration + 1)
+                        yield AgentEvent("done", {"content": parsed.content or NO_RESPONSE_MESSAGE})
+                        return
+
+                    # Send the remaining results as each call finishes
+                    while (call := next_call()) is not None:
+                        await asyncio.wait((call,))
+                        for event in finished():
+                            yield event
+
+                    # Record the calls in the order they were started
+                    parsed.tool_calls = [tc for tc, _ in pending]
+                    self.memory.add_assistant_message(
+                        content=parsed.content,
+                        tool_calls=self._format_tool_calls(parsed),
+                    )
+                    for tc, task in pending:
+                        self.memory.add_tool_result(
+                            tool_call_id=tc.id,
+                            name=tc.name,
+                            content=task.result(),
+                        )
+                finally:
+                    # Client went away mid-stream: don't leave tools running
+                    scheduler.cancel()
 
         # Max iterations reached
-        return "처리 중 최대 반복 횟수에 도달했습니다. 다시 시도해주세요."
+        self._record_run("stream", started_at, self.max_iterations)
+        yield AgentEvent("done", {"content": MAX_ITERATIONS_MESSAGE})
+
+    def _select_tools(self, user_input: str) -> bytes:
+        """Pick the tools offered for a message, and list them in the system prompt.
+
+        The selected tools are added to those offered earlier in the
+        conversation rather than replacing them, so the prompt prefix ahead
+        of the history stays cacheable across changes of topic. A message
+        that matches no tool (a greeting, "그렇게 해줘") keeps the tools
+        already offered; only a conversation with none yet gets all of
+        them, for this request alone.
+        Returns the JSON of the tool schemas to send.
+        """
+        names = None
+        if self.selector is not None:
+            selected = self.selector.select(user_input)
+            if selected is not None:
+                names = self.memory.offer_tools(selected)
+            elif self.memory.offered_tools:
+                names = self.memory.offered_tools
+        if not self.fixed_system_prompt:
+            tools = self.tools.get_all()
+            if names is not None:
+                wanted = set(names)
+                tools = [tool for tool in tools if tool.name in wanted]
+            self.memory.system_prompt = build_system_prompt(tools)
+        return self.tools.get_openai_tools_json(names)
+
+    def _prompt_messages(self) -> list[dict[str, Any]]:
+        """Get the messages of the next LLM request.
+
+        The current time goes in a system message after the history rather
+        than in the system prompt, so the prompt prefix stays cacheable.
+        """
+        now = datetime.datetime.now()
+        time_message = {
+            "role": "system",
+            "content": CURRENT_TIME_PROMPT.format(
+                now=now.strftime("%Y-%m-%d %H:%M"),
+                weekday=WEEKDAYS[now.weekday()],
+            ),
+        }
+        return [*self.memory.get_messages(), time_message]
+
+    async def _route(self, user_input: str) -> tuple[RouteMatch, str] | None:
+        """Answer a simple lookup directly with the intent router, if enabled."""
+        if self.router is None:
+            return None
+        with tracer.span("agent.route"):
+            return await self.router.route(user_input)
+
+    def _record_run(self, mode: str, started_at: float, iterations: int) -> None:
+        """Record the latency and LLM round trips of an answered message."""
+        agent_run_seconds.observe(time.perf_counter() - started_at, mode=mode)
+        agent_iterations.observe(iterations)
+
+    def _should_defer(self, tc: ToolCall, deferred: list[ToolCall]) -> bool:
+        """Whether a streamed call must wait for arguments to be regenerated."""
+        if not self.llm_client.guided_tool_calls:
+            return False
+        return bool(deferred) or tc.invalid_arguments is not None
+
+    async def _guide_invalid_calls(self, tool_calls: list[ToolCall]) -> None:
+        """Regenerate unparsable tool call arguments with guided decoding.
+
+        Only in the client's ``guided_tool_calls`` mode. Calls that still
+        have no valid arguments are reported back to the model as errors.
+        """
+        if not self.llm_client.guided_tool_calls:
+            return
+        for tc in tool_calls:
+            if tc.invalid_arguments is None:
+                continue
+            schema = self.tools.get_arguments_schema(tc.name)
+            if schema is None:
+                continue
+            messages = [
+                *self._prompt_messages(),
+                {"role": "system", "content": GUIDED_TOOL_CALL_PROMPT.format(name=tc.name)},
+            ]
+            try:
+                arguments = await self.llm_client.generate_tool_arguments(
+                    messages, schema, conversation_id=self.conversation_id
+                )
+            except Exception as e:
+                logger.warning(f"Guided arguments for tool call '{tc.name}' failed: {e!r}")
+                continue
+            if arguments is not None:
+                logger.info(f"Regenerated arguments of tool call '{tc.name}': {arguments}")
+                llm_invalid_tool_calls.inc(outcome="guided")
+                tc.arguments, tc.invalid_arguments = arguments, None
+
+    async def _execute_tool(self, tc: ToolCall) -> str:
+        """Execute a single tool call."""
+        if tc.invalid_arguments is not None:
+            llm_invalid_tool_calls.inc(outcome="failed")
+            return format_argument_errors(
+                tc.name,
+                [ArgumentError("arguments", "not a valid JSON object", tc.invalid_arguments)],
+            )
+        logger.info(f"Executing tool: {tc.name} with args: {tc.arguments}")
+        result = await self.tools.execute(tc.name, **tc.arguments)
+        logger.info(f"Tool result: {result}")
+        return result
+
+    def _new_scheduler(self) -> ToolCallScheduler:
+        """Create a scheduler for the tool calls of one assistant turn."""
+        return ToolCallScheduler(
+            tools=self.tools,
+            execute=self._execute_tool,
+            max_concurrency=self.max_tool_concurrency,
+        )
 
     def _format_tool_calls(self, parsed: ParsedResponse) -> list[dict[str, Any]]:
         """Format tool calls for memory storage."""
@@ -79,7 +463,7 @@ class AgentExecutor:
                 "type": "function",
                 "function": {
                     "name": tc.name,
-                    "arguments": str(tc.arguments),
+                    "arguments": canonical_json(tc.arguments),
                 },
             }
             for tc in parsed.tool_calls
@@ -1,21 +1,38 @@
 """Conversation memory management."""
 
-from dataclasses import dataclass, field
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
 from typing import Any
 
+from app.agent.tokens import TokenCounter, estimate_tokens
+
+# Chat template tokens around each message (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+SUMMARY_HEADER = "이전 대화 요약:"
+
 
 @dataclass
 class Message:
-    """Chat message."""
+    """Chat message.
+
+    Messages are not modified once added to a conversation, so their API
+    dictionary is built once; callers must not mutate it.
+    """
 
     role: str
     content: str | None
     tool_calls: list[dict[str, Any]] | None = None
     tool_call_id: str | None = None
     name: str | None = None
+    _tokens: int | None = field(default=None, repr=False, compare=False)
+    _dict: dict[str, Any] | None = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for API calls."""
+        """Convert to dictionary for API calls (cached)."""
+        if self._dict is not None:
+            return self._dict
+
         msg: dict[str, Any] = {"role": self.role}
 
         if self.content is not None:
@@ -30,16 +47,53 @@ class Message:
         if self.name:
             msg["name"] = self.name
 
+        self._dict = msg
         return msg
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Message":
+        """Create a message from its dictionary form."""
+        return cls(
+            role=data["role"],
+            content=data.get("content"),
+            tool_calls=data.get("tool_calls"),
+            tool_call_id=data.get("tool_call_id"),
+            name=data.get("name"),
+        )
+
+    def count_tokens(self, counter: TokenCounter) -> int:
+        """Get the (cached) prompt token count of this message."""
+        if self._tokens is None:
+            text = self.content or ""
+            if self.tool_calls:
+                text += json.dumps(self.tool_calls, ensure_ascii=False)
+            self._tokens = counter(text) + MESSAGE_OVERHEAD_TOKENS
+        return self._tokens
+
 
 @dataclass
 class ConversationMemory:
-    """Manages conversation history."""
+    """Manages conversation history.
+
+    History is trimmed by whole turns (a user message and everything after it
+    up to the next user message), so an assistant ``tool_calls`` message is
+    never separated from its tool results. Trimming keeps the history within
+    ``max_messages`` and, if set, ``max_tokens``; the latest turn is always
+    kept. With ``summarize`` enabled, dropped turns are folded into a short
+    summary that is sent after the system prompt.
+    """
 
     system_prompt: str
     messages: list[Message] = field(default_factory=list)
     max_messages: int = 50
+    max_tokens: int | None = None
+    token_counter: TokenCounter = estimate_tokens
+    summarize: bool = False
+    summary_max_tokens: int = 512
+    summary: list[str] = field(default_factory=list)
+    # Tools offered so far; only grows, so the prompt prefix changes rarely
+    offered_tools: list[str] = field(default_factory=list)
+    _prefix: list[dict[str, Any]] = field(default_factory=list, repr=False, compare=False)
 
     def add_user_message(self, content: str) -> None:
         """Add a user message."""
@@ -74,18 +128,134 @@ class ConversationMemory:
         )
         self._trim_if_needed()
 
+    def offer_tools(self, names: Iterable[str]) -> list[str]:
+        """Add tools to the ones offered in this conversation, and get them all.
+
+        The system prompt and tool list go ahead of the history, so they
+        only change when a message needs a tool not offered before, instead
+        of on every change of topic.
+        """
+        for name in names:
+            if name not in self.offered_tools:
+                self.offered_tools.append(name)
+        return self.offered_tools
+
     def get_messages(self) -> list[dict[str, Any]]:
-        """Get all messages for API call."""
-        result = [{"role": "system", "content": self.system_prompt}]
+        """Get all messages for API call.
+
+        The order is fixed (system prompt, summary, history) and the message
+        dictionaries are reused between calls, so consecutive requests share
+        a byte-identical prefix. Callers must not mutate the dictionaries.
+        """
+        result = list(self._get_prefix())
         result.extend(msg.to_dict() for msg in self.messages)
         return result
 
+    def _get_prefix(self) -> list[dict[str, Any]]:
+        """Get the system prompt and summary messages, rebuilt when they change."""
+        contents = [self.system_prompt]
+        if self.summary:
+            contents.append(self._summary_text())
+        if [msg["content"] for msg in self._prefix] != contents:
+            self._prefix = [{"role": "system", "content": content} for content in contents]
+        return self._prefix
+
+    def count_tokens(self) -> int:
+        """Get the prompt token count of the history (excluding system prompt)."""
+        total = sum(msg.count_tokens(self.token_counter) for msg in self.messages)
+        if self.summary:
+            total += self.token_counter(self._summary_text()) + MESSAGE_OVERHEAD_TOKENS
+        return total
+
+    def to_state(self) -> dict[str, Any]:
+        """Get the JSON-serializable conversation state (without system prompt)."""
+        return {
+            "messages": [msg.to_dict() for msg in self.messages],
+            "summary": list(self.summary),
+            "offered_tools": list(self.offered_tools),
+        }
+
+    def load_state(self, state: dict[str, Any]) -> None:
+        """Restore messages from a state produced by ``to_state``."""
+        self.messages = [Message.from_dict(msg) for msg in state.get("messages", [])]
+        self.summary = list(state.get("summary", []))
+        self.offered_tools = list(state.get("offered_tools", []))
+        self._trim_if_needed()
+
+    def rebase_state(self, base: dict[str, Any] | None) -> dict[str, Any]:
+        """Get ``base`` with this memory's latest turn appended.
+
+        Used when another request saved the conversation while this turn
+        ran: both turns are kept, instead of the later save dropping the
+        other one.
+        """
+        merged = replace(self, messages=[], summary=[], offered_tools=[], _prefix=[])
+        if base is not None:
+            merged.load_state(base)
+        merged.offer_tools(self.offered_tools)
+        merged.messages.extend(self.messages[self._turn_starts()[-1] :])
+        merged._trim_if_needed()
+        return merged.to_state()
+
     def clear(self) -> None:
         """Clear all messages except system prompt."""
         self.messages = []
+        self.summary = []
+        self.offered_tools = []
 
-    def _trim_if_needed(self) -> None:
-        """Trim old messages if exceeding max."""
+    def _turn_starts(self) -> list[int]:
+        """Indexes of the messages that start a turn."""
+        starts = [i for i, msg in enumerate(self.messages) if msg.role == "user"]
+        if not starts or starts[0] != 0:
+            starts.insert(0, 0)
+        return starts
+
+    def _over_budget(self) -> bool:
         if len(self.messages) > self.max_messages:
-            # Keep last max_messages
-            self.messages = self.messages[-self.max_messages :]
+            return True
+        return self.max_tokens is not None and self.count_tokens() > self.max_tokens
+
+    def _trim_if_needed(self) -> None:
+        """Drop the oldest whole turns while over the message or token budget."""
+        while self._over_budget():
+            starts = self._turn_starts()
+            if len(starts) < 2:
+                # Only the current turn is left
+                break
+            dropped = self.messages[: starts[1]]
+            self.messages = self.messages[starts[1] :]
+            if self.summarize:
+                self._add_to_summary(dropped)
+
+    def _add_to_summary(self, turn: list[Message]) -> None:
+        """Fold a dropped turn into the compact summary."""
+        question = next((m.content for m in turn if m.role == "user"), None)
+        answer = next(
+            (m.content for m in reversed(turn) if m.role == "assistant" and m.content),
+            None,
+        )
+        tools = sorted({m.name for m in turn if m.role == "tool" and m.name})
+        if question is None and answer is None:
+            return
+
+        line = f"- 사용자: {_shorten(question or '', 80)}"
+        if tools:
+            line += f" [도구: {', '.join(tools)}]"
+        if answer:
+            line += f" → {_shorten(answer, 120)}"
+        self.summary.append(line)
+
+        while (
+            len(self.summary) > 1
+            and self.token_counter(self._summary_text()) > self.summary_max_tokens
+        ):
+            self.summary.pop(0)
+
+    def _summary_text(self) -> str:
+        return "\n".join([SUMMARY_HEADER, *self.summary])
+
+
+def _shorten(text: str, limit: int) -> str:
+    """Collapse whitespace and cut text to at most ``limit`` characters."""
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
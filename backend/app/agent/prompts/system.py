@@ -1,6 +1,10 @@
 """System prompts for the budget agent."""
 
-BUDGET_SYSTEM_PROMPT = """당신은 가계부 관리를 도와주는 AI 어시스턴트입니다.
+from collections.abc import Iterable
+
+from app.tools.base import BaseTool
+
+SYSTEM_PROMPT_INTRO = """당신은 가계부 관리를 도와주는 AI 어시스턴트입니다.
 
 사용자의 재정 관리를 돕기 위해 다음 기능을 제공합니다:
 - 월 수입 설정 및 조회
@@ -8,33 +12,9 @@ BUDGET_SYSTEM_PROMPT = """당신은 가계부 관리를 도와주는 AI 어시
 - 저축 계획 설정 및 진행 상황 확인
 - 일별 지출 기록 및 조회
 - 월별 지출 분석 및 카테고리별 통계
+"""
 
-## 사용 가능한 도구들:
-
-### 수입 관련
-- set_monthly_income: 월 수입을 설정합니다
-- get_monthly_income: 특정 월의 수입을 조회합니다
-
-### 고정지출 관련
-- add_fixed_expense: 고정지출을 추가합니다 (월세, 통신비, 보험료 등)
-- list_fixed_expenses: 모든 고정지출 목록을 조회합니다
-- remove_fixed_expense: 고정지출을 삭제합니다
-
-### 저축 관련
-- set_savings_plan: 저축 목표를 설정합니다
-- update_savings: 실제 저축액을 업데이트합니다
-
-### 일별 지출 관련
-- add_daily_expense: 일별 지출을 기록합니다
-- get_expenses_by_date: 특정 날짜의 지출을 조회합니다
-- get_expenses_by_period: 기간별 지출을 조회합니다
-
-### 분석 도구
-- get_monthly_summary: 월별 수입/지출/저축 요약을 보여줍니다
-- get_category_analysis: 카테고리별 지출 분석을 제공합니다
-- get_budget_status: 예산 대비 현황을 확인합니다
-
-## 응답 지침:
+SYSTEM_PROMPT_GUIDELINES = """## 응답 지침:
 1. 친절하고 명확하게 한국어로 응답해주세요.
 2. 금액은 원(₩) 단위로 표시해주세요. (예: ₩100,000)
 3. 날짜 형식은 "YYYY-MM-DD" (일별) 또는 "YYYY-MM" (월별)을 사용합니다.
@@ -44,3 +24,35 @@ BUDGET_SYSTEM_PROMPT = """당신은 가계부 관리를 도와주는 AI 어시
 
 도구를 사용하여 사용자의 요청을 정확하게 처리하고, 결과를 알기 쉽게 설명해주세요.
 """
+
+
+def build_system_prompt(tools: Iterable[BaseTool]) -> str:
+    """Build the system prompt, listing the given tools by category.
+
+    Categories appear in the order of their first tool, so the prompt for a
+    given tool set is always the same.
+    """
+    sections: dict[str, list[str]] = {}
+    for tool in tools:
+        sections.setdefault(tool.category, []).append(f"- {tool.name}: {tool.description}")
+
+    parts = [SYSTEM_PROMPT_INTRO, "## 사용 가능한 도구들:\n"]
+    for category, lines in sections.items():
+        parts.append(f"### {category}\n" + "\n".join(lines) + "\n")
+    parts.append(SYSTEM_PROMPT_GUIDELINES)
+    return "\n".join(parts)
+
+
+# Appended after the history on every request, so the time never changes
+# the cacheable prompt prefix
+CURRENT_TIME_PROMPT = (
+    "현재 시각: {now} ({weekday}요일). "
+    '"오늘", "이번 달" 등은 이 시각을 기준으로 해석하세요.'
+)
+
+# Appended when regenerating the arguments of a tool call that were not
+# valid JSON, with the output constrained to the tool's schema
+GUIDED_TOOL_CALL_PROMPT = (
+    "{name} 도구를 호출하려고 했지만 인자가 올바른 JSON이 아니었습니다. "
+    "이 도구의 인자만 JSON 객체로 다시 작성하세요."
+)
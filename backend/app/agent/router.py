@@ -0,0 +1,296 @@
+"""Intent router for answering simple lookups without the LLM.
+
+Messages like "이번 달 예산 현황" or "오늘 지출" map one-to-one onto a
+read-only tool, yet the agent loop spends two LLM round trips on them
+(choosing the tool, then restating its output). The router scores each
+rule's keyword patterns, adds a small lexical similarity to the tool's own
+description (character bigrams, so no Korean tokenizer is needed),
+resolves the month or date the tool needs, and answers only when one tool
+wins clearly. Writes, advice and anything ambiguous go to the agent.
+"""
+
+import datetime
+import logging
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.config import get_settings
+from app.monitoring.metrics import intent_router_requests
+from app.tools.registry import ToolRegistry, is_error_result, tool_registry
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Messages that change data or ask for reasoning always go to the agent
+WRITE_CUES = re.compile(
+    r"썼|샀|냈|결제했|받았|기록해|기록 해|추가|등록|설정|저장|삭제|지워|빼줘|바꿔|변경|수정|업데이트"
+)
+ADVICE_CUES = re.compile(r"왜|어떻게|어때|추천|조언|줄이|줄일|아끼|아낄|비교|할까|하면|괜찮")
+
+# Weight of the description similarity relative to a keyword hit
+SIMILARITY_WEIGHT = 0.5
+
+THIS_MONTH = re.compile(r"이번\s*달|금월|this month")
+LAST_MONTH = re.compile(r"지난\s*달|저번\s*달|전월|last month")
+YEAR_MONTH = re.compile(r"(\d{4})\s*(?:-|\.|/|년)\s*(\d{1,2})(?!\d)(?!\s*(?:-|\.|/)\s*\d)")
+MONTH = re.compile(r"(?<!\d)(\d{1,2})\s*월(?!\s*\d{1,2}\s*일)")
+FULL_DATE = re.compile(r"(\d{4})\s*[-./]\s*(\d{1,2})\s*[-./]\s*(\d{1,2})")
+MONTH_DAY = re.compile(r"(?<!\d)(\d{1,2})\s*월\s*(\d{1,2})\s*일")
+RELATIVE_DAYS = {"오늘": 0, "어제": 1, "그제": 2, "그저께": 2}
+THIS_WEEK = re.compile(r"이번\s*주")
+LAST_WEEK = re.compile(r"지난\s*주|저번\s*주")
+RECENT_DAYS = re.compile(r"최근\s*(\d{1,2})\s*일")
+
+
+@dataclass
+class TimeRefs:
+    """The month, day and period a message refers to, if any."""
+
+    today: datetime.date
+    month: str | None = None
+    date: str | None = None
+    period: tuple[str, str] | None = None
+
+    @property
+    def month_or_current(self) -> str:
+        """The referenced month, the month of the referenced day, or this month."""
+        if self.month:
+            return self.month
+        if self.date:
+            return self.date[:7]
+        return self.today.strftime("%Y-%m")
+
+
+def _valid_date(year: int, month: int, day: int) -> datetime.date | None:
+    """Build a date, or None if it does not exist."""
+    try:
+        return datetime.date(year, month, day)
+    except ValueError:
+        return None
+
+
+def resolve_time(text: str, today: datetime.date) -> TimeRefs:
+    """Find the month, day and period referenced by a message."""
+    refs = TimeRefs(today=today)
+
+    # Days first, so "3월 5일" is not also read as a month
+    if match := FULL_DATE.search(text):
+        day = _valid_date(*(int(group) for group in match.groups()))
+    elif match := MONTH_DAY.search(text):
+        day = _valid_date(today.year, int(match.group(1)), int(match.group(2)))
+    else:
+        day = next(
+            (
+                today - datetime.timedelta(days=offset)
+                for word, offset in RELATIVE_DAYS.items()
+                if word in text
+            ),
+            None,
+        )
+    if day is not None:
+        refs.date = day.isoformat()
+
+    if THIS_MONTH.search(text):
+        refs.month = today.strftime("%Y-%m")
+    elif LAST_MONTH.search(text):
+        refs.month = (today.replace(day=1) - datetime.timedelta(days=1)).strftime("%Y-%m")
+    elif (match := YEAR_MONTH.search(text)) and 1 <= int(match.group(2)) <= 12:
+        refs.month = f"{int(match.group(1)):04d}-{int(match.group(2)):02d}"
+    elif (match := MONTH.search(text)) and 1 <= int(match.group(1)) <= 12:
+        refs.month = f"{today.year:04d}-{int(match.group(1)):02d}"
+
+    monday = today - datetime.timedelta(days=today.weekday())
+    if THIS_WEEK.search(text):
+        refs.period = (monday.isoformat(), today.isoformat())
+    elif LAST_WEEK.search(text):
+        start = monday - datetime.timedelta(days=7)
+        refs.period = (start.isoformat(), (monday - datetime.timedelta(days=1)).isoformat())
+    elif (match := RECENT_DAYS.search(text)) and int(match.group(1)) > 0:
+        start = today - datetime.timedelta(days=int(match.group(1)) - 1)
+        refs.period = (start.isoformat(), today.isoformat())
+
+    return refs
+
+
+@dataclass
+class IntentRule:
+    """Keyword patterns for one tool, and how to fill in its arguments.
+
+    ``arguments`` returns None when the message lacks something the tool
+    needs (e.g. a day for ``get_expenses_by_date``).
+    """
+
+    tool: str
+    patterns: list[tuple[re.Pattern[str], float]]
+    arguments: Callable[[TimeRefs], dict[str, Any] | None] = field(default=lambda refs: {})
+
+    def score(self, text: str) -> float:
+        """Sum the weights of the patterns found in the message."""
+        return sum(weight for pattern, weight in self.patterns if pattern.search(text))
+
+
+def _month_arguments(refs: TimeRefs) -> dict[str, Any]:
+    """Arguments of the per-month tools."""
+    return {"year_month": refs.month_or_current}
+
+
+SPENDING = re.compile(r"지출|쓴\s*돈|쓴\s*거|쓴\s*내역|사용\s*내역|내역")
+
+DEFAULT_RULES = [
+    IntentRule(
+        tool="get_budget_status",
+        patterns=[
+            (re.compile(r"예산"), 1.0),
+            (re.compile(r"현황|상태"), 0.6),
+            (re.compile(r"남은\s*(돈|금액|예산)|얼마\s*남"), 1.0),
+        ],
+        arguments=_month_arguments,
+    ),
+    IntentRule(
+        tool="get_monthly_summary",
+        patterns=[
+            (re.compile(r"요약|결산|정리"), 1.0),
+            (re.compile(r"월간|한\s*달"), 0.4),
+        ],
+        arguments=_month_arguments,
+    ),
+    IntentRule(
+        tool="get_category_analysis",
+        patterns=[
+            (re.compile(r"카테고리|항목별|분류별|분야별"), 1.0),
+            (re.compile(r"분석"), 0.6),
+        ],
+        arguments=_month_arguments,
+    ),
+    IntentRule(
+        tool="get_monthly_income",
+        patterns=[(re.compile(r"수입|월급|급여|소득"), 1.0)],
+        arguments=_month_arguments,
+    ),
+    IntentRule(
+        tool="list_fixed_expenses",
+        patterns=[(re.compile(r"고정\s*(지출|비)|정기\s*결제|구독"), 1.0)],
+    ),
+    IntentRule(
+        tool="get_expenses_by_date",
+        patterns=[
+            (SPENDING, 0.6),
+            (re.compile(r"오늘|어제|그제|그저께|\d+\s*월\s*\d+\s*일|\d{4}-\d{1,2}-\d{1,2}"), 0.5),
+        ],
+        arguments=lambda refs: {"date": refs.date} if refs.date else None,
+    ),
+    IntentRule(
+        tool="get_expenses_by_period",
+        patterns=[
+            (SPENDING, 0.6),
+            (re.compile(r"이번\s*주|지난\s*주|저번\s*주|최근\s*\d+\s*일"), 0.5),
+        ],
+        arguments=lambda refs: (
+            {"start_date": refs.period[0], "end_date": refs.period[1]} if refs.period else None
+        ),
+    ),
+]
+
+
+def char_bigrams(text: str) -> set[str]:
+    """Character bigrams of a text's letters and digits."""
+    chars = "".join(char for char in text.lower() if char.isalnum())
+    return {chars[i : i + 2] for i in range(len(chars) - 1)}
+
+
+@dataclass
+class RouteMatch:
+    """A tool call the router is confident answers a message."""
+
+    tool: str
+    arguments: dict[str, Any]
+    score: float
+
+
+class IntentRouter:
+    """Maps short lookup messages directly onto read-only tools."""
+
+    def __init__(
+        self,
+        tools: ToolRegistry | None = None,
+        rules: list[IntentRule] | None = None,
+        min_score: float = 1.0,
+        min_margin: float = 0.5,
+        max_chars: int = 40,
+    ) -> None:
+        """Initialize the router."""
+        self.tools = tools or tool_registry
+        self.rules = rules if rules is not None else DEFAULT_RULES
+        self.min_score = min_score
+        self.min_margin = min_margin
+        self.max_chars = max_chars
+        self._profiles: dict[str, set[str]] = {}
+
+    def match(self, text: str, today: datetime.date | None = None) -> RouteMatch | None:
+        """Find the tool call that answers a message, if one clearly does."""
+        text = text.strip()
+        if not text or len(text) > self.max_chars:
+            return None
+        if WRITE_CUES.search(text) or ADVICE_CUES.search(text):
+            return None
+
+        refs = resolve_time(text, today or datetime.date.today())
+        words = char_bigrams(text)
+        candidates: list[RouteMatch] = []
+        for rule in self.rules:
+            tool = self.tools.get(rule.tool)
+            if tool is None or not tool.read_only:
+                continue
+            score = rule.score(text)
+            if not score:
+                continue
+            arguments = rule.arguments(refs)
+            if arguments is None:
+                continue
+            score += SIMILARITY_WEIGHT * self._similarity(rule.tool, tool.description, words)
+            candidates.append(RouteMatch(rule.tool, arguments, score))
+
+        if not candidates:
+            return None
+        candidates.sort(key=lambda candidate: candidate.score, reverse=True)
+        best = candidates[0]
+        runner_up = candidates[1].score if len(candidates) > 1 else 0.0
+        if best.score < self.min_score or best.score - runner_up < self.min_margin:
+            return None
+        return best
+
+    async def route(self, text: str) -> tuple[RouteMatch, str] | None:
+        """Answer a message with a single tool call, or None to use the agent."""
+        match = self.match(text)
+        if match is None:
+            intent_router_requests.inc(result="miss", tool="none")
+            return None
+
+        result = await self.tools.execute(match.tool, **match.arguments)
+        if is_error_result(result):
+            logger.warning(f"Routed tool {match.tool} failed, falling back to the agent: {result}")
+            intent_router_requests.inc(result="error", tool=match.tool)
+            return None
+
+        logger.info(f"Routed to {match.tool}({match.arguments}) with score {match.score:.2f}")
+        intent_router_requests.inc(result="hit", tool=match.tool)
+        return match, result
+
+    def _similarity(self, name: str, description: str, words: set[str]) -> float:
+        """Share of the message's bigrams found in the tool description."""
+        profile = self._profiles.get(name)
+        if profile is None:
+            profile = self._profiles[name] = char_bigrams(description)
+        if not words:
+            return 0.0
+        return len(words & profile) / len(words)
+
+
+# Global router instance
+intent_router = IntentRouter(
+    min_score=settings.intent_router_min_score,
+    min_margin=settings.intent_router_min_margin,
+    max_chars=settings.intent_router_max_chars,
+)
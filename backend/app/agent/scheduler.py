@@ -0,0 +1,67 @@
+"""Scheduling of tool calls within a single assistant turn."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from app.llm.parser import ToolCall
+from app.tools.registry import ToolRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class ToolCallScheduler:
+    """Runs the tool calls of one assistant turn.
+
+    Read-only calls run concurrently, up to ``max_concurrency`` at a time.
+    A call with side effects waits for every earlier call, and later calls
+    wait for it, so writes keep their original order relative to everything
+    else in the turn. Results are returned in call order.
+    """
+
+    def __init__(
+        self,
+        tools: ToolRegistry,
+        execute: Callable[[ToolCall], Awaitable[str]],
+        max_concurrency: int = 4,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.tools = tools
+        self._execute = execute
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._tasks: list[asyncio.Task[str]] = []
+        self._last_write: asyncio.Task[str] | None = None
+
+    def submit(self, tc: ToolCall) -> asyncio.Task[str]:
+        """Schedule a tool call and return the task producing its result."""
+        tool = self.tools.get(tc.name)
+        # Unknown tools only produce an error message, so they are harmless
+        read_only = tool is None or tool.read_only
+
+        if read_only:
+            depends_on = [self._last_write] if self._last_write else []
+        else:
+            depends_on = list(self._tasks)
+
+        task = asyncio.create_task(self._run(tc, depends_on))
+        self._tasks.append(task)
+        if not read_only:
+            self._last_write = task
+        return task
+
+    async def results(self) -> list[str]:
+        """Wait for all scheduled calls and return their results in call order."""
+        return [await task for task in self._tasks]
+
+    def cancel(self) -> None:
+        """Cancel any calls that have not finished yet."""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+
+    async def _run(self, tc: ToolCall, depends_on: list[asyncio.Task[str]]) -> str:
+        """Run a tool call once the calls it depends on have finished."""
+        if depends_on:
+            await asyncio.wait(depends_on)
+        async with self._semaphore:
+            return await self._execute(tc)
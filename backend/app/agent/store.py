@@ -0,0 +1,226 @@
+"""Conversation state storage."""
+
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.config import get_settings
+from app.db.database import SessionLocal
+from app.models.conversation import ConversationRecord
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class ConversationConflict(Exception):
+    """Raised by ``save`` when the conversation was saved again since it was loaded."""
+
+
+@dataclass
+class StoredConversation:
+    """A conversation's state and the version it was saved at."""
+
+    state: dict[str, Any]
+    version: int
+
+
+class ConversationStore(ABC):
+    """Stores ConversationMemory state (see ``ConversationMemory.to_state``).
+
+    Saves are optimistic: each names the version its state was loaded at
+    and fails with ConversationConflict if another save came in between.
+    """
+
+    @abstractmethod
+    async def get(self, conversation_id: str) -> StoredConversation | None:
+        """Get the state of a conversation, or None if unknown or expired."""
+        pass
+
+    @abstractmethod
+    async def save(self, conversation_id: str, state: dict[str, Any], version: int = 0) -> int:
+        """Save the state of a conversation loaded at ``version`` (0: new).
+
+        Returns the new version. Raises ConversationConflict if the stored
+        version is no longer ``version``.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, conversation_id: str) -> bool:
+        """Delete a conversation. Returns whether it existed."""
+        pass
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Number of stored (unexpired) conversations."""
+        pass
+
+
+class InMemoryConversationStore(ConversationStore):
+    """Process-local LRU store with sliding TTL expiry.
+
+    Conversations are pinned to one process, so this only suits a single
+    uvicorn worker.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 86400) -> None:
+        """Initialize the store."""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, StoredConversation]] = OrderedDict()
+
+    async def get(self, conversation_id: str) -> StoredConversation | None:
+        entry = self._entries.get(conversation_id)
+        if entry is None:
+            return None
+
+        expires_at, stored = entry
+        if expires_at < time.monotonic():
+            del self._entries[conversation_id]
+            return None
+
+        self._entries[conversation_id] = (time.monotonic() + self.ttl_seconds, stored)
+        self._entries.move_to_end(conversation_id)
+        return stored
+
+    async def save(self, conversation_id: str, state: dict[str, Any], version: int = 0) -> int:
+        current = await self.get(conversation_id)
+        if (0 if current is None else current.version) != version:
+            raise ConversationConflict(conversation_id)
+        stored = StoredConversation(state, version + 1)
+        self._entries[conversation_id] = (time.monotonic() + self.ttl_seconds, stored)
+        self._entries.move_to_end(conversation_id)
+        self._evict()
+        return stored.version
+
+    async def delete(self, conversation_id: str) -> bool:
+        return self._entries.pop(conversation_id, None) is not None
+
+    async def count(self) -> int:
+        self._evict()
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        now = time.monotonic()
+        # Entries are in LRU order, so expired ones sit at the front
+        while self._entries:
+            oldest_id, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at >= now and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[oldest_id]
+
+
+class DatabaseConversationStore(ConversationStore):
+    """Store backed by the ``conversations`` table of the application database.
+
+    Every worker sees the same conversations, so this works with several
+    uvicorn workers behind one port. Saves update the row only if its
+    version is still the one that was loaded.
+    """
+
+    PURGE_EVERY = 100
+
+    def __init__(self, ttl_seconds: float = 86400) -> None:
+        """Initialize the store."""
+        self.ttl_seconds = ttl_seconds
+        self._saves = 0
+
+    def _cutoff(self) -> datetime:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return now - timedelta(seconds=self.ttl_seconds)
+
+    async def get(self, conversation_id: str) -> StoredConversation | None:
+        async with SessionLocal() as db:
+            record = await db.get(ConversationRecord, conversation_id)
+            if record is None or record.updated_at < self._cutoff():
+                return None
+            return StoredConversation(json.loads(record.state), record.version)
+
+    async def save(self, conversation_id: str, state: dict[str, Any], version: int = 0) -> int:
+        values = {
+            "state": json.dumps(state, ensure_ascii=False),
+            "updated_at": datetime.now(timezone.utc).replace(tzinfo=None),
+        }
+        async with SessionLocal() as db:
+            if version:
+                result = await db.execute(
+                    update(ConversationRecord)
+                    .where(
+                        ConversationRecord.id == conversation_id,
+                        ConversationRecord.version == version,
+                    )
+                    .values(version=ConversationRecord.version + 1, **values)
+                )
+                if result.rowcount == 0:
+                    raise ConversationConflict(conversation_id)
+            else:
+                # An expired row counts as no conversation
+                await db.execute(
+                    delete(ConversationRecord).where(
+                        ConversationRecord.id == conversation_id,
+                        ConversationRecord.updated_at < self._cutoff(),
+                    )
+                )
+                db.add(ConversationRecord(id=conversation_id, version=1, **values))
+                try:
+                    await db.flush()
+                except IntegrityError:
+                    raise ConversationConflict(conversation_id) from None
+            await db.commit()
+
+        self._saves += 1
+        if self._saves % self.PURGE_EVERY == 0:
+            await self.purge_expired()
+        return version + 1
+
+    async def delete(self, conversation_id: str) -> bool:
+        async with SessionLocal() as db:
+            result = await db.execute(
+                delete(ConversationRecord).where(ConversationRecord.id == conversation_id)
+            )
+            await db.commit()
+            return result.rowcount > 0
+
+    async def count(self) -> int:
+        async with SessionLocal() as db:
+            return await db.scalar(
+                select(func.count())
+                .select_from(ConversationRecord)
+                .where(ConversationRecord.updated_at >= self._cutoff())
+            )
+
+    async def purge_expired(self) -> int:
+        """Delete expired conversations. Returns how many were removed."""
+        async with SessionLocal() as db:
+            result = await db.execute(
+                delete(ConversationRecord).where(ConversationRecord.updated_at < self._cutoff())
+            )
+            await db.commit()
+        if result.rowcount:
+            logger.info(f"Purged {result.rowcount} expired conversations")
+        return result.rowcount
+
+
+def create_conversation_store() -> ConversationStore:
+    """Create the store selected by ``CONVERSATION_STORE``."""
+    if settings.conversation_store == "database":
+        return DatabaseConversationStore(ttl_seconds=settings.conversation_ttl_seconds)
+    if settings.conversation_store != "memory":
+        logger.warning(f"Unknown conversation store '{settings.conversation_store}', using memory")
+    return InMemoryConversationStore(
+        max_entries=settings.conversation_max_entries,
+        ttl_seconds=settings.conversation_ttl_seconds,
+    )
+
+
+# Global store instance
+conversation_store = create_conversation_store()
@@ -0,0 +1,48 @@
+"""Token counting for context window management."""
+
+import logging
+from collections.abc import Callable
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+TokenCounter = Callable[[str], int]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a tokenizer.
+
+    Hangul and CJK characters are counted as one token each (BPE vocabularies
+    rarely merge them), everything else at about four characters per token.
+    """
+    wide = sum(1 for char in text if ord(char) >= 0x1100)
+    return wide + (len(text) - wide + 3) // 4
+
+
+@lru_cache
+def get_token_counter(tokenizer: str, model: str) -> TokenCounter:
+    """Get a token counter.
+
+    ``tokenizer`` is ``"estimate"`` for the heuristic above, or ``"model"``
+    to load the Hugging Face tokenizer of ``model`` (needs the optional
+    ``transformers`` package; falls back to the estimate if unavailable).
+    """
+    if tokenizer != "model":
+        return estimate_tokens
+
+    try:
+        from transformers import AutoTokenizer
+    except ImportError:
+        logger.warning("transformers is not installed, estimating token counts")
+        return estimate_tokens
+
+    try:
+        hf_tokenizer = AutoTokenizer.from_pretrained(model)
+    except Exception as e:
+        logger.warning(f"Failed to load tokenizer for {model}, estimating token counts: {e}")
+        return estimate_tokens
+
+    def count(text: str) -> int:
+        return len(hf_tokenizer.encode(text, add_special_tokens=False))
+
+    return count
@@ -0,0 +1,86 @@
+"""Per-message tool selection.
+
+Sending every tool schema (and the system prompt section listing them)
+with every request costs prompt tokens and prefill time that grow with the
+tool catalog. The selector scores each tool category against the user
+message by tool keywords plus a character-bigram similarity to the tool
+descriptions, and offers only the matching categories plus the core
+tools. Whole categories are selected, so related tools stay together and
+the number of distinct tool sets (and prompt prefixes) stays small.
+The executor adds each selection to the tools already offered in the
+conversation, so a change of topic does not change the prompt prefix.
+When nothing matches, e.g. a follow-up like "그거 지워줘", the tools
+already offered are kept; a conversation with none yet gets all tools
+for that one request.
+"""
+
+import logging
+
+from app.agent.router import char_bigrams
+from app.config import get_settings
+from app.monitoring.metrics import agent_offered_tools
+from app.tools.base import BaseTool
+from app.tools.registry import ToolRegistry, tool_registry
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Weight of the description similarity relative to a keyword hit
+SIMILARITY_WEIGHT = 0.5
+
+
+def _compact(text: str) -> str:
+    """Lowercase a text and drop whitespace, so "이번 달" matches "이번달"."""
+    return "".join(text.lower().split())
+
+
+class ToolSelector:
+    """Picks the tools to offer the LLM for a user message."""
+
+    def __init__(self, tools: ToolRegistry | None = None, min_score: float = 0.5) -> None:
+        """Initialize the selector."""
+        self.tools = tools or tool_registry
+        self.min_score = min_score
+        self._profiles: dict[str, tuple[tuple[str, ...], set[str]]] = {}
+
+    def score(self, tool: BaseTool, text: str, words: set[str]) -> float:
+        """Score how likely a message needs a tool."""
+        keywords, profile = self._get_profile(tool)
+        score = float(sum(1 for keyword in keywords if keyword in text))
+        if words:
+            score += SIMILARITY_WEIGHT * len(words & profile) / len(words)
+        return score
+
+    def select(self, user_input: str) -> list[str] | None:
+        """Get the names of the tools to offer, or None for all of them."""
+        text = _compact(user_input)
+        words = char_bigrams(user_input)
+        all_tools = self.tools.get_all()
+
+        categories = {
+            tool.category
+            for tool in all_tools
+            if self.score(tool, text, words) >= self.min_score
+        }
+        if not categories:
+            agent_offered_tools.observe(len(all_tools))
+            return None
+
+        names = [tool.name for tool in all_tools if tool.core or tool.category in categories]
+        logger.info(f"Offering {len(names)}/{len(all_tools)} tools: {sorted(categories)}")
+        agent_offered_tools.observe(len(names))
+        return names
+
+    def _get_profile(self, tool: BaseTool) -> tuple[tuple[str, ...], set[str]]:
+        """Get the compacted keywords and description bigrams of a tool."""
+        profile = self._profiles.get(tool.name)
+        if profile is None:
+            profile = self._profiles[tool.name] = (
+                tuple(_compact(keyword) for keyword in tool.keywords),
+                char_bigrams(tool.description),
+            )
+        return profile
+
+
+# Global selector instance
+tool_selector = ToolSelector(min_score=settings.tool_selection_min_score)
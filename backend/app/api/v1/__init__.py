@@ -4,9 +4,15 @@ from fastapi import APIRouter
 
 from app.api.v1.chat import router as chat_router
 from app.api.v1.dashboard import router as dashboard_router
+from app.api.v1.debug import router as debug_router
+from app.api.v1.expenses import router as expenses_router
 from app.api.v1.health import router as health_router
+from app.api.v1.metrics import router as metrics_router
 
 router = APIRouter()
 router.include_router(chat_router, tags=["chat"])
 router.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"])
+router.include_router(expenses_router, prefix="/expenses", tags=["expenses"])
 router.include_router(health_router, tags=["health"])
+router.include_router(metrics_router, tags=["metrics"])
+router.include_router(debug_router, prefix="/debug", tags=["debug"])
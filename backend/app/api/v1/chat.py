@@ -1,30 +1,71 @@
 """Chat endpoint."""
 
+import json
 import logging
 import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
+from app.agent.admission import Admission, AdmissionRejected, admission_controller
 from app.agent.executor import AgentExecutor
+from app.agent.store import ConversationConflict, conversation_store
 from app.schemas.chat import ChatRequest, ChatResponse
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Store agent executors by conversation_id for session continuity
-_executors: dict[str, AgentExecutor] = {}
+# Saves retried after a concurrent save of the same conversation
+SAVE_ATTEMPTS = 3
 
 
-def get_executor(conversation_id: str | None) -> tuple[AgentExecutor, str]:
-    """Get or create an agent executor for the conversation."""
-    if conversation_id and conversation_id in _executors:
-        return _executors[conversation_id], conversation_id
+async def admit(conversation_id: str) -> Admission:
+    """Admit a chat request, or reject it with 429/503 and Retry-After."""
+    try:
+        return await admission_controller.acquire(conversation_id)
+    except AdmissionRejected as e:
+        logger.warning(f"Rejected chat request for {conversation_id}: {e.detail}")
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.detail,
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+
+async def get_executor(conversation_id: str) -> tuple[AgentExecutor, int]:
+    """Create an agent executor, rehydrating the conversation's memory if stored.
+
+    Also returns the stored version (0 for a new conversation) to save against.
+    """
+    executor = AgentExecutor(conversation_id=conversation_id)
+
+    stored = await conversation_store.get(conversation_id)
+    if stored is None:
+        return executor, 0
+    executor.memory.load_state(stored.state)
+    return executor, stored.version
+
+
+async def save_conversation(conversation_id: str, executor: AgentExecutor, version: int) -> None:
+    """Persist the executor's memory for the next request.
 
-    # Create new executor
-    new_id = conversation_id or str(uuid.uuid4())
-    executor = AgentExecutor()
-    _executors[new_id] = executor
-    return executor, new_id
+    If a request on another worker saved the conversation since it was
+    loaded at ``version``, this turn is appended to that state instead.
+    """
+    state = executor.memory.to_state()
+    for _ in range(SAVE_ATTEMPTS):
+        try:
+            await conversation_store.save(conversation_id, state, version)
+            return
+        except ConversationConflict:
+            logger.info(f"Conversation {conversation_id} was saved concurrently, merging")
+            stored = await conversation_store.get(conversation_id)
+            version = 0 if stored is None else stored.version
+            state = executor.memory.rebase_state(None if stored is None else stored.state)
+    logger.error(f"Could not save conversation {conversation_id}: too many concurrent saves")
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -32,9 +73,14 @@ async def chat(request: ChatRequest) -> ChatResponse:
     """Process a chat message."""
     logger.info(f"Received chat request: {request.content[:100]}...")
 
+    conversation_id = request.conversation_id or str(uuid.uuid4())
+    admission = await admit(conversation_id)
     try:
-        executor, conversation_id = get_executor(request.conversation_id)
-        response = await executor.run(request.content)
+        executor, version = await get_executor(conversation_id)
+        try:
+            response = await executor.run(request.content)
+        finally:
+            await save_conversation(conversation_id, executor, version)
 
         return ChatResponse(
             content=response,
@@ -46,13 +92,60 @@ async def chat(request: ChatRequest) -> ChatResponse:
             status_code=500,
             detail=f"Error processing message: {str(e)}",
         )
+    finally:
+        admission.release()
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    """Format a Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """Process a chat message, streaming agent events as Server-Sent Events."""
+    logger.info(f"Received streaming chat request: {request.content[:100]}...")
+
+    conversation_id = request.conversation_id or str(uuid.uuid4())
+    # Admit before the response starts, so a rejection is a proper 429/503
+    admission = await admit(conversation_id)
+    try:
+        executor, version = await get_executor(conversation_id)
+    except BaseException:
+        admission.release()
+        raise
+
+    async def event_stream() -> AsyncIterator[str]:
+        yield format_sse("start", {"conversation_id": conversation_id})
+        try:
+            async for event in executor.run_stream(request.content):
+                if event.type == "done":
+                    event.data["conversation_id"] = conversation_id
+                yield format_sse(event.type, event.data)
+        except Exception as e:
+            logger.error(f"Error processing streaming chat: {e}", exc_info=True)
+            yield format_sse("error", {"detail": f"Error processing message: {str(e)}"})
+        finally:
+            await save_conversation(conversation_id, executor, version)
+            admission.release()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Disable response buffering in the nginx proxy
+            "X-Accel-Buffering": "no",
+        },
+        # Also releases the admission if the stream never started
+        background=BackgroundTask(admission.release),
+    )
 
 
 @router.post("/chat/reset")
 async def reset_chat(conversation_id: str | None = None) -> dict[str, str]:
     """Reset a conversation."""
-    if conversation_id and conversation_id in _executors:
-        _executors[conversation_id].reset()
+    if conversation_id and await conversation_store.delete(conversation_id):
         return {"status": "reset", "conversation_id": conversation_id}
 
     return {"status": "no_conversation_found"}
@@ -1,11 +1,12 @@
 """Dashboard endpoint."""
 
+import time
 from datetime import datetime
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Request, Response
 
-from app.db.database import get_db
+from app.db.database import SessionLocal
+from app.monitoring.metrics import dashboard_seconds
 from app.schemas.budget import (
     BudgetStatus,
     CategoryAnalysis,
@@ -16,37 +17,78 @@ from app.schemas.budget import (
     SavingsData,
 )
 from app.services.budget_service import BudgetService
+from app.services.versioning import SingleFlight, read_version
 
 router = APIRouter()
 
+# Concurrent requests for the same month and data version share one load
+dashboard_flights = SingleFlight()
+
 
 def get_current_year_month() -> str:
     """Get current year-month string."""
     return datetime.now().strftime("%Y-%m")
 
 
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in tags
+
+
 @router.get("", response_model=DashboardResponse)
 async def get_dashboard(
+    request: Request,
+    response: Response,
     year_month: str | None = None,
-    db: Session = Depends(get_db),
-) -> DashboardResponse:
-    """Get dashboard data for a specific month."""
+) -> DashboardResponse | Response:
+    """Get dashboard data for a specific month.
+
+    Responses carry an ETag derived from the month's data version, as
+    stored in the database, so unchanged dashboards are answered with 304
+    after a single primary key lookup, whichever worker made the change.
+    """
+    started_at = time.perf_counter()
     if year_month is None:
         year_month = get_current_year_month()
 
-    budget_service = BudgetService(db)
+    async with SessionLocal() as db:
+        version = await read_version(db, year_month)
+    headers = {"ETag": f'W/"{year_month}.{version}"', "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        dashboard_seconds.observe(time.perf_counter() - started_at, status="304")
+        return Response(status_code=304, headers=headers)
+
+    dashboard = await dashboard_flights.do(
+        (year_month, version), lambda: load_dashboard(year_month)
+    )
+    response.headers.update(headers)
+    dashboard_seconds.observe(time.perf_counter() - started_at, status="200")
+    return dashboard
+
+
+async def load_dashboard(year_month: str) -> DashboardResponse:
+    """Load the dashboard of a month.
+
+    Uses its own session, since the load may outlive the request that
+    started it when other requests are waiting on it.
+    """
+    async with SessionLocal() as db:
+        snapshot = await BudgetService(db).get_dashboard_snapshot(year_month)
 
     # Get income data
-    income_record = budget_service.get_monthly_income(year_month)
     income_data = None
-    if income_record:
+    if snapshot.income_amount is not None:
         income_data = IncomeData(
-            amount=income_record.amount,
-            description=income_record.description,
+            amount=snapshot.income_amount,
+            description=snapshot.income_description,
         )
 
     # Get fixed expenses data
-    fixed_expenses_list = budget_service.list_fixed_expenses(active_only=True)
     fixed_expense_items = [
         FixedExpenseItem(
             id=expense.id,
@@ -54,35 +96,33 @@ async def get_dashboard(
             amount=expense.amount,
             category=expense.category,
         )
-        for expense in fixed_expenses_list
+        for expense in snapshot.fixed_expenses
     ]
-    fixed_expenses_total = budget_service.get_total_fixed_expenses()
     fixed_expenses_data = FixedExpensesData(
         items=fixed_expense_items,
-        total=fixed_expenses_total,
+        total=snapshot.total_fixed_expenses,
     )
 
     # Get savings data
-    savings_record = budget_service.get_savings_plan(year_month)
     savings_data = None
-    if savings_record:
+    if snapshot.savings_target is not None:
+        savings_target = snapshot.savings_target
+        savings_actual = snapshot.savings_actual or 0.0
         progress = 0.0
-        if savings_record.target_amount > 0:
-            progress = (savings_record.actual_amount / savings_record.target_amount) * 100
+        if savings_target > 0:
+            progress = (savings_actual / savings_target) * 100
         savings_data = SavingsData(
-            target=savings_record.target_amount,
-            actual=savings_record.actual_amount,
+            target=savings_target,
+            actual=savings_actual,
             progress_percentage=round(progress, 1),
         )
 
     # Get budget status
-    budget_status_dict = budget_service.get_budget_status(year_month)
-    budget_status = BudgetStatus(**budget_status_dict)
+    budget_status = BudgetStatus(**snapshot.budget_status())
 
     # Get category analysis
-    category_analysis_list = budget_service.get_category_analysis(year_month)
     category_analysis = [
-        CategoryAnalysis(**cat) for cat in category_analysis_list
+        CategoryAnalysis(**cat) for cat in snapshot.category_analysis()
     ]
 
     return DashboardResponse(
@@ -0,0 +1,41 @@
+"""Debug endpoints (only served when DEBUG is set)."""
+
+from typing import Any
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.config import get_settings
+from app.monitoring.tracing import tracer
+
+router = APIRouter()
+settings = get_settings()
+
+
+@router.get("/traces", response_model=None)
+async def get_slow_traces(
+    limit: int = 10,
+    format: str = "json",
+) -> list[dict[str, Any]] | PlainTextResponse:
+    """Show the span waterfalls of recent slow requests, slowest first.
+
+    Requests slower than TRACING_SLOW_MS are kept. ``format=text`` renders
+    the waterfalls as bars.
+    """
+    if not settings.debug:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    traces = sorted(tracer.slow_traces, key=lambda t: t.root.duration_ms, reverse=True)[:limit]
+
+    if format == "text":
+        return PlainTextResponse("\n\n".join(trace.render() for trace in traces) + "\n")
+
+    return [
+        {
+            "trace_id": trace.trace_id,
+            "name": trace.root.name,
+            "duration_ms": round(trace.root.duration_ms, 2),
+            "spans": trace.waterfall(),
+        }
+        for trace in traces
+    ]
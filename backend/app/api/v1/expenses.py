@@ -0,0 +1,61 @@
+"""Expense import endpoint."""
+
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_db
+from app.schemas.budget import BulkImportResponse, BulkImportRowError
+from app.services.budget_service import BudgetService
+from app.services.expense_import import (
+    ImportFormatError,
+    iter_csv_rows,
+    iter_json_array,
+    iter_validated_batches,
+)
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+
+
+@router.post("/bulk", response_model=BulkImportResponse)
+async def bulk_import_expenses(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> BulkImportResponse:
+    """Import daily expenses from a JSON array or CSV body in one transaction.
+
+    CSV uploads (``Content-Type: text/csv``) need a header row with
+    ``date,amount,category`` and optionally ``description``. The body is
+    parsed as it streams in; invalid rows are reported and skipped.
+    """
+    content_type = request.headers.get("content-type", "application/json")
+    if "csv" in content_type:
+        records = iter_csv_rows(request.stream())
+    elif "json" in content_type:
+        records = iter_json_array(request.stream())
+    else:
+        raise HTTPException(status_code=415, detail="Use application/json or text/csv")
+
+    budget_service = BudgetService(db)
+    inserted = 0
+    failed = 0
+    errors: list[BulkImportRowError] = []
+
+    try:
+        async for batch in iter_validated_batches(records, BATCH_SIZE):
+            inserted += await budget_service.insert_daily_expenses(batch.expenses)
+            failed += len(batch.errors)
+            errors.extend(batch.errors[: MAX_REPORTED_ERRORS - len(errors)])
+    except ImportFormatError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    await budget_service.commit()
+    logger.info(f"Bulk import: {inserted} inserted, {failed} failed")
+
+    return BulkImportResponse(inserted=inserted, failed=failed, errors=errors)
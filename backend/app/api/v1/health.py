@@ -2,6 +2,9 @@
 
 from fastapi import APIRouter
 
+from app.services.budget_service import budget_cache
+from app.tools.registry import tool_registry
+
 router = APIRouter()
 
 
@@ -9,3 +12,15 @@ router = APIRouter()
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@router.get("/health/cache")
+async def cache_stats() -> dict[str, int]:
+    """Budget analysis cache size and hit/miss counters."""
+    return budget_cache.stats()
+
+
+@router.get("/health/tool-cache")
+async def tool_cache_stats() -> dict[str, int]:
+    """Tool result cache size and hit/miss counters (empty if disabled)."""
+    return tool_registry.cache.stats() if tool_registry.cache is not None else {}
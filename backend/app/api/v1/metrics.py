@@ -0,0 +1,30 @@
+"""Metrics endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.agent.admission import admission_controller
+from app.agent.store import conversation_store
+from app.monitoring.metrics import (
+    active_conversations,
+    budget_cache_requests,
+    chat_requests_active,
+    metrics_registry,
+)
+from app.services.budget_service import budget_cache
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Expose metrics in the Prometheus text format."""
+    active_conversations.set(await conversation_store.count())
+    chat_requests_active.set(admission_controller.active, state="running")
+    chat_requests_active.set(admission_controller.waiting, state="waiting")
+    budget_cache_requests.set_total(budget_cache.hits, result="hit")
+    budget_cache_requests.set_total(budget_cache.misses, result="miss")
+
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -14,12 +14,94 @@ class Settings(BaseSettings):
     vllm_model: str = "Qwen/Qwen2.5-7B-Instruct"
     tool_call_parser: str = "hermes"
 
+    # vLLM Replicas (comma-separated base URLs; overrides vllm_base_url)
+    vllm_base_urls: str = ""
+    vllm_health_check_interval: float = 10.0
+    vllm_eject_after_failures: int = 3
+    vllm_eject_seconds: float = 30.0
+    vllm_sticky_slack: int = 4
+
+    # vLLM HTTP Client (timeouts in seconds; HTTP/2 requires the h2 package)
+    vllm_connect_timeout: float = 5.0
+    vllm_read_timeout: float = 120.0
+    vllm_write_timeout: float = 30.0
+    vllm_pool_timeout: float = 10.0
+    vllm_max_connections: int = 100
+    vllm_max_keepalive_connections: int = 20
+    vllm_keepalive_expiry: float = 30.0
+    vllm_http2: bool = False
+    vllm_max_retries: int = 2
+    vllm_retry_backoff_base: float = 0.5
+    vllm_retry_backoff_max: float = 8.0
+
+    # Guided Tool Calls (regenerate tool call arguments that are not valid
+    # JSON, even after repair, with a json_schema response format built from
+    # the tool's schema instead of returning an error to the model)
+    vllm_guided_tool_calls: bool = False
+    vllm_guided_max_tokens: int = 512
+
+    # Agent Configuration
+    agent_max_tool_concurrency: int = 4
+
+    # Tool Selection (offer only the tool categories a message needs, plus
+    # the core tools; all tools when nothing matches)
+    tool_selection_enabled: bool = True
+    tool_selection_min_score: float = 0.5
+
+    # Tool Arguments (validate and coerce model-supplied arguments against
+    # each tool's parameters before it runs)
+    tool_argument_validation: bool = True
+
+    # Tool Result Cache (read-only tools, keyed by canonical arguments; a
+    # write to a data domain drops the cached results that read it)
+    tool_cache_enabled: bool = True
+    tool_cache_ttl_seconds: float = 60.0
+    tool_cache_max_entries: int = 1024
+
+    # Intent Router (answer simple read-only lookups with one tool call and
+    # no LLM round trip; ambiguous messages still go to the agent)
+    intent_router_enabled: bool = False
+    intent_router_min_score: float = 1.0
+    intent_router_min_margin: float = 0.5
+    intent_router_max_chars: int = 40
+
+    # Chat Admission Control (per worker process; with several workers, turns of
+    # one conversation are only kept from overwriting each other by the store)
+    chat_max_concurrency: int = 16
+    chat_max_queue: int = 64
+    chat_queue_timeout_seconds: float = 30.0
+    chat_max_pending_per_conversation: int = 2
+    chat_retry_after_seconds: int = 5
+
+    # Context Window ("estimate" counts tokens heuristically, "model" loads the
+    # vllm_model tokenizer via the optional transformers package)
+    context_max_tokens: int = 8000
+    context_tokenizer: str = "estimate"
+    context_summary_enabled: bool = True
+
+    # Conversation Store ("memory" for one worker, "database" to share
+    # conversations between workers)
+    conversation_store: str = "memory"
+    conversation_ttl_seconds: int = 86400
+    conversation_max_entries: int = 1000
+
     # Backend Configuration
     backend_port: int = 8080
     allowed_origins: str = "http://localhost:5173,http://localhost:3000"
     log_level: str = "info"
 
-    # Database
+    # Budget Analysis Cache (entries are per month and analysis)
+    budget_cache_max_entries: int = 256
+
+    # Tracing (exporter: "none", "stdout" or "file"; slow traces are kept for
+    # /api/v1/debug/traces)
+    tracing_enabled: bool = True
+    tracing_exporter: str = "none"
+    tracing_file: str = "./traces.jsonl"
+    tracing_slow_ms: float = 2000.0
+    tracing_keep_slow: int = 50
+
+    # Database (sqlite:///... or postgresql://..., which requires asyncpg)
     database_url: str = "sqlite:///./budget.db"
 
     # Debug
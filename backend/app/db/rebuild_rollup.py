@@ -0,0 +1,29 @@
+"""Rebuild the monthly category rollup from daily expenses.
+
+Backfills databases created before the rollup table existed, or repairs it
+after out-of-band edits:
+
+    python -m app.db.rebuild_rollup
+"""
+
+import asyncio
+import logging
+
+from app.db.database import SessionLocal, engine, init_db
+from app.services.budget_service import BudgetService
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild() -> int:
+    """Create missing tables and rebuild the rollup."""
+    await init_db()
+    async with SessionLocal() as db:
+        rows = await BudgetService(db).rebuild_category_rollup()
+    await engine.dispose()
+    return rows
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    logger.info(f"Rebuilt monthly category rollup: {asyncio.run(rebuild())} rows")
@@ -1,6 +1,20 @@
 """LLM module."""
 
 from app.llm.client import VLLMClient, vllm_client
-from app.llm.parser import ParsedResponse, ToolCall, parse_response
+from app.llm.parser import (
+    ParsedResponse,
+    StreamAccumulator,
+    ToolCall,
+    parse_response,
+    repair_json_arguments,
+)
 
-__all__ = ["VLLMClient", "vllm_client", "ParsedResponse", "ToolCall", "parse_response"]
+__all__ = [
+    "VLLMClient",
+    "vllm_client",
+    "ParsedResponse",
+    "StreamAccumulator",
+    "ToolCall",
+    "parse_response",
+    "repair_json_arguments",
+]
@@ -0,0 +1,122 @@
+"""Load balancing across vLLM replicas."""
+
+import asyncio
+import hashlib
+import logging
+import random
+import time
+from dataclasses import dataclass
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Backend:
+    """One vLLM server."""
+
+    url: str
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether the backend is currently in rotation."""
+        return self.ejected_until <= time.monotonic()
+
+
+def _affinity_score(key: str, url: str) -> int:
+    """Rendezvous hash score; stable across processes, unlike hash()."""
+    digest = hashlib.blake2b(f"{key}|{url}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class LoadBalancer:
+    """Least-outstanding-requests balancing with sticky conversation routing.
+
+    Requests carrying an affinity key (the conversation id) go to the
+    backend with the highest rendezvous hash for that key, so the
+    conversation's prefix cache stays on one replica, unless that backend
+    has more than ``sticky_slack`` requests more in flight than the least
+    loaded one. Backends are ejected for ``eject_seconds`` after
+    ``eject_after_failures`` consecutive failures, and readmitted early by a
+    successful health probe. If every backend is ejected, all are tried.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        eject_after_failures: int = 3,
+        eject_seconds: float = 30.0,
+        sticky_slack: int = 4,
+    ) -> None:
+        """Initialize the balancer."""
+        if not urls:
+            raise ValueError("At least one backend URL is required")
+        self.backends = [Backend(url=url.rstrip("/")) for url in urls]
+        self.eject_after_failures = eject_after_failures
+        self.eject_seconds = eject_seconds
+        self.sticky_slack = sticky_slack
+
+    def choose(self, affinity_key: str | None = None) -> Backend:
+        """Pick a backend for a request."""
+        candidates = [b for b in self.backends if b.available] or self.backends
+        if len(candidates) == 1:
+            return candidates[0]
+
+        fewest = min(b.outstanding for b in candidates)
+        if affinity_key:
+            preferred = max(candidates, key=lambda b: _affinity_score(affinity_key, b.url))
+            if preferred.outstanding - fewest <= self.sticky_slack:
+                return preferred
+
+        return random.choice([b for b in candidates if b.outstanding == fewest])
+
+    def record_success(self, backend: Backend) -> None:
+        """Record a successful request."""
+        backend.consecutive_failures = 0
+
+    def record_failure(self, backend: Backend) -> None:
+        """Record a failed request, ejecting the backend if it keeps failing."""
+        backend.consecutive_failures += 1
+        if backend.consecutive_failures >= self.eject_after_failures and backend.available:
+            backend.ejected_until = time.monotonic() + self.eject_seconds
+            logger.warning(
+                f"Ejecting vLLM backend {backend.url} for {self.eject_seconds:.0f}s "
+                f"after {backend.consecutive_failures} failures"
+            )
+
+    async def probe(self, client: httpx.AsyncClient, timeout: float = 2.0) -> None:
+        """Health-check every backend once."""
+
+        async def check(backend: Backend) -> None:
+            try:
+                response = await client.get(f"{backend.url}/health", timeout=timeout)
+                healthy = response.status_code == 200
+            except httpx.HTTPError:
+                healthy = False
+
+            if healthy:
+                if not backend.available:
+                    logger.info(f"vLLM backend {backend.url} is healthy again")
+                backend.consecutive_failures = 0
+                backend.ejected_until = 0.0
+            else:
+                # A failed probe ejects immediately
+                backend.consecutive_failures = max(
+                    backend.consecutive_failures, self.eject_after_failures - 1
+                )
+                self.record_failure(backend)
+
+        await asyncio.gather(*(check(backend) for backend in self.backends))
+
+    async def run_health_checks(self, client: httpx.AsyncClient, interval: float) -> None:
+        """Probe backends forever, every ``interval`` seconds."""
+        while True:
+            try:
+                await self.probe(client)
+            except Exception as e:
+                logger.error(f"vLLM health check failed: {e}", exc_info=True)
+            await asyncio.sleep(interval)
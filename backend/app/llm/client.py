@@ -1,63 +1,433 @@
 """vLLM client for making API calls."""
 
+import asyncio
+import json
 import logging
+import random
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
 from app.config import get_settings
+from app.llm.balancer import Backend, LoadBalancer
+from app.llm.parser import repair_json_arguments
+from app.monitoring.metrics import (
+    llm_cached_prompt_tokens,
+    llm_completion_tokens,
+    llm_errors,
+    llm_first_token_seconds,
+    llm_prompt_tokens,
+    llm_request_seconds,
+    llm_retries,
+)
+from app.monitoring.tracing import tracer
+from app.tools.registry import encode_json
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Transient failures worth retrying. Completions have no side effects, so
+# resending a request is safe as long as no response has been consumed yet.
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+def configured_base_urls() -> list[str]:
+    """Get the vLLM base URLs (VLLM_BASE_URLS, else VLLM_BASE_URL)."""
+    urls = [url.strip() for url in settings.vllm_base_urls.split(",") if url.strip()]
+    return urls or [settings.vllm_base_url]
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client used to talk to vLLM."""
+    http2 = settings.vllm_http2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("VLLM_HTTP2 is set but the h2 package is not installed, using HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            connect=settings.vllm_connect_timeout,
+            read=settings.vllm_read_timeout,
+            write=settings.vllm_write_timeout,
+            pool=settings.vllm_pool_timeout,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.vllm_max_connections,
+            max_keepalive_connections=settings.vllm_max_keepalive_connections,
+            keepalive_expiry=settings.vllm_keepalive_expiry,
+        ),
+        http2=http2,
+    )
+
 
 class VLLMClient:
-    """Client for vLLM OpenAI-compatible API."""
+    """Client for vLLM OpenAI-compatible API.
+
+    Requests are spread over one or more vLLM replicas by a LoadBalancer;
+    pass the conversation id to keep a conversation on one replica.
+
+    With ``guided_tool_calls`` on, the agent regenerates tool call arguments
+    that are not valid JSON with ``generate_tool_arguments``, which has
+    vLLM constrain the output to the tool's parameter schema (a
+    ``json_schema`` response format).
+    """
 
     def __init__(
         self,
         base_url: str | None = None,
         model: str | None = None,
+        max_retries: int | None = None,
+        base_urls: list[str] | None = None,
+        guided_tool_calls: bool | None = None,
     ) -> None:
         """Initialize the client."""
-        self.base_url = (base_url or settings.vllm_base_url).rstrip("/")
+        urls = base_urls or ([base_url] if base_url else configured_base_urls())
+        self.balancer = LoadBalancer(
+            urls,
+            eject_after_failures=settings.vllm_eject_after_failures,
+            eject_seconds=settings.vllm_eject_seconds,
+            sticky_slack=settings.vllm_sticky_slack,
+        )
         self.model = model or settings.vllm_model
-        self.client = httpx.AsyncClient(timeout=120.0)
+        self.max_retries = settings.vllm_max_retries if max_retries is None else max_retries
+        self.guided_tool_calls = (
+            settings.vllm_guided_tool_calls if guided_tool_calls is None else guided_tool_calls
+        )
+        self.client = create_http_client()
+        self._health_task: asyncio.Task[None] | None = None
 
-    async def chat_completion(
+    def start_health_checks(self) -> None:
+        """Start probing backends in the background (only useful with replicas)."""
+        if len(self.balancer.backends) > 1 and self._health_task is None:
+            self._health_task = asyncio.create_task(
+                self.balancer.run_health_checks(
+                    self.client, settings.vllm_health_check_interval
+                )
+            )
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Backoff before retry ``attempt`` (0-based), honoring Retry-After."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), settings.vllm_retry_backoff_max)
+        # Full jitter exponential backoff
+        ceiling = settings.vllm_retry_backoff_base * (2**attempt)
+        return random.uniform(0, min(ceiling, settings.vllm_retry_backoff_max))
+
+    def _build_payload(
         self,
         messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None = None,
-        temperature: float = 0.7,
-        max_tokens: int = 2048,
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int,
+        json_schema: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make a chat completion request."""
-        url = f"{self.base_url}/v1/chat/completions"
-
+        """Build the chat completion request payload."""
         payload: dict[str, Any] = {
             "model": self.model,
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
+        if json_schema is not None:
+            # Structured outputs: vLLM constrains decoding to the schema
+            payload["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "output", "schema": json_schema},
+            }
 
         if tools:
             payload["tools"] = tools
             payload["tool_choice"] = "auto"
 
-        logger.debug(f"Sending request to {url}")
+        return payload
+
+    def _encode_body(self, payload: dict[str, Any], tools_json: bytes | None) -> bytes:
+        """Encode the payload, splicing in pre-encoded tools JSON if given."""
+        body = encode_json(payload)
+        if tools_json:
+            body = body[:-1] + b',"tools":' + tools_json + b',"tool_choice":"auto"}'
+        return body
+
+    def _completions_url(self, backend: Backend) -> str:
+        return f"{backend.url}/v1/chat/completions"
+
+    def _trace_attempt(self, backend: Backend, attempt: int) -> None:
+        """Note the backend and attempt number on the current span."""
+        span = tracer.current_span()
+        if span is not None:
+            span.set_attribute("llm.backend", backend.url)
+            span.set_attribute("llm.attempts", attempt + 1)
+
+    async def chat_completion(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        tools_json: bytes | None = None,
+        conversation_id: str | None = None,
+        json_schema: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make a chat completion request.
+
+        Tools are passed either as a list or, to skip re-encoding them on
+        every call, as pre-encoded JSON (see ``ToolRegistry.get_openai_tools_json``).
+        ``json_schema`` constrains the content to a JSON schema.
+        """
+        started_at = time.perf_counter()
+        with tracer.span("llm.chat_completion", **{"llm.model": self.model}):
+            try:
+                result = await self._chat_completion(
+                    messages,
+                    tools,
+                    temperature,
+                    max_tokens,
+                    tools_json,
+                    conversation_id,
+                    json_schema,
+                )
+            except Exception:
+                llm_errors.inc(mode="complete")
+                raise
+            llm_request_seconds.observe(time.perf_counter() - started_at, mode="complete")
+            self._record_usage(result)
+        return result
+
+    async def generate_tool_arguments(
+        self,
+        messages: list[dict[str, Any]],
+        schema: dict[str, Any],
+        conversation_id: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Generate the arguments of a tool call, constrained to its schema.
+
+        ``messages`` should end with an instruction to write the arguments
+        of the tool. Returns None if no JSON object came back.
+        """
+        with tracer.span("llm.guided_tool_arguments"):
+            response = await self.chat_completion(
+                messages=messages,
+                temperature=0.0,
+                max_tokens=settings.vllm_guided_max_tokens,
+                conversation_id=conversation_id,
+                json_schema=schema,
+            )
+        choices = response.get("choices") or [{}]
+        content = (choices[0].get("message") or {}).get("content") or ""
+        try:
+            arguments = json.loads(content)
+        except json.JSONDecodeError:
+            # Cut off by max_tokens
+            arguments = repair_json_arguments(content)
+        return arguments if isinstance(arguments, dict) else None
+
+    async def chat_completion_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        tools_json: bytes | None = None,
+        conversation_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Make a streaming chat completion request, yielding each chunk.
+
+        Failures are only retried until the first chunk has been yielded.
+        """
+        started_at = time.perf_counter()
+        first = True
+        with tracer.span("llm.chat_completion", **{"llm.model": self.model, "llm.stream": True}) as span:
+            try:
+                async for chunk in self._chat_completion_stream(
+                    messages, tools, temperature, max_tokens, tools_json, conversation_id
+                ):
+                    if first:
+                        elapsed = time.perf_counter() - started_at
+                        llm_first_token_seconds.observe(elapsed)
+                        if span is not None:
+                            span.set_attribute("llm.time_to_first_token_ms", round(elapsed * 1000, 1))
+                        first = False
+                    self._record_usage(chunk)
+                    yield chunk
+            except Exception:
+                llm_errors.inc(mode="stream")
+                raise
+            llm_request_seconds.observe(time.perf_counter() - started_at, mode="stream")
+
+    def _record_usage(self, response: dict[str, Any]) -> None:
+        """Record the token usage reported in a response or final stream chunk."""
+        usage = response.get("usage")
+        if not usage:
+            return
+        llm_prompt_tokens.observe(usage.get("prompt_tokens", 0))
+        llm_completion_tokens.observe(usage.get("completion_tokens", 0))
+        # Only reported when vLLM runs with --enable-prompt-tokens-details
+        cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        if cached_tokens is not None:
+            llm_cached_prompt_tokens.observe(cached_tokens)
+
+        span = tracer.current_span()
+        if span is not None:
+            span.set_attribute("llm.prompt_tokens", usage.get("prompt_tokens", 0))
+            span.set_attribute("llm.completion_tokens", usage.get("completion_tokens", 0))
+            if cached_tokens is not None:
+                span.set_attribute("llm.cached_prompt_tokens", cached_tokens)
+
+    async def _chat_completion(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int,
+        tools_json: bytes | None,
+        conversation_id: str | None,
+        json_schema: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a chat completion request, retrying transient failures."""
+        payload = self._build_payload(messages, tools, temperature, max_tokens, json_schema)
+        body = self._encode_body(payload, tools_json)
+
         logger.debug(f"Payload: {payload}")
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
+        for attempt in range(self.max_retries + 1):
+            retries_left = attempt < self.max_retries
+            backend = self.balancer.choose(conversation_id)
+            url = self._completions_url(backend)
+            self._trace_attempt(backend, attempt)
+            logger.debug(f"Sending request to {url}")
+
+            backend.outstanding += 1
+            try:
+                response = await self.client.post(url, content=body, headers=JSON_HEADERS)
+            except RETRYABLE_ERRORS as e:
+                self.balancer.record_failure(backend)
+                if not retries_left:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"vLLM request to {backend.url} failed ({e!r}), retrying in {delay:.2f}s")
+                llm_retries.inc()
+                response = None
+            finally:
+                backend.outstanding -= 1
+
+            if response is None:
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code >= 500:
+                self.balancer.record_failure(backend)
+            else:
+                self.balancer.record_success(backend)
+
+            if response.status_code in RETRYABLE_STATUS_CODES and retries_left:
+                delay = self._retry_delay(attempt, response)
+                logger.warning(
+                    f"vLLM {backend.url} returned {response.status_code}, retrying in {delay:.2f}s"
+                )
+                llm_retries.inc()
+                await asyncio.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            break
 
         result = response.json()
         logger.debug(f"Response: {result}")
 
         return result
 
+    async def _chat_completion_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int,
+        tools_json: bytes | None,
+        conversation_id: str | None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Send a streaming chat completion request, retrying until the first chunk."""
+        payload = self._build_payload(messages, tools, temperature, max_tokens)
+        payload["stream"] = True
+        # Ask for a final chunk with token usage
+        payload["stream_options"] = {"include_usage": True}
+        body = self._encode_body(payload, tools_json)
+
+        logger.debug(f"Payload: {payload}")
+
+        started = False
+        for attempt in range(self.max_retries + 1):
+            retries_left = attempt < self.max_retries
+            backend = self.balancer.choose(conversation_id)
+            url = self._completions_url(backend)
+            self._trace_attempt(backend, attempt)
+            logger.debug(f"Sending streaming request to {url}")
+
+            backend.outstanding += 1
+            try:
+                async with self.client.stream(
+                    "POST", url, content=body, headers=JSON_HEADERS
+                ) as response:
+                    if response.status_code >= 500:
+                        self.balancer.record_failure(backend)
+                    else:
+                        self.balancer.record_success(backend)
+
+                    if response.status_code in RETRYABLE_STATUS_CODES and retries_left:
+                        delay = self._retry_delay(attempt, response)
+                        logger.warning(
+                            f"vLLM {backend.url} returned {response.status_code}, "
+                            f"retrying in {delay:.2f}s"
+                        )
+                        llm_retries.inc()
+                    else:
+                        response.raise_for_status()
+
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+
+                            data = line[len("data:") :].strip()
+                            if data == "[DONE]":
+                                break
+
+                            started = True
+                            yield json.loads(data)
+                        return
+            except RETRYABLE_ERRORS as e:
+                self.balancer.record_failure(backend)
+                if started or not retries_left:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"vLLM stream from {backend.url} failed ({e!r}), retrying in {delay:.2f}s")
+                llm_retries.inc()
+            finally:
+                backend.outstanding -= 1
+
+            # Only once the response is closed, so its connection is free meanwhile
+            await asyncio.sleep(delay)
+
     async def close(self) -> None:
         """Close the client."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
         await self.client.aclose()
 
 
@@ -2,19 +2,29 @@
 
 import json
 import logging
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import Any
 
+from app.monitoring.metrics import llm_invalid_tool_calls
+
 logger = logging.getLogger(__name__)
 
+CODE_FENCE = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
+
 
 @dataclass
 class ToolCall:
-    """Parsed tool call."""
+    """Parsed tool call.
+
+    ``invalid_arguments`` holds the raw arguments when they are not a JSON
+    object even after repair; ``arguments`` is then empty.
+    """
 
     id: str
     name: str
     arguments: dict[str, Any]
+    invalid_arguments: str | None = None
 
 
 @dataclass
@@ -26,6 +36,92 @@ class ParsedResponse:
     finish_reason: str
 
 
+def _trim_json_object(text: str) -> str | None:
+    """Cut a JSON object at its closing brace, without trailing commas.
+
+    None if it never closes: a member cut off mid-way (``"amount": 120``
+    of 12000, an unterminated description) is neither guessed at nor
+    silently dropped.
+    """
+    out: list[str] = []
+    depth = 0
+    in_string = escaped = False
+    for char in text:
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char in "}]":
+            while out and out[-1] in " \t\r\n,":
+                out.pop()
+            out.append(char)
+            depth -= 1
+            if depth == 0:
+                return "".join(out)
+            continue
+        if char in "{[":
+            depth += 1
+        elif char == '"':
+            in_string = True
+        out.append(char)
+    return None
+
+
+def repair_json_arguments(text: str) -> dict[str, Any] | None:
+    """Repair common damage to tool call arguments, or None if it can't.
+
+    Handles code fences around the JSON, text after it and trailing
+    commas. An object that never closes is not repaired, since whatever
+    follows the cut is missing.
+    """
+    text = CODE_FENCE.sub("", text.strip())
+    start = text.find("{")
+    if start < 0:
+        return None
+    trimmed = _trim_json_object(text[start:])
+    if trimmed is None:
+        return None
+    try:
+        value = json.loads(trimmed)
+    except json.JSONDecodeError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def _build_tool_call(
+    tool_call_id: str,
+    name: str,
+    arguments: str | dict[str, Any],
+    truncated: bool = False,
+) -> ToolCall:
+    """Build a ToolCall, repairing or flagging arguments that are not a JSON object.
+
+    ``truncated`` means generation hit max_tokens: the arguments are then
+    flagged rather than repaired, as the model did not finish the call.
+    """
+    if isinstance(arguments, dict):
+        return ToolCall(id=tool_call_id, name=name, arguments=arguments)
+
+    try:
+        parsed = json.loads(arguments) if arguments.strip() else {}
+    except json.JSONDecodeError as e:
+        parsed = None if truncated else repair_json_arguments(arguments)
+        if parsed is not None:
+            logger.warning(f"Repaired arguments of tool call '{name}' ({e}): {arguments!r}")
+            llm_invalid_tool_calls.inc(outcome="repaired")
+            return ToolCall(id=tool_call_id, name=name, arguments=parsed)
+    if isinstance(parsed, dict):
+        return ToolCall(id=tool_call_id, name=name, arguments=parsed)
+
+    logger.error(f"Invalid arguments for tool call '{name}': {arguments!r}")
+    return ToolCall(id=tool_call_id, name=name, arguments={}, invalid_arguments=arguments)
+
+
 def parse_response(response: dict[str, Any]) -> ParsedResponse:
     """Parse vLLM response into structured format."""
     choices = response.get("choices", [])
@@ -41,29 +137,131 @@ def parse_response(response: dict[str, Any]) -> ParsedResponse:
 
     tool_calls = []
     for tc in tool_calls_raw:
-        try:
-            function = tc.get("function", {})
-            arguments_str = function.get("arguments", "{}")
-
-            # Parse arguments JSON
-            if isinstance(arguments_str, str):
-                arguments = json.loads(arguments_str)
-            else:
-                arguments = arguments_str
-
-            tool_calls.append(
-                ToolCall(
-                    id=tc.get("id", ""),
-                    name=function.get("name", ""),
-                    arguments=arguments,
-                )
+        function = tc.get("function", {})
+        tool_calls.append(
+            _build_tool_call(
+                tool_call_id=tc.get("id", ""),
+                name=function.get("name", ""),
+                arguments=function.get("arguments", "{}"),
+                truncated=finish_reason == "length",
             )
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse tool call arguments: {e}")
-            continue
+        )
 
     return ParsedResponse(
         content=content,
         tool_calls=tool_calls,
         finish_reason=finish_reason,
     )
+
+
+@dataclass
+class _PartialToolCall:
+    """Tool call being assembled from stream deltas."""
+
+    id: str = ""
+    name: str = ""
+    arguments: str = ""
+    completed: bool = False
+
+
+@dataclass
+class StreamAccumulator:
+    """Incrementally assembles a streamed chat completion.
+
+    Each chunk is fed through ``feed``, which returns the content delta and
+    any tool calls whose arguments became complete with that chunk, so the
+    caller can start executing them before the stream ends.
+    """
+
+    content_parts: list[str] = field(default_factory=list)
+    finish_reason: str | None = None
+    _calls: dict[int, _PartialToolCall] = field(default_factory=dict)
+    _completed: list[ToolCall] = field(default_factory=list)
+
+    def feed(self, chunk: dict[str, Any]) -> tuple[str | None, list[ToolCall]]:
+        """Consume one stream chunk."""
+        choices = chunk.get("choices") or []
+        if not choices:
+            return None, []
+
+        choice = choices[0]
+        delta = choice.get("delta") or {}
+        content = delta.get("content")
+        if content:
+            self.content_parts.append(content)
+
+        completed: list[ToolCall] = []
+        for tc_delta in delta.get("tool_calls") or []:
+            index = tc_delta.get("index", 0)
+
+            # A new index means every earlier call has all of its arguments
+            if index not in self._calls:
+                for prev_index, prev in self._calls.items():
+                    if prev_index < index:
+                        completed.extend(self._complete(prev))
+                self._calls[index] = _PartialToolCall()
+
+            partial = self._calls[index]
+            function = tc_delta.get("function") or {}
+            if tc_delta.get("id"):
+                partial.id = tc_delta["id"]
+            if function.get("name"):
+                partial.name += function["name"]
+            fragment = function.get("arguments")
+            if fragment:
+                if partial.completed:
+                    if fragment.strip():
+                        logger.warning(
+                            f"Ignoring arguments received after tool call "
+                            f"'{partial.name}' was complete: {fragment!r}"
+                        )
+                    continue
+                partial.arguments += fragment
+                if partial.arguments.rstrip().endswith("}"):
+                    completed.extend(self._complete(partial, eager=True))
+
+        if choice.get("finish_reason"):
+            self.finish_reason = choice["finish_reason"]
+            completed.extend(self.finish())
+
+        return content, completed
+
+    def finish(self) -> list[ToolCall]:
+        """Complete any tool calls still pending at the end of the stream."""
+        completed: list[ToolCall] = []
+        for partial in self._calls.values():
+            completed.extend(self._complete(partial))
+        return completed
+
+    def to_response(self) -> ParsedResponse:
+        """Build the equivalent non-streaming ParsedResponse."""
+        content = "".join(self.content_parts) or None
+        return ParsedResponse(
+            content=content,
+            tool_calls=list(self._completed),
+            finish_reason=self.finish_reason or "stop",
+        )
+
+    def _complete(self, partial: _PartialToolCall, eager: bool = False) -> list[ToolCall]:
+        """Mark a partial call complete and return it (once)."""
+        if partial.completed:
+            return []
+
+        if eager:
+            # Only complete early if the arguments already form a JSON object
+            try:
+                arguments = json.loads(partial.arguments)
+            except json.JSONDecodeError:
+                return []
+            if not isinstance(arguments, dict):
+                return []
+
+        partial.completed = True
+        tool_call = _build_tool_call(
+            partial.id,
+            partial.name,
+            partial.arguments,
+            truncated=self.finish_reason == "length",
+        )
+        self._completed.append(tool_call)
+        return [tool_call]
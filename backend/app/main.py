@@ -7,7 +7,10 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import router as api_router
 from app.config import get_settings
-from app.db.database import init_db
+from app.db.database import engine, init_db
+from app.llm.client import vllm_client
+from app.monitoring import instrument_engine
+from app.monitoring.tracing import TracingMiddleware, tracer
 
 # Import to trigger tool registration
 import app.tools.builtin  # noqa: F401
@@ -28,6 +31,9 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Record database statement latency for /api/v1/metrics
+instrument_engine(engine)
+
 # CORS middleware
 allowed_origins = [origin.strip() for origin in settings.allowed_origins.split(",")]
 app.add_middleware(
@@ -36,6 +42,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Trace-Id"],
+)
+
+# Trace requests (outermost, so the trace covers the whole response)
+app.add_middleware(
+    TracingMiddleware,
+    tracer=tracer,
+    exclude_paths=("/api/v1/health", "/api/v1/metrics", "/api/v1/debug"),
 )
 
 # Include API router
@@ -46,12 +60,20 @@ app.include_router(api_router, prefix="/api/v1")
 async def startup_event() -> None:
     """Initialize application on startup."""
     logger.info("Starting Budget Chatbot API...")
-    init_db()
+    await init_db()
     logger.info("Database initialized")
-    logger.info(f"vLLM URL: {settings.vllm_base_url}")
+    vllm_client.start_health_checks()
+    logger.info(f"vLLM URLs: {[backend.url for backend in vllm_client.balancer.backends]}")
     logger.info(f"vLLM Model: {settings.vllm_model}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Release resources on shutdown."""
+    await vllm_client.close()
+    logger.info("vLLM client closed")
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint."""
@@ -0,0 +1,16 @@
+"""Database models."""
+
+from app.models.budget import DailyExpense, FixedExpense, MonthlyIncome, SavingsPlan
+from app.models.conversation import ConversationRecord
+from app.models.rollup import MonthlyCategoryRollup
+from app.models.version import DataVersion
+
+__all__ = [
+    "MonthlyIncome",
+    "FixedExpense",
+    "SavingsPlan",
+    "DailyExpense",
+    "MonthlyCategoryRollup",
+    "ConversationRecord",
+    "DataVersion",
+]
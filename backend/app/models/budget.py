@@ -0,0 +1,72 @@
+"""Budget database models."""
+
+from datetime import date as date_type
+
+from sqlalchemy import Boolean, Column, Date, Float, Index, Integer, String
+from sqlalchemy.orm import validates
+
+from app.db.database import Base
+
+
+class MonthlyIncome(Base):
+    """Income for one month."""
+
+    __tablename__ = "monthly_income"
+
+    id = Column(Integer, primary_key=True)
+    year_month = Column(String(7), unique=True, nullable=False)
+    amount = Column(Float, nullable=False)
+    description = Column(String, nullable=True)
+
+
+class FixedExpense(Base):
+    """Recurring monthly expense (rent, phone bill, subscriptions...)."""
+
+    __tablename__ = "fixed_expenses"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    amount = Column(Float, nullable=False)
+    category = Column(String, nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+
+
+class SavingsPlan(Base):
+    """Savings target and actual savings for one month."""
+
+    __tablename__ = "savings_plans"
+
+    id = Column(Integer, primary_key=True)
+    year_month = Column(String(7), unique=True, nullable=False)
+    target_amount = Column(Float, nullable=False)
+    actual_amount = Column(Float, nullable=False, default=0.0)
+
+
+class DailyExpense(Base):
+    """Single day-to-day expense.
+
+    ``year_month`` is derived from ``date`` so monthly lookups can use the
+    ``(year_month, category)`` index; date filters use half-open ranges on
+    the ``date`` index.
+    """
+
+    __tablename__ = "daily_expenses"
+    __table_args__ = (
+        Index("ix_daily_expenses_date", "date"),
+        Index("ix_daily_expenses_year_month_category", "year_month", "category"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False)
+    year_month = Column(String(7), nullable=False)
+    amount = Column(Float, nullable=False)
+    category = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+
+    @validates("date")
+    def _validate_date(self, key: str, value: date_type | str) -> date_type:
+        """Accept ISO date strings and keep year_month in sync."""
+        if isinstance(value, str):
+            value = date_type.fromisoformat(value)
+        self.year_month = value.strftime("%Y-%m")
+        return value
@@ -0,0 +1,28 @@
+"""Conversation state model."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from app.db.database import Base
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ConversationRecord(Base):
+    """Serialized ConversationMemory state for one conversation.
+
+    ``version`` counts saves; a save names the version it loaded, so two
+    workers running turns of the same conversation cannot overwrite each
+    other.
+    """
+
+    __tablename__ = "conversations"
+    __table_args__ = (Index("ix_conversations_updated_at", "updated_at"),)
+
+    id = Column(String(64), primary_key=True)
+    state = Column(Text, nullable=False)
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime, nullable=False, default=_utcnow, onupdate=_utcnow)
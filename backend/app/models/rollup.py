@@ -0,0 +1,20 @@
+"""Aggregate tables maintained alongside the budget data."""
+
+from sqlalchemy import Column, Float, Integer, String
+
+from app.db.database import Base
+
+
+class MonthlyCategoryRollup(Base):
+    """Daily expense total and count per month and category.
+
+    Updated in the same transaction as every daily expense write, so monthly
+    analysis reads scale with the number of categories instead of expenses.
+    """
+
+    __tablename__ = "monthly_category_rollup"
+
+    year_month = Column(String(7), primary_key=True)
+    category = Column(String, primary_key=True)
+    total = Column(Float, nullable=False, default=0.0)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,18 @@
+"""Version counters of the budget data."""
+
+from sqlalchemy import Column, Integer, String
+
+from app.db.database import Base
+
+
+class DataVersion(Base):
+    """Number of committed changes to one month's data, every month's ("*") or a domain's.
+
+    Bumped in the same transaction as the change, so every worker process
+    and command line tool sharing the database sees the same versions.
+    """
+
+    __tablename__ = "data_versions"
+
+    scope = Column(String(32), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
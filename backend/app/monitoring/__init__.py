@@ -0,0 +1,25 @@
+"""Monitoring module."""
+
+from app.monitoring.db import instrument_engine
+from app.monitoring.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    metrics_registry,
+)
+from app.monitoring.tracing import Span, Trace, Tracer, TracingMiddleware, tracer
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "Span",
+    "Trace",
+    "Tracer",
+    "TracingMiddleware",
+    "instrument_engine",
+    "metrics_registry",
+    "tracer",
+]
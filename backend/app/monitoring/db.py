@@ -0,0 +1,41 @@
+"""Database query timing and tracing."""
+
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.monitoring.metrics import db_query_seconds
+from app.monitoring.tracing import tracer
+
+# Bound on the SQL text kept on a span
+MAX_TRACED_STATEMENT = 200
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    context._query_started = time.perf_counter()
+    # Only queries made while tracing a request get a span
+    if tracer.current_span() is not None:
+        context._query_span = tracer.start_span(
+            "db.query", **{"db.statement": statement[:MAX_TRACED_STATEMENT]}
+        )
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else "OTHER"
+    db_query_seconds.observe(time.perf_counter() - started, operation=operation)
+    tracer.end_span(getattr(context, "_query_span", None))
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record the latency of every statement run on ``engine``, and trace it."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
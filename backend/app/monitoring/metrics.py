@@ -0,0 +1,321 @@
+"""In-process metrics in the Prometheus text format.
+
+Metrics are plain counters updated from the event loop thread, so
+recording a value is a dict lookup and an add, with no locking.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator
+from typing import TypeVar
+
+# Latency buckets (seconds), from sub-millisecond DB queries to long LLM calls
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+TOKEN_BUCKETS = (16, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+ITERATION_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10)
+
+
+M = TypeVar("M", bound="Metric")
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    """Format a label set as ``{a="1",b="2"}``."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """Base class for metrics with optional labels."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Initialize the metric."""
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Get the label values of a sample, in labelnames order."""
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterator[str]:
+        """Yield the metric's sample lines."""
+        pass
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """A monotonically increasing value."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Initialize the counter."""
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        """Get the current value."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def set_total(self, value: float, **labels: str) -> None:
+        """Set the counter from a total that is counted elsewhere."""
+        self._values[self._key(labels)] = value
+
+    def samples(self) -> Iterator[str]:
+        """Yield the counter's sample lines."""
+        for key, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """A value that can go up and down."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge."""
+        self.set_total(value, **labels)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge."""
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Counts observations into buckets, with their sum and count."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize the histogram."""
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (+Inf last)..., sum]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation."""
+        key = self._key(labels)
+        counts = self._values.get(key)
+        if counts is None:
+            counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations."""
+        counts = self._values.get(self._key(labels))
+        return int(sum(counts[:-1])) if counts else 0
+
+    def sum(self, **labels: str) -> float:
+        """Get the sum of the observations."""
+        counts = self._values.get(self._key(labels))
+        return counts[-1] if counts else 0.0
+
+    def samples(self) -> Iterator[str]:
+        """Yield the histogram's cumulative bucket, sum and count lines."""
+        for key, counts in self._values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(counts[-1])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        """Register a metric."""
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Create and register a counter."""
+        return self.register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self.register(Gauge(name, help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self.register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+# Global metrics registry
+metrics_registry = MetricsRegistry()
+
+# ============ LLM ============
+
+llm_request_seconds = metrics_registry.histogram(
+    "llm_request_duration_seconds",
+    "vLLM chat completion latency, including retries",
+    ("mode",),
+)
+llm_first_token_seconds = metrics_registry.histogram(
+    "llm_time_to_first_token_seconds",
+    "Time from a streaming request to its first chunk",
+)
+llm_prompt_tokens = metrics_registry.histogram(
+    "llm_prompt_tokens",
+    "Prompt tokens per vLLM request",
+    buckets=TOKEN_BUCKETS,
+)
+llm_cached_prompt_tokens = metrics_registry.histogram(
+    "llm_cached_prompt_tokens",
+    "Prompt tokens per vLLM request served from the prefix cache "
+    "(reported with --enable-prompt-tokens-details)",
+    buckets=TOKEN_BUCKETS,
+)
+llm_completion_tokens = metrics_registry.histogram(
+    "llm_completion_tokens",
+    "Completion tokens per vLLM request",
+    buckets=TOKEN_BUCKETS,
+)
+llm_retries = metrics_registry.counter(
+    "llm_retries_total",
+    "vLLM request attempts that were retried",
+)
+llm_invalid_tool_calls = metrics_registry.counter(
+    "llm_invalid_tool_calls_total",
+    "Tool calls whose arguments were not valid JSON (repaired, guided or failed)",
+    ("outcome",),
+)
+llm_errors = metrics_registry.counter(
+    "llm_errors_total",
+    "vLLM requests that failed after retries",
+    ("mode",),
+)
+
+# ============ Agent ============
+
+agent_iterations = metrics_registry.histogram(
+    "agent_iterations",
+    "LLM round trips per chat message",
+    buckets=ITERATION_BUCKETS,
+)
+agent_run_seconds = metrics_registry.histogram(
+    "agent_run_duration_seconds",
+    "Time to answer a chat message",
+    ("mode",),
+)
+agent_offered_tools = metrics_registry.histogram(
+    "agent_offered_tools",
+    "Tool schemas sent with each chat message",
+    buckets=(1, 2, 4, 6, 8, 10, 15, 20, 30, 50),
+)
+tool_seconds = metrics_registry.histogram(
+    "tool_execution_duration_seconds",
+    "Tool execution latency",
+    ("tool",),
+)
+tool_cache_requests = metrics_registry.counter(
+    "tool_cache_requests_total",
+    "Read-only tool calls answered from the result cache (hit) or executed (miss)",
+    ("tool", "result"),
+)
+tool_argument_errors = metrics_registry.counter(
+    "tool_argument_errors_total",
+    "Tool calls rejected for arguments that could not be validated",
+    ("tool",),
+)
+tool_errors = metrics_registry.counter(
+    "tool_errors_total",
+    "Tool executions that raised or named an unknown tool",
+    ("tool",),
+)
+
+intent_router_requests = metrics_registry.counter(
+    "intent_router_requests_total",
+    "Chat messages seen by the intent router (hit, miss, or error on the routed tool)",
+    ("result", "tool"),
+)
+
+# ============ Database and API ============
+
+db_query_seconds = metrics_registry.histogram(
+    "db_query_duration_seconds",
+    "Database statement latency",
+    ("operation",),
+)
+dashboard_seconds = metrics_registry.histogram(
+    "dashboard_request_duration_seconds",
+    "Dashboard endpoint latency",
+    ("status",),
+)
+
+# Set when metrics are scraped
+active_conversations = metrics_registry.gauge(
+    "active_conversations",
+    "Conversations held by the conversation store",
+)
+chat_requests_active = metrics_registry.gauge(
+    "chat_requests_active",
+    "Chat requests running or waiting for admission",
+    ("state",),
+)
+budget_cache_requests = metrics_registry.counter(
+    "budget_cache_requests_total",
+    "Budget analysis cache lookups since start",
+    ("result",),
+)
@@ -0,0 +1,321 @@
+"""Lightweight request tracing.
+
+Spans follow the OpenTelemetry data model (128-bit trace ids, 64-bit
+span ids, parent links, nanosecond timestamps) and the W3C traceparent
+header, so traces can be loaded into OTel tooling. The current span is
+held in a context variable, so tasks started inside a span (parallel tool
+calls, streamed responses) inherit it as their parent.
+"""
+
+import json
+import logging
+import os
+import re
+import sys
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TextIO
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# Bound on the spans buffered for one trace
+MAX_SPANS_PER_TRACE = 1000
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace.
+
+    ``root_id`` is the span id of the local root, the span this process
+    started the trace with; several requests may share a trace id.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    root_id: str = ""
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration in milliseconds (so far, if still running)."""
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to an OpenTelemetry-style JSON span."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": self.attributes,
+            "status": {"code": "ERROR", "message": self.error} if self.error else {"code": "OK"},
+        }
+
+
+@dataclass
+class Trace:
+    """The finished spans of one request, root first."""
+
+    trace_id: str
+    spans: list[Span]
+
+    @property
+    def root(self) -> Span:
+        """The span that started the trace."""
+        return self.spans[0]
+
+    def waterfall(self) -> list[dict[str, Any]]:
+        """Lay the spans out by start offset and nesting depth."""
+        depths: dict[str | None, int] = {self.root.span_id: 0}
+        rows = []
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            depth = depths.get(span.parent_id, -1) + 1 if span is not self.root else 0
+            depths[span.span_id] = depth
+            rows.append(
+                {
+                    "name": span.name,
+                    "depth": depth,
+                    "offset_ms": round((span.start_ns - self.root.start_ns) / 1e6, 2),
+                    "duration_ms": round(span.duration_ms, 2),
+                    "attributes": span.attributes,
+                    "error": span.error,
+                }
+            )
+        return rows
+
+    def render(self, width: int = 60) -> str:
+        """Render the waterfall as text bars."""
+        total_ms = max(self.root.duration_ms, 0.001)
+        lines = [f"trace {self.trace_id}  {self.root.name}  {total_ms:.1f}ms"]
+        for row in self.waterfall():
+            start = int(row["offset_ms"] / total_ms * width)
+            length = max(1, int(row["duration_ms"] / total_ms * width))
+            bar = " " * start + "█" * min(length, width - start)
+            label = "  " * row["depth"] + row["name"]
+            lines.append(f"{label:<40.40} |{bar:<{width}}| {row['duration_ms']:>9.1f}ms")
+        return "\n".join(lines)
+
+
+@dataclass
+class _PendingTrace:
+    """Spans of a trace whose root has not ended yet."""
+
+    root_id: str
+    spans: list[Span] = field(default_factory=list)
+
+
+class Tracer:
+    """Collects spans per trace and exports each trace when its root ends."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        exporter: str = "none",
+        file_path: str | None = None,
+        slow_ms: float = 2000.0,
+        keep_slow: int = 50,
+    ) -> None:
+        """Initialize the tracer."""
+        self.enabled = enabled
+        self.exporter = exporter
+        self.file_path = file_path
+        self.slow_ms = slow_ms
+        self.slow_traces: deque[Trace] = deque(maxlen=keep_slow)
+        # Keyed by local root span id, as concurrent requests can continue
+        # the same incoming trace
+        self._pending: dict[str, _PendingTrace] = {}
+        self._current: ContextVar[Span | None] = ContextVar("current_span", default=None)
+        self._output: TextIO | None = None
+
+    def current_span(self) -> Span | None:
+        """Get the span of the running operation, if it is being traced."""
+        return self._current.get()
+
+    def start_span(
+        self,
+        name: str,
+        parent: Span | None = None,
+        traceparent: str | None = None,
+        **attributes: Any,
+    ) -> Span | None:
+        """Start a span under ``parent`` (default: the current span).
+
+        Without a parent, a new trace is started, continuing the trace
+        named by a W3C ``traceparent`` header if one is given. The span is
+        not made current; use ``span()`` for that.
+        """
+        if not self.enabled:
+            return None
+
+        parent = parent or self._current.get()
+        span_id = os.urandom(8).hex()
+        if parent is not None:
+            trace_id, parent_id, root_id = parent.trace_id, parent.span_id, parent.root_id
+        else:
+            match = TRACEPARENT_RE.match(traceparent or "")
+            if match and int(match.group(1), 16) and int(match.group(2), 16):
+                trace_id, parent_id = match.group(1), match.group(2)
+            else:
+                trace_id, parent_id = os.urandom(16).hex(), None
+            root_id = span_id
+            self._pending[root_id] = _PendingTrace(root_id=root_id)
+
+        return Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=span_id,
+            parent_id=parent_id,
+            root_id=root_id,
+            attributes=attributes,
+        )
+
+    def end_span(self, span: Span | None, error: BaseException | None = None) -> None:
+        """End a span, finishing its trace if it is the root."""
+        if span is None:
+            return
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+
+        pending = self._pending.get(span.root_id)
+        if pending is None:
+            # Trace already finished (a task outlived its request)
+            return
+
+        if span.span_id == pending.root_id:
+            del self._pending[span.root_id]
+            self._finish(Trace(span.trace_id, [span, *pending.spans]))
+        elif len(pending.spans) < MAX_SPANS_PER_TRACE:
+            pending.spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | None]:
+        """Run the block in a new span, made current for its duration."""
+        with self.activate(self.start_span(name, **attributes)) as span:
+            yield span
+
+    @contextmanager
+    def activate(self, span: Span | None) -> Iterator[Span | None]:
+        """Make a started span current for the block, then end it."""
+        if span is None:
+            yield None
+            return
+
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        else:
+            self.end_span(span)
+        finally:
+            try:
+                self._current.reset(token)
+            except ValueError:
+                # Closed from another context (an abandoned async generator)
+                pass
+
+    def _finish(self, trace: Trace) -> None:
+        """Keep the trace if it was slow and export it."""
+        if trace.root.duration_ms >= self.slow_ms:
+            self.slow_traces.append(trace)
+
+        if self.exporter == "none":
+            return
+        try:
+            output = self._get_output()
+            for span in trace.spans:
+                output.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n")
+            output.flush()
+        except OSError as e:
+            logger.error(f"Failed to export trace {trace.trace_id}: {e}")
+
+    def _get_output(self) -> TextIO:
+        """Get the stream traces are exported to."""
+        if self.exporter == "stdout":
+            return sys.stdout
+        if self._output is None:
+            self._output = open(self.file_path or "traces.jsonl", "a", encoding="utf-8")
+        return self._output
+
+
+class TracingMiddleware:
+    """Traces each HTTP request and returns its trace id.
+
+    Responses carry ``X-Trace-Id`` and a ``traceparent`` header. The root
+    span lasts until the response body is sent, so streamed responses are
+    traced in full.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer, exclude_paths: tuple[str, ...] = ()) -> None:
+        """Initialize the middleware."""
+        self.app = app
+        self.tracer = tracer
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request."""
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or not self.tracer.enabled
+            or path.startswith(self.exclude_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        traceparent = headers.get(b"traceparent", b"").decode("latin-1")
+        span = self.tracer.start_span(
+            f"{scope['method']} {path}",
+            traceparent=traceparent,
+            **{"http.method": scope["method"], "http.target": path},
+        )
+        assert span is not None
+
+        async def send_with_trace(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.status_code", message["status"])
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-trace-id", span.trace_id.encode()),
+                    (b"traceparent", f"00-{span.trace_id}-{span.span_id}-01".encode()),
+                ]
+            await send(message)
+
+        with self.tracer.activate(span):
+            await self.app(scope, receive, send_with_trace)
+
+
+# Global tracer instance
+tracer = Tracer(
+    enabled=settings.tracing_enabled,
+    exporter=settings.tracing_exporter,
+    file_path=settings.tracing_file,
+    slow_ms=settings.tracing_slow_ms,
+    keep_slow=settings.tracing_keep_slow,
+)
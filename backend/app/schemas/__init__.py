@@ -2,6 +2,8 @@
 
 from app.schemas.budget import (
     BudgetStatus,
+    BulkImportResponse,
+    BulkImportRowError,
     CategoryAnalysis,
     DailyExpenseCreate,
     DailyExpenseResponse,
@@ -26,6 +28,8 @@ __all__ = [
     "SavingsPlanResponse",
     "DailyExpenseCreate",
     "DailyExpenseResponse",
+    "BulkImportRowError",
+    "BulkImportResponse",
     "MonthlySummary",
     "CategoryAnalysis",
     "BudgetStatus",
@@ -1,6 +1,8 @@
 """Budget-related Pydantic schemas."""
 
-from pydantic import BaseModel
+import datetime
+
+from pydantic import BaseModel, Field
 
 
 class MonthlyIncomeCreate(BaseModel):
@@ -66,8 +68,8 @@ class SavingsPlanResponse(BaseModel):
 class DailyExpenseCreate(BaseModel):
     """Schema for creating daily expense."""
 
-    date: str
-    amount: float
+    date: datetime.date
+    amount: float = Field(gt=0, allow_inf_nan=False)
     category: str
     description: str | None = None
 
@@ -76,7 +78,7 @@ class DailyExpenseResponse(BaseModel):
     """Schema for daily expense response."""
 
     id: int
-    date: str
+    date: datetime.date
     amount: float
     category: str
     description: str | None
@@ -85,6 +87,21 @@ class DailyExpenseResponse(BaseModel):
         from_attributes = True
 
 
+class BulkImportRowError(BaseModel):
+    """Validation error for one row of a bulk import."""
+
+    row: int
+    error: str
+
+
+class BulkImportResponse(BaseModel):
+    """Schema for bulk expense import response."""
+
+    inserted: int
+    failed: int
+    errors: list[BulkImportRowError]
+
+
 class MonthlySummary(BaseModel):
     """Schema for monthly summary."""
 
@@ -1,35 +1,268 @@
 """Budget business logic service."""
 
-from datetime import datetime
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date as date_type
+from datetime import timedelta
 from typing import Any
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.models.budget import DailyExpense, FixedExpense, MonthlyIncome, SavingsPlan
+from app.models.rollup import MonthlyCategoryRollup
+from app.schemas.budget import DailyExpenseCreate
+from app.services.versioning import (
+    ALL_MONTHS,
+    DAILY_EXPENSES,
+    FIXED_EXPENSES,
+    INCOME,
+    SAVINGS,
+    bump_statement,
+    read_version,
+)
+
+settings = get_settings()
+
+
+def _parse_date(value: date_type | str) -> date_type:
+    """Parse an ISO (YYYY-MM-DD) date string."""
+    if isinstance(value, str):
+        return date_type.fromisoformat(value)
+    return value
+
+
+def _month_range(year_month: str) -> tuple[date_type, date_type]:
+    """Get the half-open [first day, first day of next month) range of a month."""
+    start = date_type.fromisoformat(f"{year_month}-01")
+    if start.month == 12:
+        return start, date_type(start.year + 1, 1, 1)
+    return start, date_type(start.year, start.month + 1, 1)
+
+
+@dataclass
+class DashboardSnapshot:
+    """Everything known about one month, loaded in two queries.
+
+    ``fixed_expenses`` holds the active fixed expense rows (id, name, amount,
+    category) and ``categories`` the (category, total, count) daily expense
+    aggregates ordered by total, largest first.
+    """
+
+    year_month: str
+    income_amount: float | None = None
+    income_description: str | None = None
+    savings_target: float | None = None
+    savings_actual: float | None = None
+    fixed_expenses: list[Row[Any]] = field(default_factory=list)
+    categories: list[tuple[str, float, int]] = field(default_factory=list)
+
+    @property
+    def total_fixed_expenses(self) -> float:
+        """Total of all active fixed expenses."""
+        return sum(expense.amount for expense in self.fixed_expenses)
+
+    @property
+    def total_daily_expenses(self) -> float:
+        """Total daily expenses for the month."""
+        return sum(total for _, total, _ in self.categories)
+
+    def monthly_summary(self) -> dict[str, Any]:
+        """Comprehensive monthly summary."""
+        total_income = self.income_amount or 0.0
+        total_fixed = self.total_fixed_expenses
+        total_daily = self.total_daily_expenses
+        savings_target = self.savings_target or 0.0
+        savings_actual = self.savings_actual or 0.0
+
+        total_expenses = total_fixed + total_daily
+        remaining = total_income - total_expenses - savings_actual
+
+        return {
+            "year_month": self.year_month,
+            "total_income": total_income,
+            "total_fixed_expenses": total_fixed,
+            "total_daily_expenses": total_daily,
+            "total_expenses": total_expenses,
+            "savings_target": savings_target,
+            "savings_actual": savings_actual,
+            "remaining_budget": remaining,
+        }
+
+    def category_analysis(self) -> list[dict[str, Any]]:
+        """Spending analysis by category."""
+        total = self.total_daily_expenses
+
+        result = []
+        for category, category_total, count in self.categories:
+            percentage = (category_total / total * 100) if total > 0 else 0
+            result.append(
+                {
+                    "category": category,
+                    "total_amount": category_total,
+                    "count": count,
+                    "percentage": round(percentage, 1),
+                }
+            )
+
+        return result
+
+    def budget_status(self) -> dict[str, Any]:
+        """Current budget status."""
+        summary = self.monthly_summary()
+
+        total_income = summary["total_income"]
+        total_expenses = summary["total_expenses"]
+        remaining = summary["remaining_budget"]
+        savings_target = summary["savings_target"]
+        savings_actual = summary["savings_actual"]
+
+        savings_progress = 0.0
+        if savings_target > 0:
+            savings_progress = (savings_actual / savings_target) * 100
+
+        # Determine status
+        if remaining < 0:
+            status = "over_budget"
+        elif remaining < total_income * 0.1:  # Less than 10% remaining
+            status = "warning"
+        else:
+            status = "good"
+
+        return {
+            "year_month": self.year_month,
+            "total_income": total_income,
+            "total_expenses": total_expenses,
+            "remaining": remaining,
+            "savings_progress": round(savings_progress, 1),
+            "status": status,
+        }
+
+
+class ReadCache:
+    """Bounded LRU cache of analysis reads, keyed by (name, year_month).
+
+    Every entry is stored with the data version it was computed at and is
+    only served while that version is current in the database, so writes
+    from other workers and command line tools invalidate it too. Commits
+    in this process also evict the entries of the months they changed.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str | None], tuple[str, Any]] = OrderedDict()
+
+    def get(self, key: tuple[str, str | None], version: str) -> tuple[bool, Any]:
+        """Look up a value computed at ``version``. Returns (found, value)."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def put(self, key: tuple[str, str | None], version: str, value: Any) -> None:
+        """Store a value computed at ``version``."""
+        self._entries[key] = (version, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_month(self, year_month: str) -> None:
+        """Evict the entries of one month."""
+        for key in [key for key in self._entries if key[1] == year_month]:
+            del self._entries[key]
+
+    def invalidate_all(self) -> None:
+        """Evict every entry."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get the cache size and hit/miss counters."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Global analysis cache, shared by all BudgetService instances
+budget_cache = ReadCache(settings.budget_cache_max_entries)
 
 
 class BudgetService:
     """Service for managing budget data."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         """Initialize with database session."""
         self.db = db
+        # Months and data domains changed since the last commit (None: every month)
+        self._changed_months: set[str | None] = set()
+        self._changed_domains: set[str] = set()
+
+    def _mark_changed(self, domain: str, *year_months: str | None) -> None:
+        """Record an uncommitted change to a domain in the given months (None: every month)."""
+        self._changed_domains.add(domain)
+        self._changed_months.update(year_months)
+
+    async def commit(self) -> None:
+        """Commit the session and bump the data versions of what changed.
+
+        The stored month and domain versions are bumped in the same
+        transaction, so other workers see them change together with the data.
+        """
+        scopes = list(self._changed_domains)
+        if None in self._changed_months:
+            scopes.append(ALL_MONTHS)
+        else:
+            scopes.extend(self._changed_months)
+        if scopes:
+            await self.db.execute(bump_statement(self.db.bind.dialect.name, scopes))
+        await self.db.commit()
+        self._changed_domains.clear()
+        if None in self._changed_months:
+            budget_cache.invalidate_all()
+        else:
+            for year_month in self._changed_months:
+                budget_cache.invalidate_month(year_month)
+        self._changed_months.clear()
+
+    async def _cached(
+        self,
+        name: str,
+        year_month: str | None,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Serve a read from ``budget_cache``, loading it on a miss.
+
+        ``year_month`` None means the value depends only on data shared by
+        every month. Entries are keyed on the version stored in the
+        database, read before the value, so a stored value is never older
+        than its version, whichever process wrote the data.
+        """
+        key = (name, year_month)
+        version = await read_version(self.db, year_month)
+        found, value = budget_cache.get(key, version)
+        if found:
+            return value
+
+        value = await load()
+        budget_cache.put(key, version, value)
+        return value
 
     # ============ Income ============
 
-    def set_monthly_income(
+    async def set_monthly_income(
         self,
         year_month: str,
         amount: float,
         description: str | None = None,
     ) -> MonthlyIncome:
         """Set or update monthly income."""
-        income = (
-            self.db.query(MonthlyIncome)
-            .filter(MonthlyIncome.year_month == year_month)
-            .first()
-        )
+        income = await self.get_monthly_income(year_month)
 
         if income:
             income.amount = amount
@@ -42,21 +275,21 @@ class BudgetService:
             )
             self.db.add(income)
 
-        self.db.commit()
-        self.db.refresh(income)
+        self._mark_changed(INCOME, year_month)
+        await self.commit()
+        await self.db.refresh(income)
         return income
 
-    def get_monthly_income(self, year_month: str) -> MonthlyIncome | None:
+    async def get_monthly_income(self, year_month: str) -> MonthlyIncome | None:
         """Get monthly income for a specific month."""
-        return (
-            self.db.query(MonthlyIncome)
-            .filter(MonthlyIncome.year_month == year_month)
-            .first()
+        result = await self.db.execute(
+            select(MonthlyIncome).where(MonthlyIncome.year_month == year_month)
         )
+        return result.scalars().first()
 
     # ============ Fixed Expenses ============
 
-    def add_fixed_expense(
+    async def add_fixed_expense(
         self,
         name: str,
         amount: float,
@@ -69,50 +302,49 @@ class BudgetService:
             category=category,
         )
         self.db.add(expense)
-        self.db.commit()
-        self.db.refresh(expense)
+        self._mark_changed(FIXED_EXPENSES, None)
+        await self.commit()
+        await self.db.refresh(expense)
         return expense
 
-    def list_fixed_expenses(self, active_only: bool = True) -> list[FixedExpense]:
+    async def list_fixed_expenses(self, active_only: bool = True) -> list[FixedExpense]:
         """List all fixed expenses."""
-        query = self.db.query(FixedExpense)
+        query = select(FixedExpense)
         if active_only:
-            query = query.filter(FixedExpense.is_active == True)
-        return query.all()
+            query = query.where(FixedExpense.is_active == True)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
 
-    def remove_fixed_expense(self, expense_id: int) -> bool:
+    async def remove_fixed_expense(self, expense_id: int) -> bool:
         """Remove (deactivate) a fixed expense."""
-        expense = (
-            self.db.query(FixedExpense).filter(FixedExpense.id == expense_id).first()
-        )
+        expense = await self.db.get(FixedExpense, expense_id)
         if expense:
             expense.is_active = False
-            self.db.commit()
+            self._mark_changed(FIXED_EXPENSES, None)
+            await self.commit()
             return True
         return False
 
-    def get_total_fixed_expenses(self) -> float:
-        """Get total of all active fixed expenses."""
-        result = (
-            self.db.query(func.sum(FixedExpense.amount))
-            .filter(FixedExpense.is_active == True)
-            .scalar()
-        )
-        return result or 0.0
+    async def get_total_fixed_expenses(self) -> float:
+        """Get total of all active fixed expenses (cached)."""
+
+        async def load() -> float:
+            result = await self.db.scalar(
+                select(func.sum(FixedExpense.amount)).where(FixedExpense.is_active == True)
+            )
+            return result or 0.0
+
+        return await self._cached("total_fixed_expenses", None, load)
 
     # ============ Savings ============
 
-    def set_savings_plan(
+    async def set_savings_plan(
         self,
         year_month: str,
         target_amount: float,
     ) -> SavingsPlan:
         """Set or update savings plan."""
-        plan = (
-            self.db.query(SavingsPlan)
-            .filter(SavingsPlan.year_month == year_month)
-            .first()
-        )
+        plan = await self.get_savings_plan(year_month)
 
         if plan:
             plan.target_amount = target_amount
@@ -123,40 +355,37 @@ class BudgetService:
             )
             self.db.add(plan)
 
-        self.db.commit()
-        self.db.refresh(plan)
+        self._mark_changed(SAVINGS, year_month)
+        await self.commit()
+        await self.db.refresh(plan)
         return plan
 
-    def update_savings(
+    async def update_savings(
         self,
         year_month: str,
         amount: float,
     ) -> SavingsPlan | None:
         """Update actual savings amount."""
-        plan = (
-            self.db.query(SavingsPlan)
-            .filter(SavingsPlan.year_month == year_month)
-            .first()
-        )
+        plan = await self.get_savings_plan(year_month)
 
         if plan:
             plan.actual_amount = amount
-            self.db.commit()
-            self.db.refresh(plan)
+            self._mark_changed(SAVINGS, year_month)
+            await self.commit()
+            await self.db.refresh(plan)
             return plan
         return None
 
-    def get_savings_plan(self, year_month: str) -> SavingsPlan | None:
+    async def get_savings_plan(self, year_month: str) -> SavingsPlan | None:
         """Get savings plan for a specific month."""
-        return (
-            self.db.query(SavingsPlan)
-            .filter(SavingsPlan.year_month == year_month)
-            .first()
+        result = await self.db.execute(
+            select(SavingsPlan).where(SavingsPlan.year_month == year_month)
         )
+        return result.scalars().first()
 
     # ============ Daily Expenses ============
 
-    def add_daily_expense(
+    async def add_daily_expense(
         self,
         date: str,
         amount: float,
@@ -171,130 +400,239 @@ class BudgetService:
             description=description,
         )
         self.db.add(expense)
-        self.db.commit()
-        self.db.refresh(expense)
+        await self.apply_category_rollup(expense.year_month, category, amount)
+        self._mark_changed(DAILY_EXPENSES, expense.year_month)
+        await self.commit()
+        await self.db.refresh(expense)
         return expense
 
-    def get_expenses_by_date(self, date: str) -> list[DailyExpense]:
+    async def insert_daily_expenses(self, expenses: list[DailyExpenseCreate]) -> int:
+        """Insert a batch of daily expenses without committing.
+
+        Rows go in with a single executemany and the rollup is updated with
+        one delta per month/category, all in the caller's transaction.
+        Finish with ``commit()`` so the changed months get new data versions.
+        """
+        if not expenses:
+            return 0
+
+        rows = []
+        deltas: dict[tuple[str, str], tuple[float, int]] = {}
+        for expense in expenses:
+            year_month = expense.date.strftime("%Y-%m")
+            rows.append(
+                {
+                    "date": expense.date,
+                    "year_month": year_month,
+                    "amount": expense.amount,
+                    "category": expense.category,
+                    "description": expense.description,
+                }
+            )
+            total, count = deltas.get((year_month, expense.category), (0.0, 0))
+            deltas[(year_month, expense.category)] = (total + expense.amount, count + 1)
+
+        await self.db.execute(insert(DailyExpense), rows)
+        await self.apply_category_rollups(deltas)
+        self._mark_changed(DAILY_EXPENSES, *(year_month for year_month, _ in deltas))
+        return len(rows)
+
+    async def add_daily_expenses(self, expenses: list[DailyExpenseCreate]) -> int:
+        """Add many daily expenses in one transaction."""
+        inserted = await self.insert_daily_expenses(expenses)
+        await self.commit()
+        return inserted
+
+    async def get_expenses_by_date(self, date: str) -> list[DailyExpense]:
         """Get all expenses for a specific date."""
-        return self.db.query(DailyExpense).filter(DailyExpense.date == date).all()
+        result = await self.db.execute(
+            select(DailyExpense).where(DailyExpense.date == _parse_date(date))
+        )
+        return list(result.scalars().all())
 
-    def get_expenses_by_period(
+    async def get_expenses_by_period(
         self,
         start_date: str,
         end_date: str,
     ) -> list[DailyExpense]:
-        """Get expenses within a date range."""
-        return (
-            self.db.query(DailyExpense)
-            .filter(DailyExpense.date >= start_date, DailyExpense.date <= end_date)
+        """Get expenses within a date range (both ends inclusive)."""
+        end = _parse_date(end_date) + timedelta(days=1)
+        result = await self.db.execute(
+            select(DailyExpense)
+            .where(DailyExpense.date >= _parse_date(start_date), DailyExpense.date < end)
             .order_by(DailyExpense.date)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_monthly_daily_expenses(self, year_month: str) -> list[DailyExpense]:
+    async def get_monthly_daily_expenses(self, year_month: str) -> list[DailyExpense]:
         """Get all daily expenses for a specific month."""
-        return (
-            self.db.query(DailyExpense)
-            .filter(DailyExpense.date.like(f"{year_month}%"))
+        start, end = _month_range(year_month)
+        result = await self.db.execute(
+            select(DailyExpense)
+            .where(DailyExpense.date >= start, DailyExpense.date < end)
             .order_by(DailyExpense.date)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_total_daily_expenses(self, year_month: str) -> float:
+    async def get_total_daily_expenses(self, year_month: str) -> float:
         """Get total daily expenses for a month."""
-        result = (
-            self.db.query(func.sum(DailyExpense.amount))
-            .filter(DailyExpense.date.like(f"{year_month}%"))
-            .scalar()
+        result = await self.db.scalar(
+            select(func.sum(MonthlyCategoryRollup.total)).where(
+                MonthlyCategoryRollup.year_month == year_month
+            )
         )
         return result or 0.0
 
-    # ============ Analysis ============
-
-    def get_monthly_summary(self, year_month: str) -> dict[str, Any]:
-        """Get comprehensive monthly summary."""
-        income = self.get_monthly_income(year_month)
-        savings = self.get_savings_plan(year_month)
-
-        total_income = income.amount if income else 0.0
-        total_fixed = self.get_total_fixed_expenses()
-        total_daily = self.get_total_daily_expenses(year_month)
-        savings_target = savings.target_amount if savings else 0.0
-        savings_actual = savings.actual_amount if savings else 0.0
-
-        total_expenses = total_fixed + total_daily
-        remaining = total_income - total_expenses - savings_actual
+    # ============ Category Rollup ============
 
-        return {
-            "year_month": year_month,
-            "total_income": total_income,
-            "total_fixed_expenses": total_fixed,
-            "total_daily_expenses": total_daily,
-            "total_expenses": total_expenses,
-            "savings_target": savings_target,
-            "savings_actual": savings_actual,
-            "remaining_budget": remaining,
-        }
-
-    def get_category_analysis(self, year_month: str) -> list[dict[str, Any]]:
-        """Get spending analysis by category."""
-        expenses = self.get_monthly_daily_expenses(year_month)
-
-        category_totals: dict[str, dict[str, Any]] = {}
-        total = 0.0
+    async def apply_category_rollup(
+        self,
+        year_month: str,
+        category: str,
+        amount: float,
+        count: int = 1,
+    ) -> None:
+        """Add an expense delta to the month/category rollup.
 
-        for expense in expenses:
-            cat = expense.category
-            if cat not in category_totals:
-                category_totals[cat] = {"total": 0.0, "count": 0}
-            category_totals[cat]["total"] += expense.amount
-            category_totals[cat]["count"] += 1
-            total += expense.amount
+        Runs in the caller's transaction; edit and delete paths pass negative
+        amounts and counts.
+        """
+        await self.apply_category_rollups({(year_month, category): (amount, count)})
 
-        result = []
-        for category, data in sorted(
-            category_totals.items(), key=lambda x: x[1]["total"], reverse=True
-        ):
-            percentage = (data["total"] / total * 100) if total > 0 else 0
-            result.append(
+    async def apply_category_rollups(
+        self,
+        deltas: dict[tuple[str, str], tuple[float, int]],
+    ) -> None:
+        """Apply (total, count) deltas keyed by (year_month, category) in one upsert."""
+        if not deltas:
+            return
+
+        dialect = postgresql if self.db.bind.dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(MonthlyCategoryRollup).values(
+            [
                 {
+                    "year_month": year_month,
                     "category": category,
-                    "total_amount": data["total"],
-                    "count": data["count"],
-                    "percentage": round(percentage, 1),
+                    "total": total,
+                    "count": count,
                 }
+                for (year_month, category), (total, count) in deltas.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MonthlyCategoryRollup.year_month, MonthlyCategoryRollup.category],
+            set_={
+                "total": MonthlyCategoryRollup.total + stmt.excluded.total,
+                "count": MonthlyCategoryRollup.count + stmt.excluded.count,
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def rebuild_category_rollup(self) -> int:
+        """Recompute the whole rollup table from daily expenses.
+
+        Returns the number of month/category rows written.
+        """
+        await self.db.execute(delete(MonthlyCategoryRollup))
+        result = await self.db.execute(
+            insert(MonthlyCategoryRollup).from_select(
+                ["year_month", "category", "total", "count"],
+                select(
+                    DailyExpense.year_month,
+                    DailyExpense.category,
+                    func.sum(DailyExpense.amount),
+                    func.count(),
+                ).group_by(DailyExpense.year_month, DailyExpense.category),
             )
+        )
+        self._mark_changed(DAILY_EXPENSES, None)
+        await self.commit()
+        return result.rowcount
 
-        return result
+    # ============ Analysis ============
 
-    def get_budget_status(self, year_month: str) -> dict[str, Any]:
-        """Get current budget status."""
-        summary = self.get_monthly_summary(year_month)
+    async def get_dashboard_snapshot(self, year_month: str) -> DashboardSnapshot:
+        """Get income, savings, fixed and daily expense data for a month (cached).
 
-        total_income = summary["total_income"]
-        total_expenses = summary["total_expenses"]
-        remaining = summary["remaining_budget"]
-        savings_target = summary["savings_target"]
-        savings_actual = summary["savings_actual"]
+        The analysis methods below are all derived from the snapshot, so
+        they share its cache entry. Treat the result as read-only.
+        """
+        return await self._cached(
+            "dashboard_snapshot",
+            year_month,
+            lambda: self._load_dashboard_snapshot(year_month),
+        )
 
-        savings_progress = 0.0
-        if savings_target > 0:
-            savings_progress = (savings_actual / savings_target) * 100
+    async def _load_dashboard_snapshot(self, year_month: str) -> DashboardSnapshot:
+        """Load income, savings, fixed and daily expense data for a month.
+
+        Income and savings come back as scalar subqueries on every row of the
+        active fixed expense list (outer joined, so there is always one row),
+        and daily expense totals come from the month/category rollup.
+        """
+        def month_scalar(column: Any, model: Any) -> Any:
+            return select(column).where(model.year_month == year_month).scalar_subquery()
+
+        scalars = select(
+            month_scalar(MonthlyIncome.amount, MonthlyIncome).label("income_amount"),
+            month_scalar(MonthlyIncome.description, MonthlyIncome).label("income_description"),
+            month_scalar(SavingsPlan.target_amount, SavingsPlan).label("savings_target"),
+            month_scalar(SavingsPlan.actual_amount, SavingsPlan).label("savings_actual"),
+        ).subquery()
+
+        rows = (
+            await self.db.execute(
+                select(
+                    scalars,
+                    FixedExpense.id,
+                    FixedExpense.name,
+                    FixedExpense.amount,
+                    FixedExpense.category,
+                )
+                .select_from(scalars.outerjoin(FixedExpense, FixedExpense.is_active == True))
+                .order_by(FixedExpense.id)
+            )
+        ).all()
+
+        first = rows[0]
+        snapshot = DashboardSnapshot(
+            year_month=year_month,
+            income_amount=first.income_amount,
+            income_description=first.income_description,
+            savings_target=first.savings_target,
+            savings_actual=first.savings_actual,
+            fixed_expenses=[row for row in rows if row.id is not None],
+        )
 
-        # Determine status
-        if remaining < 0:
-            status = "over_budget"
-        elif remaining < total_income * 0.1:  # Less than 10% remaining
-            status = "warning"
-        else:
-            status = "good"
+        result = await self.db.execute(
+            select(
+                MonthlyCategoryRollup.category,
+                MonthlyCategoryRollup.total,
+                MonthlyCategoryRollup.count,
+            )
+            .where(
+                MonthlyCategoryRollup.year_month == year_month,
+                MonthlyCategoryRollup.count > 0,
+            )
+            .order_by(MonthlyCategoryRollup.total.desc(), MonthlyCategoryRollup.category)
+        )
+        snapshot.categories = [
+            (category, total, count) for category, total, count in result.all()
+        ]
 
-        return {
-            "year_month": year_month,
-            "total_income": total_income,
-            "total_expenses": total_expenses,
-            "remaining": remaining,
-            "savings_progress": round(savings_progress, 1),
-            "status": status,
-        }
+        return snapshot
+
+    async def get_monthly_summary(self, year_month: str) -> dict[str, Any]:
+        """Get comprehensive monthly summary."""
+        snapshot = await self.get_dashboard_snapshot(year_month)
+        return snapshot.monthly_summary()
+
+    async def get_category_analysis(self, year_month: str) -> list[dict[str, Any]]:
+        """Get spending analysis by category."""
+        snapshot = await self.get_dashboard_snapshot(year_month)
+        return snapshot.category_analysis()
+
+    async def get_budget_status(self, year_month: str) -> dict[str, Any]:
+        """Get current budget status."""
+        snapshot = await self.get_dashboard_snapshot(year_month)
+        return snapshot.budget_status()
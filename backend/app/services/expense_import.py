@@ -0,0 +1,234 @@
+"""Streaming parsers and validation for bulk daily expense imports."""
+
+import codecs
+import csv
+import io
+import json
+import re
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.schemas.budget import BulkImportRowError, DailyExpenseCreate
+
+CSV_FIELDS = ["date", "amount", "category", "description"]
+
+
+class ImportFormatError(ValueError):
+    """The upload is not a well-formed JSON array or CSV document."""
+
+
+JSON_WHITESPACE = " \t\r\n"
+NUMBER_CHARS = "0123456789+-.eE"
+# A decode error this close to the end of the buffer may be an element
+# split across chunks (e.g. "tru", "-Infinit", "\\u00"); anything earlier
+# is malformed no matter what follows
+MAX_SPLIT_TOKEN_CHARS = 10
+# Longest CSV row held while waiting for its end; an unclosed quote would
+# otherwise hold the rest of the upload
+MAX_CSV_ROW_CHARS = 64 * 1024
+CSV_QUOTE_OR_NEWLINE = re.compile('["\n]')
+
+
+def _decode(decoder: codecs.IncrementalDecoder, chunk: bytes, final: bool = False) -> str:
+    """Decode the next chunk of an upload."""
+    try:
+        return decoder.decode(chunk, final)
+    except UnicodeDecodeError as e:
+        raise ImportFormatError(f"Upload is not valid UTF-8: {e.reason}") from e
+
+
+def _may_be_split(error: json.JSONDecodeError) -> bool:
+    """Whether a decode error could be fixed by the rest of the upload."""
+    if error.msg.startswith("Unterminated string"):
+        return True
+    return len(error.doc[error.pos :].rstrip()) < MAX_SPLIT_TOKEN_CHARS
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """Yield the elements of a JSON array as its bytes arrive.
+
+    Elements must be separated by exactly one comma. Malformed input is
+    rejected as soon as it is seen, rather than buffering the rest of the
+    upload.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    # "start" before the "[", "first" right after it, "element" after a
+    # comma, "separator" after an element, "done" after the "]"
+    state = "start"
+
+    def parse(final: bool) -> Iterator[Any]:
+        """Yield the complete elements in the buffer, keeping the rest."""
+        nonlocal buffer, state
+        pos = 0
+        while state != "done":
+            while pos < len(buffer) and buffer[pos] in JSON_WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+
+            char = buffer[pos]
+            if state == "start":
+                if char != "[":
+                    raise ImportFormatError("Expected a JSON array")
+                state = "first"
+                pos += 1
+            elif char == "]" and state in ("first", "separator"):
+                state = "done"
+            elif state == "separator":
+                if char != ",":
+                    raise ImportFormatError("Expected ',' or ']' between array elements")
+                state = "element"
+                pos += 1
+            else:
+                try:
+                    element, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if final or not _may_be_split(e):
+                        raise ImportFormatError(f"Malformed JSON array: {e.msg}") from e
+                    break
+                if (
+                    not final
+                    and not isinstance(element, (dict, list, str))
+                    and not buffer[end:].lstrip(NUMBER_CHARS)
+                ):
+                    # A number may go on in the next chunk ("1.5" + "e3")
+                    break
+                yield element
+                state = "separator"
+                pos = end
+        buffer = buffer[pos:]
+
+    async for chunk in chunks:
+        buffer += _decode(utf8, chunk)
+        for element in parse(final=False):
+            yield element
+        if state == "done":
+            return
+
+    buffer += _decode(utf8, b"", final=True)
+    for element in parse(final=True):
+        yield element
+    if state != "done":
+        raise ImportFormatError("Truncated or malformed JSON array")
+
+
+class _CsvRowSplitter:
+    """Splits decoded CSV text into complete rows as it arrives.
+
+    Keeps how far the pending text was scanned and whether that point is
+    inside a quoted field, so each character is scanned once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no pending text."""
+        self.pending = ""
+        self._scanned = 0
+        self._in_quotes = False
+
+    def feed(self, text: str) -> str:
+        """Add text and take the rows completed so far (up to the last unquoted newline)."""
+        self.pending += text
+        end = 0
+        for match in CSV_QUOTE_OR_NEWLINE.finditer(self.pending, self._scanned):
+            if match.group() == '"':
+                self._in_quotes = not self._in_quotes
+            elif not self._in_quotes:
+                end = match.end()
+        complete, self.pending = self.pending[:end], self.pending[end:]
+        self._scanned = len(self.pending)
+        if len(self.pending) > MAX_CSV_ROW_CHARS:
+            raise ImportFormatError(
+                f"CSV row longer than {MAX_CSV_ROW_CHARS} characters (unclosed quote?)"
+            )
+        return complete
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[dict[str, Any]]:
+    """Yield CSV rows as dicts keyed by the header row, as the bytes arrive.
+
+    A row longer than ``MAX_CSV_ROW_CHARS`` is rejected as malformed.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+    splitter = _CsvRowSplitter()
+    header: list[str] | None = None
+
+    def rows(text: str) -> Iterable[list[str]]:
+        try:
+            return [row for row in csv.reader(io.StringIO(text)) if row]
+        except csv.Error as e:
+            raise ImportFormatError(f"Malformed CSV: {e}") from e
+
+    async def parse(text: str) -> AsyncIterator[dict[str, Any]]:
+        nonlocal header
+        for row in rows(text):
+            if header is None:
+                header = [name.strip().lower() for name in row]
+                missing = [name for name in CSV_FIELDS[:3] if name not in header]
+                if missing:
+                    raise ImportFormatError(f"CSV header is missing: {', '.join(missing)}")
+                continue
+            yield {
+                name: (value.strip() or None)
+                for name, value in zip(header, row)
+                if name in CSV_FIELDS
+            }
+
+    async for chunk in chunks:
+        complete = splitter.feed(_decode(utf8, chunk))
+        if complete:
+            async for row in parse(complete):
+                yield row
+
+    splitter.feed(_decode(utf8, b"", final=True))
+    async for row in parse(splitter.pending):
+        yield row
+
+
+def validate_expense(row: int, data: Any) -> DailyExpenseCreate | BulkImportRowError:
+    """Validate one imported row (numbered from 1)."""
+    if not isinstance(data, dict):
+        return BulkImportRowError(row=row, error="Expected an object")
+    try:
+        return DailyExpenseCreate.model_validate(data)
+    except ValidationError as e:
+        error = "; ".join(
+            f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+        )
+        return BulkImportRowError(row=row, error=error)
+
+
+@dataclass
+class ValidatedBatch:
+    """Valid expenses and row errors from part of an import."""
+
+    expenses: list[DailyExpenseCreate] = field(default_factory=list)
+    errors: list[BulkImportRowError] = field(default_factory=list)
+
+
+async def iter_validated_batches(
+    records: AsyncIterator[Any],
+    batch_size: int,
+) -> AsyncIterator[ValidatedBatch]:
+    """Validate parsed records and group them into batches for insertion."""
+    batch = ValidatedBatch()
+    row = 0
+
+    async for record in records:
+        row += 1
+        result = validate_expense(row, record)
+        if isinstance(result, BulkImportRowError):
+            batch.errors.append(result)
+        else:
+            batch.expenses.append(result)
+
+        if len(batch.expenses) >= batch_size:
+            yield batch
+            batch = ValidatedBatch()
+
+    if batch.expenses or batch.errors:
+        yield batch
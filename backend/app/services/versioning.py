@@ -0,0 +1,99 @@
+"""Data versions for validating cached budget reads."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import TypeVar
+
+from sqlalchemy import Insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.database import SessionLocal
+from app.models.version import DataVersion
+
+T = TypeVar("T")
+
+# Version scope of changes that affect every month (fixed expenses, rollup rebuilds)
+ALL_MONTHS = "*"
+
+# Data domains, versioned separately for caching tool results (also version scopes)
+INCOME = "income"
+FIXED_EXPENSES = "fixed_expenses"
+SAVINGS = "savings"
+DAILY_EXPENSES = "daily_expenses"
+ALL_DOMAINS = (INCOME, FIXED_EXPENSES, SAVINGS, DAILY_EXPENSES)
+
+
+def bump_statement(dialect_name: str, scopes: Iterable[str]) -> Insert:
+    """Build the upsert that increments the versions of months, ``ALL_MONTHS`` or domains.
+
+    Execute it in the transaction of the change it records. Scopes are
+    sorted so concurrent writers lock the rows in the same order.
+    """
+    dialect = postgresql if dialect_name == "postgresql" else sqlite
+    stmt = dialect.insert(DataVersion).values(
+        [{"scope": scope, "version": 1} for scope in sorted(set(scopes))]
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[DataVersion.scope],
+        set_={"version": DataVersion.version + 1},
+    )
+
+
+async def read_versions(db: AsyncSession, scopes: Iterable[str]) -> tuple[int, ...]:
+    """Get the committed versions of scopes (0 for a scope never changed)."""
+    scopes = list(scopes)
+    result = await db.execute(
+        select(DataVersion.scope, DataVersion.version).where(DataVersion.scope.in_(scopes))
+    )
+    versions = {scope: version for scope, version in result}
+    return tuple(versions.get(scope, 0) for scope in scopes)
+
+
+async def read_version(db: AsyncSession, year_month: str | None) -> str:
+    """Get the committed version of a month's data (None: data shared by every month)."""
+    scopes = [ALL_MONTHS] if year_month is None else [ALL_MONTHS, year_month]
+    return ".".join(str(version) for version in await read_versions(db, scopes))
+
+
+class DataVersions:
+    """Reads the committed versions of data domains (income, fixed expenses, ...).
+
+    Used by caches keyed by domain rather than month. BudgetService bumps
+    the versions in the transaction of each write, so writes from other
+    workers and command line tools are seen too.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = SessionLocal) -> None:
+        """Initialize with the sessions to read the versions with."""
+        self.session_factory = session_factory
+
+    async def domains(self, names: Iterable[str]) -> tuple[int, ...]:
+        """Get the current versions of data domains."""
+        async with self.session_factory() as db:
+            return await read_versions(db, names)
+
+
+class SingleFlight:
+    """Shares one in-flight computation between concurrent identical calls."""
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` unless a call with the same key is in flight, then share its result.
+
+        The computation runs in its own task, so a caller that goes away
+        does not cancel it for the others.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
+
+
+# Global domain versions reader
+data_versions = DataVersions()
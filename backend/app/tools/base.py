@@ -5,15 +5,30 @@ from typing import Any
 
 from pydantic import BaseModel
 
+# JSON schema keywords for ToolParameter.format values
+FORMAT_SCHEMAS: dict[str, dict[str, str]] = {
+    "date": {"format": "date"},
+    "year_month": {"pattern": r"^\d{4}-(0[1-9]|1[0-2])$"},
+}
+
 
 class ToolParameter(BaseModel):
-    """Tool parameter definition."""
+    """Tool parameter definition.
+
+    ``format`` is "date" (YYYY-MM-DD) or "year_month" (YYYY-MM) for string
+    parameters; arguments are normalized to it before the tool runs.
+    ``minimum`` and ``exclusive_minimum`` bound number parameters.
+    """
 
     name: str
     type: str
     description: str
     required: bool = True
     enum: list[str] | None = None
+    items: dict[str, Any] | None = None
+    format: str | None = None
+    minimum: float | None = None
+    exclusive_minimum: float | None = None
 
 
 class ToolDefinition(BaseModel):
@@ -35,6 +50,14 @@ class ToolDefinition(BaseModel):
             }
             if param.enum:
                 prop["enum"] = param.enum
+            if param.format:
+                prop.update(FORMAT_SCHEMAS[param.format])
+            if param.minimum is not None:
+                prop["minimum"] = param.minimum
+            if param.exclusive_minimum is not None:
+                prop["exclusiveMinimum"] = param.exclusive_minimum
+            if param.items:
+                prop["items"] = param.items
             properties[param.name] = prop
 
             if param.required:
@@ -75,6 +98,50 @@ class BaseTool(ABC):
         """Tool parameters."""
         pass
 
+    @property
+    def category(self) -> str:
+        """Category the tool is listed under in the system prompt.
+
+        Tools are offered to the LLM a category at a time.
+        """
+        return "기타"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        """Words in a user message that suggest the tool's category is needed."""
+        return ()
+
+    @property
+    def core(self) -> bool:
+        """Whether the tool is offered with every request, whatever the message."""
+        return False
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        """Data domains the tool reads, or writes if it is not read-only.
+
+        Cached results of read-only tools are dropped when a write to one of
+        their domains is made.
+        """
+        return ()
+
+    @property
+    def cache_ttl(self) -> float | None:
+        """Seconds a result of this (read-only) tool may be reused.
+
+        None uses the registry default; 0 disables caching.
+        """
+        return None
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the tool only reads data.
+
+        Read-only tool calls from the same turn may run concurrently; tools
+        with side effects are serialized in call order.
+        """
+        return False
+
     @abstractmethod
     async def execute(self, **kwargs: Any) -> str:
         """Execute the tool with given parameters."""
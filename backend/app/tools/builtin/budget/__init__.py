@@ -7,6 +7,7 @@ from app.tools.builtin.budget.analysis import (
 )
 from app.tools.builtin.budget.daily_expenses import (
     AddDailyExpenseTool,
+    AddDailyExpensesTool,
     GetExpensesByDateTool,
     GetExpensesByPeriodTool,
 )
@@ -31,6 +32,7 @@ __all__ = [
     "UpdateSavingsTool",
     # Daily Expenses
     "AddDailyExpenseTool",
+    "AddDailyExpensesTool",
     "GetExpensesByDateTool",
     "GetExpensesByPeriodTool",
     # Analysis
@@ -51,6 +53,7 @@ def get_all_budget_tools() -> list:
         SetSavingsPlanTool(),
         UpdateSavingsTool(),
         AddDailyExpenseTool(),
+        AddDailyExpensesTool(),
         GetExpensesByDateTool(),
         GetExpensesByPeriodTool(),
         GetMonthlySummaryTool(),
@@ -4,6 +4,7 @@ from typing import Any
 
 from app.db.database import SessionLocal
 from app.services.budget_service import BudgetService
+from app.services.versioning import ALL_DOMAINS, DAILY_EXPENSES
 from app.tools.base import BaseTool, ToolParameter
 
 
@@ -18,6 +19,22 @@ class GetMonthlySummaryTool(BaseTool):
     def description(self) -> str:
         return "월별 수입/지출/저축 요약을 보여줍니다."
 
+    @property
+    def category(self) -> str:
+        return "분석 도구"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("요약", "정리", "결산", "이번달", "지난달")
+
+    @property
+    def core(self) -> bool:
+        return True
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return ALL_DOMAINS
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -26,14 +43,18 @@ class GetMonthlySummaryTool(BaseTool):
                 type="string",
                 description="년월 (형식: YYYY-MM, 예: 2024-01)",
                 required=True,
+                format="year_month",
             ),
         ]
 
+    @property
+    def read_only(self) -> bool:
+        return True
+
     async def execute(self, year_month: str, **kwargs: Any) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            summary = service.get_monthly_summary(year_month)
+            summary = await service.get_monthly_summary(year_month)
 
             lines = [
                 f"📊 {year_month} 월간 요약",
@@ -54,8 +75,6 @@ class GetMonthlySummaryTool(BaseTool):
             ]
 
             return "\n".join(lines)
-        finally:
-            db.close()
 
 
 class GetCategoryAnalysisTool(BaseTool):
@@ -69,6 +88,18 @@ class GetCategoryAnalysisTool(BaseTool):
     def description(self) -> str:
         return "카테고리별 지출 분석을 제공합니다."
 
+    @property
+    def category(self) -> str:
+        return "분석 도구"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("카테고리", "분석", "항목", "많이", "비중")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (DAILY_EXPENSES,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -77,14 +108,18 @@ class GetCategoryAnalysisTool(BaseTool):
                 type="string",
                 description="년월 (형식: YYYY-MM, 예: 2024-01)",
                 required=True,
+                format="year_month",
             ),
         ]
 
+    @property
+    def read_only(self) -> bool:
+        return True
+
     async def execute(self, year_month: str, **kwargs: Any) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            analysis = service.get_category_analysis(year_month)
+            analysis = await service.get_category_analysis(year_month)
 
             if not analysis:
                 return f"{year_month}에 기록된 지출이 없습니다."
@@ -108,8 +143,6 @@ class GetCategoryAnalysisTool(BaseTool):
             lines.append(f"총 지출: ₩{total:,.0f}")
 
             return "\n".join(lines)
-        finally:
-            db.close()
 
 
 class GetBudgetStatusTool(BaseTool):
@@ -123,6 +156,18 @@ class GetBudgetStatusTool(BaseTool):
     def description(self) -> str:
         return "예산 대비 현황을 확인합니다."
 
+    @property
+    def category(self) -> str:
+        return "분석 도구"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("예산", "현황", "남은", "남았", "초과")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return ALL_DOMAINS
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -131,14 +176,18 @@ class GetBudgetStatusTool(BaseTool):
                 type="string",
                 description="년월 (형식: YYYY-MM, 예: 2024-01)",
                 required=True,
+                format="year_month",
             ),
         ]
 
+    @property
+    def read_only(self) -> bool:
+        return True
+
     async def execute(self, year_month: str, **kwargs: Any) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            status = service.get_budget_status(year_month)
+            status = await service.get_budget_status(year_month)
 
             status_emoji = {
                 "good": "✅",
@@ -174,5 +223,3 @@ class GetBudgetStatusTool(BaseTool):
                 lines.append("\n💡 추천: 남은 예산이 적습니다. 지출에 주의하세요.")
 
             return "\n".join(lines)
-        finally:
-            db.close()
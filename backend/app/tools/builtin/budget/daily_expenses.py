@@ -3,7 +3,10 @@
 from typing import Any
 
 from app.db.database import SessionLocal
+from app.schemas.budget import BulkImportRowError
 from app.services.budget_service import BudgetService
+from app.services.expense_import import validate_expense
+from app.services.versioning import DAILY_EXPENSES
 from app.tools.base import BaseTool, ToolParameter
 
 
@@ -18,6 +21,22 @@ class AddDailyExpenseTool(BaseTool):
     def description(self) -> str:
         return "일별 지출을 기록합니다."
 
+    @property
+    def category(self) -> str:
+        return "일별 지출 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("썼", "샀", "냈", "결제", "지출", "기록")
+
+    @property
+    def core(self) -> bool:
+        return True
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (DAILY_EXPENSES,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -26,12 +45,14 @@ class AddDailyExpenseTool(BaseTool):
                 type="string",
                 description="날짜 (형식: YYYY-MM-DD, 예: 2024-01-15)",
                 required=True,
+                format="date",
             ),
             ToolParameter(
                 name="amount",
                 type="number",
                 description="지출 금액 (원)",
                 required=True,
+                exclusive_minimum=0,
             ),
             ToolParameter(
                 name="category",
@@ -55,16 +76,83 @@ class AddDailyExpenseTool(BaseTool):
         description: str | None = None,
         **kwargs: Any,
     ) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            expense = service.add_daily_expense(date, amount, category, description)
+            expense = await service.add_daily_expense(date, amount, category, description)
             result = f"{date}에 {category} ₩{expense.amount:,.0f} 지출이 기록되었습니다."
             if expense.description:
                 result += f" (내용: {expense.description})"
             return result
-        finally:
-            db.close()
+
+
+class AddDailyExpensesTool(BaseTool):
+    """Tool for adding many daily expenses at once."""
+
+    @property
+    def name(self) -> str:
+        return "add_daily_expenses"
+
+    @property
+    def description(self) -> str:
+        return "여러 건의 일별 지출을 한 번에 기록합니다 (카드 명세서 등)."
+
+    @property
+    def category(self) -> str:
+        return "일별 지출 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("명세서", "여러", "내역", "기록")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (DAILY_EXPENSES,)
+
+    @property
+    def parameters(self) -> list[ToolParameter]:
+        return [
+            ToolParameter(
+                name="expenses",
+                type="array",
+                description="지출 목록 (각 항목: date, amount, category, description)",
+                required=True,
+                items={
+                    "type": "object",
+                    "properties": {
+                        "date": {"type": "string", "description": "날짜 (YYYY-MM-DD)"},
+                        "amount": {
+                            "type": "number",
+                            "description": "지출 금액 (원)",
+                            "exclusiveMinimum": 0,
+                        },
+                        "category": {"type": "string", "description": "카테고리"},
+                        "description": {"type": "string", "description": "지출 내용 설명"},
+                    },
+                    "required": ["date", "amount", "category"],
+                },
+            ),
+        ]
+
+    async def execute(self, expenses: list[Any], **kwargs: Any) -> str:
+        valid = []
+        errors = []
+        for row, data in enumerate(expenses, start=1):
+            result = validate_expense(row, data)
+            if isinstance(result, BulkImportRowError):
+                errors.append(result)
+            else:
+                valid.append(result)
+
+        async with SessionLocal() as db:
+            service = BudgetService(db)
+            inserted = await service.add_daily_expenses(valid)
+
+        total = sum(e.amount for e in valid)
+        lines = [f"{inserted}건의 지출(₩{total:,.0f})이 기록되었습니다."]
+        if errors:
+            lines.append(f"다음 {len(errors)}건은 기록하지 못했습니다:")
+            lines.extend(f"  - {e.row}번째 항목: {e.error}" for e in errors)
+        return "\n".join(lines)
 
 
 class GetExpensesByDateTool(BaseTool):
@@ -78,6 +166,18 @@ class GetExpensesByDateTool(BaseTool):
     def description(self) -> str:
         return "특정 날짜의 모든 지출을 조회합니다."
 
+    @property
+    def category(self) -> str:
+        return "일별 지출 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("오늘", "어제", "그제", "날짜", "일에", "내역")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (DAILY_EXPENSES,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -86,14 +186,18 @@ class GetExpensesByDateTool(BaseTool):
                 type="string",
                 description="날짜 (형식: YYYY-MM-DD, 예: 2024-01-15)",
                 required=True,
+                format="date",
             ),
         ]
 
+    @property
+    def read_only(self) -> bool:
+        return True
+
     async def execute(self, date: str, **kwargs: Any) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            expenses = service.get_expenses_by_date(date)
+            expenses = await service.get_expenses_by_date(date)
 
             if not expenses:
                 return f"{date}에 기록된 지출이 없습니다."
@@ -109,8 +213,6 @@ class GetExpensesByDateTool(BaseTool):
 
             lines.append(f"\n총 지출: ₩{total:,.0f}")
             return "\n".join(lines)
-        finally:
-            db.close()
 
 
 class GetExpensesByPeriodTool(BaseTool):
@@ -124,6 +226,18 @@ class GetExpensesByPeriodTool(BaseTool):
     def description(self) -> str:
         return "특정 기간의 지출을 조회합니다."
 
+    @property
+    def category(self) -> str:
+        return "일별 지출 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("기간", "동안", "부터", "까지", "최근", "이번주", "지난주")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (DAILY_EXPENSES,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -132,25 +246,30 @@ class GetExpensesByPeriodTool(BaseTool):
                 type="string",
                 description="시작 날짜 (형식: YYYY-MM-DD)",
                 required=True,
+                format="date",
             ),
             ToolParameter(
                 name="end_date",
                 type="string",
                 description="종료 날짜 (형식: YYYY-MM-DD)",
                 required=True,
+                format="date",
             ),
         ]
 
+    @property
+    def read_only(self) -> bool:
+        return True
+
     async def execute(
         self,
         start_date: str,
         end_date: str,
         **kwargs: Any,
     ) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            expenses = service.get_expenses_by_period(start_date, end_date)
+            expenses = await service.get_expenses_by_period(start_date, end_date)
 
             if not expenses:
                 return f"{start_date} ~ {end_date} 기간에 기록된 지출이 없습니다."
@@ -172,5 +291,3 @@ class GetExpensesByPeriodTool(BaseTool):
 
             lines.append(f"\n총 지출: ₩{total:,.0f} ({len(expenses)}건)")
             return "\n".join(lines)
-        finally:
-            db.close()
@@ -4,6 +4,7 @@ from typing import Any
 
 from app.db.database import SessionLocal
 from app.services.budget_service import BudgetService
+from app.services.versioning import FIXED_EXPENSES
 from app.tools.base import BaseTool, ToolParameter
 
 
@@ -18,6 +19,18 @@ class AddFixedExpenseTool(BaseTool):
     def description(self) -> str:
         return "고정지출을 추가합니다 (예: 월세, 통신비, 보험료, 구독료 등)."
 
+    @property
+    def category(self) -> str:
+        return "고정지출 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("고정", "월세", "관리비", "통신비", "보험", "구독", "정기")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (FIXED_EXPENSES,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -32,6 +45,7 @@ class AddFixedExpenseTool(BaseTool):
                 type="number",
                 description="금액 (원)",
                 required=True,
+                exclusive_minimum=0,
             ),
             ToolParameter(
                 name="category",
@@ -48,17 +62,14 @@ class AddFixedExpenseTool(BaseTool):
         category: str | None = None,
         **kwargs: Any,
     ) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            expense = service.add_fixed_expense(name, amount, category)
+            expense = await service.add_fixed_expense(name, amount, category)
             result = f"고정지출 '{expense.name}'이(가) ₩{expense.amount:,.0f}으로 추가되었습니다."
             if expense.category:
                 result += f" (카테고리: {expense.category})"
             result += f" [ID: {expense.id}]"
             return result
-        finally:
-            db.close()
 
 
 class ListFixedExpensesTool(BaseTool):
@@ -72,15 +83,30 @@ class ListFixedExpensesTool(BaseTool):
     def description(self) -> str:
         return "모든 고정지출 목록을 조회합니다."
 
+    @property
+    def category(self) -> str:
+        return "고정지출 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("고정", "구독", "정기")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (FIXED_EXPENSES,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return []
 
+    @property
+    def read_only(self) -> bool:
+        return True
+
     async def execute(self, **kwargs: Any) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            expenses = service.list_fixed_expenses()
+            expenses = await service.list_fixed_expenses()
 
             if not expenses:
                 return "등록된 고정지출이 없습니다."
@@ -96,8 +122,6 @@ class ListFixedExpensesTool(BaseTool):
 
             lines.append(f"\n총 고정지출: ₩{total:,.0f}")
             return "\n".join(lines)
-        finally:
-            db.close()
 
 
 class RemoveFixedExpenseTool(BaseTool):
@@ -111,6 +135,18 @@ class RemoveFixedExpenseTool(BaseTool):
     def description(self) -> str:
         return "고정지출을 삭제합니다. list_fixed_expenses로 조회한 ID를 사용하세요."
 
+    @property
+    def category(self) -> str:
+        return "고정지출 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("고정", "해지", "구독")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (FIXED_EXPENSES,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -123,12 +159,9 @@ class RemoveFixedExpenseTool(BaseTool):
         ]
 
     async def execute(self, expense_id: int, **kwargs: Any) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            success = service.remove_fixed_expense(expense_id)
+            success = await service.remove_fixed_expense(expense_id)
             if success:
                 return f"고정지출 ID {expense_id}이(가) 삭제되었습니다."
             return f"ID {expense_id}에 해당하는 고정지출을 찾을 수 없습니다."
-        finally:
-            db.close()
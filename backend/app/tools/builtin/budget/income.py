@@ -4,6 +4,7 @@ from typing import Any
 
 from app.db.database import SessionLocal
 from app.services.budget_service import BudgetService
+from app.services.versioning import INCOME
 from app.tools.base import BaseTool, ToolParameter
 
 
@@ -18,6 +19,18 @@ class SetMonthlyIncomeTool(BaseTool):
     def description(self) -> str:
         return "월 수입을 설정합니다. 이미 해당 월의 수입이 있으면 업데이트합니다."
 
+    @property
+    def category(self) -> str:
+        return "수입 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("수입", "월급", "급여", "소득", "연봉")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (INCOME,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -26,12 +39,14 @@ class SetMonthlyIncomeTool(BaseTool):
                 type="string",
                 description="년월 (형식: YYYY-MM, 예: 2024-01)",
                 required=True,
+                format="year_month",
             ),
             ToolParameter(
                 name="amount",
                 type="number",
                 description="월 수입 금액 (원)",
                 required=True,
+                minimum=0,
             ),
             ToolParameter(
                 name="description",
@@ -48,16 +63,13 @@ class SetMonthlyIncomeTool(BaseTool):
         description: str | None = None,
         **kwargs: Any,
     ) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            income = service.set_monthly_income(year_month, amount, description)
+            income = await service.set_monthly_income(year_month, amount, description)
             return (
                 f"{year_month}의 월 수입이 ₩{income.amount:,.0f}으로 설정되었습니다."
                 + (f" (설명: {income.description})" if income.description else "")
             )
-        finally:
-            db.close()
 
 
 class GetMonthlyIncomeTool(BaseTool):
@@ -71,6 +83,18 @@ class GetMonthlyIncomeTool(BaseTool):
     def description(self) -> str:
         return "특정 월의 수입을 조회합니다."
 
+    @property
+    def category(self) -> str:
+        return "수입 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("수입", "월급", "급여", "소득")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (INCOME,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -79,19 +103,21 @@ class GetMonthlyIncomeTool(BaseTool):
                 type="string",
                 description="년월 (형식: YYYY-MM, 예: 2024-01)",
                 required=True,
+                format="year_month",
             ),
         ]
 
+    @property
+    def read_only(self) -> bool:
+        return True
+
     async def execute(self, year_month: str, **kwargs: Any) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            income = service.get_monthly_income(year_month)
+            income = await service.get_monthly_income(year_month)
             if income:
                 result = f"{year_month}의 월 수입: ₩{income.amount:,.0f}"
                 if income.description:
                     result += f" (설명: {income.description})"
                 return result
             return f"{year_month}에 등록된 수입이 없습니다."
-        finally:
-            db.close()
@@ -4,6 +4,7 @@ from typing import Any
 
 from app.db.database import SessionLocal
 from app.services.budget_service import BudgetService
+from app.services.versioning import SAVINGS
 from app.tools.base import BaseTool, ToolParameter
 
 
@@ -18,6 +19,18 @@ class SetSavingsPlanTool(BaseTool):
     def description(self) -> str:
         return "월별 저축 목표를 설정합니다."
 
+    @property
+    def category(self) -> str:
+        return "저축 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("저축", "적금", "저금", "목표")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (SAVINGS,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -26,12 +39,14 @@ class SetSavingsPlanTool(BaseTool):
                 type="string",
                 description="년월 (형식: YYYY-MM, 예: 2024-01)",
                 required=True,
+                format="year_month",
             ),
             ToolParameter(
                 name="target_amount",
                 type="number",
                 description="저축 목표 금액 (원)",
                 required=True,
+                minimum=0,
             ),
         ]
 
@@ -41,16 +56,13 @@ class SetSavingsPlanTool(BaseTool):
         target_amount: float,
         **kwargs: Any,
     ) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            plan = service.set_savings_plan(year_month, target_amount)
+            plan = await service.set_savings_plan(year_month, target_amount)
             return (
                 f"{year_month}의 저축 목표가 ₩{plan.target_amount:,.0f}으로 설정되었습니다. "
                 f"(현재 저축액: ₩{plan.actual_amount:,.0f})"
             )
-        finally:
-            db.close()
 
 
 class UpdateSavingsTool(BaseTool):
@@ -64,6 +76,18 @@ class UpdateSavingsTool(BaseTool):
     def description(self) -> str:
         return "실제 저축액을 업데이트합니다."
 
+    @property
+    def category(self) -> str:
+        return "저축 관련"
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return ("저축", "적금", "저금", "모았", "모은")
+
+    @property
+    def domains(self) -> tuple[str, ...]:
+        return (SAVINGS,)
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -72,12 +96,14 @@ class UpdateSavingsTool(BaseTool):
                 type="string",
                 description="년월 (형식: YYYY-MM, 예: 2024-01)",
                 required=True,
+                format="year_month",
             ),
             ToolParameter(
                 name="amount",
                 type="number",
                 description="실제 저축 금액 (원)",
                 required=True,
+                minimum=0,
             ),
         ]
 
@@ -87,10 +113,9 @@ class UpdateSavingsTool(BaseTool):
         amount: float,
         **kwargs: Any,
     ) -> str:
-        db = SessionLocal()
-        try:
+        async with SessionLocal() as db:
             service = BudgetService(db)
-            plan = service.update_savings(year_month, amount)
+            plan = await service.update_savings(year_month, amount)
 
             if plan:
                 progress = (
@@ -106,5 +131,3 @@ class UpdateSavingsTool(BaseTool):
                 f"{year_month}에 저축 계획이 없습니다. "
                 f"먼저 set_savings_plan으로 저축 목표를 설정해주세요."
             )
-        finally:
-            db.close()
@@ -0,0 +1,66 @@
+"""Result cache for read-only tool executions."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass
+class _Entry:
+    """A cached tool result."""
+
+    result: str
+    versions: tuple[int, ...]
+    expires_at: float
+
+
+class ToolResultCache:
+    """LRU of tool results with a TTL per entry.
+
+    Entries are keyed by tool name and canonical arguments, and stored with
+    the versions of the data domains the tool reads. An entry is stale once
+    it expires or any of those versions has changed.
+    """
+
+    def __init__(self, max_entries: int, default_ttl: float) -> None:
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str], versions: tuple[int, ...]) -> str | None:
+        """Get a fresh result, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.versions != versions or entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.result
+
+    def put(
+        self,
+        key: tuple[str, str],
+        versions: tuple[int, ...],
+        result: str,
+        ttl: float,
+    ) -> None:
+        """Store a result for ``ttl`` seconds."""
+        self._entries[key] = _Entry(result, versions, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get the size and hit/miss counts since start."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -1,20 +1,87 @@
 """Tool registry for managing available tools."""
 
+import json
+import time
+from collections.abc import Iterable
 from typing import Any
 
+from app.config import get_settings
+from app.monitoring.metrics import (
+    tool_argument_errors,
+    tool_cache_requests,
+    tool_errors,
+    tool_seconds,
+)
+from app.monitoring.tracing import tracer
+from app.services.versioning import DataVersions, data_versions
 from app.tools.base import BaseTool
+from app.tools.cache import ToolResultCache
+from app.tools.validation import ArgumentValidator, format_argument_errors
+
+settings = get_settings()
+
+# Bound on the number of cached tool subsets
+MAX_CACHED_SUBSETS = 128
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a value the way request payloads are encoded."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize a value deterministically (sorted keys, no ASCII escaping).
+
+    Tool-call arguments kept in the conversation history use this, so a call
+    renders to the same prompt bytes on every request and vLLM's prefix
+    cache can reuse it.
+    """
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def is_error_result(result: str) -> bool:
+    """Whether a tool result reports a failure rather than an answer."""
+    return result.startswith(("Error", '{"error"'))
 
 
 class ToolRegistry:
-    """Registry for managing and accessing tools."""
+    """Registry for managing and accessing tools.
+
+    The OpenAI-format schema of each tool is compiled once at registration.
+    Tool lists (all tools or a named subset) and their pre-encoded JSON are
+    cached until the next ``register`` call; callers must not mutate them.
 
-    def __init__(self) -> None:
+    Arguments are validated and coerced against each tool's parameters
+    (compiled at registration) unless ``validate`` is off; invalid calls get
+    a JSON error result listing what to fix.
+
+    With a result cache, read-only tools are answered from it when called
+    again with the same arguments, until the TTL passes or a write to one
+    of their data domains is committed (by any process: the versions are
+    read from the database).
+    """
+
+    def __init__(
+        self,
+        cache: ToolResultCache | None = None,
+        versions: DataVersions | None = None,
+        validate: bool = True,
+    ) -> None:
         """Initialize the registry."""
+        self.cache = cache
+        self.versions = versions or data_versions
+        self.validate = validate
         self._tools: dict[str, BaseTool] = {}
+        self._validators: dict[str, ArgumentValidator] = {}
+        self._schemas: dict[str, dict[str, Any]] = {}
+        self._payloads: dict[tuple[str, ...] | None, tuple[list[dict[str, Any]], bytes]] = {}
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._schemas[tool.name] = tool.to_openai_format()
+        self._validators[tool.name] = ArgumentValidator(tool.parameters)
+        self._payloads.clear()
 
     def get(self, name: str) -> BaseTool | None:
         """Get a tool by name."""
@@ -24,20 +91,100 @@ class ToolRegistry:
         """Get all registered tools."""
         return list(self._tools.values())
 
-    def get_openai_tools(self) -> list[dict[str, Any]]:
-        """Get all tools in OpenAI format."""
-        return [tool.to_openai_format() for tool in self._tools.values()]
+    def get_openai_tools(self, names: Iterable[str] | None = None) -> list[dict[str, Any]]:
+        """Get all tools, or the named subset, in OpenAI format."""
+        return self._get_payload(names)[0]
+
+    def get_arguments_schema(self, name: str) -> dict[str, Any] | None:
+        """Get the JSON schema of a tool's arguments, closed to unknown keys."""
+        schema = self._schemas.get(name)
+        if schema is None:
+            return None
+        return {**schema["function"]["parameters"], "additionalProperties": False}
+
+    def get_openai_tools_json(self, names: Iterable[str] | None = None) -> bytes:
+        """Get the JSON encoding of ``get_openai_tools(names)``."""
+        return self._get_payload(names)[1]
+
+    def _get_payload(
+        self,
+        names: Iterable[str] | None,
+    ) -> tuple[list[dict[str, Any]], bytes]:
+        """Get the cached tool list and its JSON for a subset (in registration order)."""
+        key: tuple[str, ...] | None = None
+        if names is not None:
+            wanted = set(names)
+            key = tuple(name for name in self._tools if name in wanted)
 
-    async def execute(self, name: str, **kwargs: Any) -> str:
+        payload = self._payloads.get(key)
+        if payload is None:
+            tools = [self._schemas[name] for name in (self._tools if key is None else key)]
+            payload = (tools, encode_json(tools))
+            if len(self._payloads) >= MAX_CACHED_SUBSETS:
+                self._payloads.clear()
+            self._payloads[key] = payload
+        return payload
+
+    async def execute(self, name: str, /, **kwargs: Any) -> str:
         """Execute a tool by name."""
         tool = self.get(name)
         if tool is None:
+            tool_errors.inc(tool="unknown")
             return f"Error: Tool '{name}' not found"
-        try:
-            return await tool.execute(**kwargs)
-        except Exception as e:
-            return f"Error executing tool '{name}': {str(e)}"
+        started_at = time.perf_counter()
+        with tracer.span(f"tool.{name}", **{"tool.name": name}) as span:
+            if self.validate:
+                kwargs, argument_errors = self._validators[name].validate(kwargs)
+                if argument_errors:
+                    tool_argument_errors.inc(tool=name)
+                    if span is not None:
+                        span.error = f"invalid arguments: {[e.argument for e in argument_errors]}"
+                    return format_argument_errors(name, argument_errors)
+
+            ttl = self._cache_ttl(tool)
+            if ttl:
+                key = (name, canonical_json(kwargs))
+                versions = await self.versions.domains(tool.domains)
+                cached = self.cache.get(key, versions)
+                tool_cache_requests.inc(tool=name, result="miss" if cached is None else "hit")
+                if span is not None:
+                    span.set_attribute("tool.cache_hit", cached is not None)
+                if cached is not None:
+                    tool_seconds.observe(time.perf_counter() - started_at, tool=name)
+                    return cached
+
+            try:
+                result = await tool.execute(**kwargs)
+            except Exception as e:
+                tool_errors.inc(tool=name)
+                if span is not None:
+                    span.error = f"{type(e).__name__}: {e}"
+                return f"Error executing tool '{name}': {str(e)}"
+            finally:
+                tool_seconds.observe(time.perf_counter() - started_at, tool=name)
+
+            if (
+                ttl
+                and not is_error_result(result)
+                and await self.versions.domains(tool.domains) == versions
+            ):
+                # Only if no write landed while the tool was running
+                self.cache.put(key, versions, result, ttl)
+            return result
+
+    def _cache_ttl(self, tool: BaseTool) -> float:
+        """Get how long a tool's results may be cached (0: not cached)."""
+        if self.cache is None or not tool.read_only:
+            return 0.0
+        return self.cache.default_ttl if tool.cache_ttl is None else tool.cache_ttl
 
 
 # Global registry instance
-tool_registry = ToolRegistry()
+tool_registry = ToolRegistry(
+    cache=(
+        ToolResultCache(settings.tool_cache_max_entries, settings.tool_cache_ttl_seconds)
+        if settings.tool_cache_enabled
+        else None
+    ),
+    validate=settings.tool_argument_validation,
+)
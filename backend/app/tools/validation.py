@@ -0,0 +1,247 @@
+"""Argument validation for tool calls.
+
+Models often send arguments that are almost right: an amount as
+"15,000원", a date as "2024/01/15", a month as "2024년 1월". Passing those
+straight to a tool fails deep inside it and costs another LLM round trip
+to recover. Each tool's ToolParameter list is compiled once into a
+validator that coerces such values to the declared type and format, and
+reports what it cannot fix as structured errors the model can act on.
+"""
+
+import datetime
+import json
+import math
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.tools.base import ToolParameter
+
+# Characters dropped from amounts ("₩15,000원" -> "15000")
+AMOUNT_NOISE = str.maketrans("", "", ",₩원  ")
+KOREAN_AMOUNT = re.compile(
+    r"^(?:(\d+(?:\.\d+)?)억)?(?:(\d+(?:\.\d+)?)만)?(?:(\d+(?:\.\d+)?)천)?(\d+(?:\.\d+)?)?$"
+)
+KOREAN_UNITS = (100_000_000, 10_000, 1_000, 1)
+DATE = re.compile(r"^(\d{4})\s*[-./년]\s*(\d{1,2})\s*[-./월]\s*(\d{1,2})\s*일?$")
+COMPACT_DATE = re.compile(r"^(\d{4})(\d{2})(\d{2})$")
+YEAR_MONTH = re.compile(r"^(\d{4})\s*[-./년]\s*(\d{1,2})\s*월?$")
+COMPACT_YEAR_MONTH = re.compile(r"^(\d{4})(\d{2})$")
+
+Coercer = Callable[[Any], Any]
+
+
+@dataclass
+class ArgumentError:
+    """A tool argument that could not be validated."""
+
+    argument: str
+    message: str
+    received: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the form reported to the model."""
+        error = {"argument": self.argument, "message": self.message}
+        if isinstance(self.received, float) and not math.isfinite(self.received):
+            # NaN and Infinity are not valid JSON
+            error["received"] = str(self.received)
+        elif self.received is not None:
+            error["received"] = self.received
+        return error
+
+
+def _to_number(value: Any) -> int | float:
+    """Coerce a finite number, including amounts like "15,000원" or "1만 5천"."""
+    number = _parse_number(value)
+    if not math.isfinite(number):
+        raise ValueError("expected a finite number")
+    return number
+
+
+def _parse_number(value: Any) -> int | float:
+    """Parse a number from a JSON number or an amount string."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        text = value.translate(AMOUNT_NOISE)
+        try:
+            return int(text) if text.lstrip("-").isdigit() else float(text)
+        except ValueError:
+            pass
+        match = KOREAN_AMOUNT.match(text)
+        if match and text:
+            total = sum(
+                float(group) * unit
+                for group, unit in zip(match.groups(), KOREAN_UNITS)
+                if group
+            )
+            return int(total) if total.is_integer() else total
+    raise ValueError("expected a number")
+
+
+def _to_integer(value: Any) -> int:
+    """Coerce an integer (a whole float or numeric string is accepted)."""
+    number = _to_number(value)
+    if isinstance(number, float):
+        if not number.is_integer():
+            raise ValueError("expected an integer")
+        return int(number)
+    return number
+
+
+def _to_string(value: Any) -> str:
+    """Coerce a string (numbers are converted)."""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ValueError("expected a string")
+
+
+def _to_boolean(value: Any) -> bool:
+    """Coerce a boolean ("true"/"false" strings are accepted)."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+        return value.strip().lower() == "true"
+    raise ValueError("expected true or false")
+
+
+def _from_json(expected: type, label: str) -> Coercer:
+    """Coerce a list or object, decoding it if it was sent as a JSON string."""
+
+    def coerce(value: Any) -> Any:
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                pass
+        if not isinstance(value, expected):
+            raise ValueError(f"expected {label}")
+        return value
+
+    return coerce
+
+
+def _to_date(value: str) -> str:
+    """Normalize a date to YYYY-MM-DD."""
+    match = DATE.match(value) or COMPACT_DATE.match(value)
+    if match:
+        try:
+            return datetime.date(*(int(group) for group in match.groups())).isoformat()
+        except ValueError:
+            raise ValueError("not a valid calendar date")
+    raise ValueError("expected a date in YYYY-MM-DD format")
+
+
+def _to_year_month(value: str) -> str:
+    """Normalize a month to YYYY-MM (the month of a full date is accepted)."""
+    match = YEAR_MONTH.match(value) or COMPACT_YEAR_MONTH.match(value)
+    if match is None:
+        try:
+            return _to_date(value)[:7]
+        except ValueError:
+            raise ValueError("expected a month in YYYY-MM format")
+    year, month = (int(group) for group in match.groups())
+    if not 1 <= month <= 12:
+        raise ValueError("expected a month in YYYY-MM format")
+    return f"{year:04d}-{month:02d}"
+
+
+TYPE_COERCERS: dict[str, Coercer] = {
+    "number": _to_number,
+    "integer": _to_integer,
+    "string": _to_string,
+    "boolean": _to_boolean,
+    "array": _from_json(list, "an array"),
+    "object": _from_json(dict, "an object"),
+}
+FORMAT_COERCERS: dict[str, Coercer] = {
+    "date": _to_date,
+    "year_month": _to_year_month,
+}
+
+
+def _check_minimum(minimum: float | None, exclusive_minimum: float | None) -> Coercer:
+    """Check a number against a lower bound."""
+
+    def check(value: Any) -> Any:
+        if minimum is not None and value < minimum:
+            raise ValueError(f"must be at least {minimum:g}")
+        if exclusive_minimum is not None and value <= exclusive_minimum:
+            raise ValueError(f"must be greater than {exclusive_minimum:g}")
+        return value
+
+    return check
+
+
+def _compile(param: ToolParameter) -> Coercer:
+    """Chain the type, format, bound and enum checks of a parameter."""
+    steps = [TYPE_COERCERS.get(param.type, lambda value: value)]
+    if param.format:
+        steps.append(FORMAT_COERCERS[param.format])
+    if param.minimum is not None or param.exclusive_minimum is not None:
+        steps.append(_check_minimum(param.minimum, param.exclusive_minimum))
+    if param.enum:
+        allowed = frozenset(param.enum)
+        message = f"expected one of: {', '.join(param.enum)}"
+
+        def check_enum(value: Any) -> Any:
+            if value not in allowed:
+                raise ValueError(message)
+            return value
+
+        steps.append(check_enum)
+
+    if len(steps) == 1:
+        return steps[0]
+
+    def coerce(value: Any) -> Any:
+        for step in steps:
+            value = step(value)
+        return value
+
+    return coerce
+
+
+class ArgumentValidator:
+    """Validates and coerces the arguments of one tool.
+
+    Unknown arguments are dropped and optional arguments sent as null are
+    treated as missing, so the tool receives exactly its declared
+    parameters.
+    """
+
+    def __init__(self, parameters: list[ToolParameter]) -> None:
+        """Compile the parameters."""
+        self._fields = [(param.name, param.required, _compile(param)) for param in parameters]
+
+    def validate(self, arguments: dict[str, Any]) -> tuple[dict[str, Any], list[ArgumentError]]:
+        """Get the coerced arguments and any errors."""
+        coerced: dict[str, Any] = {}
+        errors: list[ArgumentError] = []
+        for name, required, coerce in self._fields:
+            value = arguments.get(name)
+            if value is None:
+                if required:
+                    errors.append(ArgumentError(name, "required argument is missing"))
+                continue
+            try:
+                coerced[name] = coerce(value)
+            except ValueError as e:
+                errors.append(ArgumentError(name, str(e), value))
+        return coerced, errors
+
+
+def format_argument_errors(tool_name: str, errors: list[ArgumentError]) -> str:
+    """Format argument errors as the JSON tool result the model sees."""
+    return json.dumps(
+        {
+            "error": "invalid_arguments",
+            "tool": tool_name,
+            "details": [error.to_dict() for error in errors],
+            "hint": f"Call {tool_name} again with these arguments corrected.",
+        },
+        ensure_ascii=False,
+    )
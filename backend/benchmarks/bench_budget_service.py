@@ -0,0 +1,238 @@
+"""pytest-benchmark suite for BudgetService and the budget tools.
+
+Runs every BudgetService read (with the analysis cache cleared before each
+call, and again warm), representative writes, and every registered tool
+through the registry (cold, and warm for read-only tools), against a
+large synthetic history from benchmarks.seed_data. The file name keeps it
+out of a plain ``pytest`` run; invoke it explicitly (from the backend
+directory):
+
+    pip install -r requirements-dev.txt
+    python -m pytest benchmarks/bench_budget_service.py
+    python -m pytest benchmarks/bench_budget_service.py --benchmark-save=baseline
+    python -m pytest benchmarks/bench_budget_service.py --benchmark-compare
+
+By default a temporary SQLite database is seeded with BENCH_ROWS daily
+expenses (200,000). Set BENCH_DATABASE_URL to reuse a database seeded
+with ``python -m benchmarks.seed_data`` instead. Writes go to a month far
+outside the seeded history so they do not skew the reads.
+"""
+
+import asyncio
+import datetime
+import os
+import tempfile
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+# The app reads its settings at import time, so point it at the benchmark
+# database before importing anything from it
+if "BENCH_DATABASE_URL" in os.environ:
+    DATABASE_URL = os.environ["BENCH_DATABASE_URL"]
+    SEED_ROWS = 0
+else:
+    _db_path = os.path.join(tempfile.mkdtemp(prefix="budget-bench-"), "bench.db")
+    DATABASE_URL = f"sqlite:///{_db_path}"
+    SEED_ROWS = int(os.environ.get("BENCH_ROWS", "200000"))
+os.environ["DATABASE_URL"] = DATABASE_URL
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("TRACING_ENABLED", "false")
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+
+import app.tools.builtin  # noqa: E402, F401
+from app.db.database import SessionLocal, engine, init_db  # noqa: E402
+from app.schemas.budget import DailyExpenseCreate  # noqa: E402
+from app.services.budget_service import BudgetService, budget_cache  # noqa: E402
+from app.tools.registry import is_error_result, tool_registry  # noqa: E402
+from benchmarks.seed_data import seed  # noqa: E402
+
+TODAY = datetime.date.today()
+# Last full month of the seeded history, and a week inside it
+YEAR_MONTH = (TODAY.replace(day=1) - datetime.timedelta(days=1)).strftime("%Y-%m")
+DAY = f"{YEAR_MONTH}-15"
+WEEK = (f"{YEAR_MONTH}-08", f"{YEAR_MONTH}-14")
+# Writes land here, outside the seeded history
+WRITE_MONTH = "2099-01"
+
+# Sample arguments for every registered tool
+TOOL_ARGS: dict[str, dict[str, Any]] = {
+    "get_monthly_income": {"year_month": YEAR_MONTH},
+    "list_fixed_expenses": {},
+    "get_expenses_by_date": {"date": DAY},
+    "get_expenses_by_period": {"start_date": WEEK[0], "end_date": WEEK[1]},
+    "get_monthly_summary": {"year_month": YEAR_MONTH},
+    "get_category_analysis": {"year_month": YEAR_MONTH},
+    "get_budget_status": {"year_month": YEAR_MONTH},
+    "set_monthly_income": {"year_month": WRITE_MONTH, "amount": 3_500_000},
+    "set_savings_plan": {"year_month": WRITE_MONTH, "target_amount": 700_000},
+    "update_savings": {"year_month": WRITE_MONTH, "amount": 10_000},
+    "add_fixed_expense": {"name": "벤치마크 구독", "amount": 9_900, "category": "구독"},
+    "remove_fixed_expense": {"expense_id": 1},
+    "add_daily_expense": {
+        "date": f"{WRITE_MONTH}-15",
+        "amount": 12_000,
+        "category": "식비",
+        "description": "점심",
+    },
+    "add_daily_expenses": {
+        "expenses": [
+            {"date": f"{WRITE_MONTH}-{day:02d}", "amount": 8_000, "category": "카페"}
+            for day in range(1, 11)
+        ]
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def runner() -> Iterator[asyncio.Runner]:
+    """One event loop for the whole module (the engine's pool is bound to it)."""
+    if SEED_ROWS:
+        sync_engine = create_engine(DATABASE_URL)
+        seed(sync_engine, SEED_ROWS, years=3)
+        sync_engine.dispose()
+
+    with asyncio.Runner() as runner:
+        runner.run(init_db())
+        runner.run(_prepare_write_month())
+        yield runner
+        runner.run(engine.dispose())
+
+
+async def _prepare_write_month() -> None:
+    """Give the write month a savings plan so update_savings has a row."""
+    async with SessionLocal() as db:
+        await BudgetService(db).set_savings_plan(WRITE_MONTH, 700_000.0)
+
+
+def run_service(
+    benchmark: Any,
+    runner: asyncio.Runner,
+    call: Callable[[BudgetService], Awaitable[Any]],
+    cached: bool = False,
+) -> Any:
+    """Benchmark one BudgetService call in a fresh session."""
+
+    async def once() -> Any:
+        if not cached:
+            budget_cache.invalidate_all()
+        async with SessionLocal() as db:
+            return await call(BudgetService(db))
+
+    if cached:
+        runner.run(once())
+    return benchmark(lambda: runner.run(once()))
+
+
+# ============ Reads ============
+
+READS: dict[str, Callable[[BudgetService], Awaitable[Any]]] = {
+    "get_monthly_income": lambda s: s.get_monthly_income(YEAR_MONTH),
+    "list_fixed_expenses": lambda s: s.list_fixed_expenses(),
+    "get_total_fixed_expenses": lambda s: s.get_total_fixed_expenses(),
+    "get_savings_plan": lambda s: s.get_savings_plan(YEAR_MONTH),
+    "get_expenses_by_date": lambda s: s.get_expenses_by_date(DAY),
+    "get_expenses_by_period_week": lambda s: s.get_expenses_by_period(*WEEK),
+    "get_monthly_daily_expenses": lambda s: s.get_monthly_daily_expenses(YEAR_MONTH),
+    "get_total_daily_expenses": lambda s: s.get_total_daily_expenses(YEAR_MONTH),
+    "get_dashboard_snapshot": lambda s: s.get_dashboard_snapshot(YEAR_MONTH),
+    "get_monthly_summary": lambda s: s.get_monthly_summary(YEAR_MONTH),
+    "get_category_analysis": lambda s: s.get_category_analysis(YEAR_MONTH),
+    "get_budget_status": lambda s: s.get_budget_status(YEAR_MONTH),
+}
+
+CACHED_READS = [
+    "get_total_fixed_expenses",
+    "get_dashboard_snapshot",
+    "get_monthly_summary",
+    "get_category_analysis",
+    "get_budget_status",
+]
+
+
+@pytest.mark.benchmark(group="service-read")
+@pytest.mark.parametrize("name", list(READS))
+def test_read(benchmark: Any, runner: asyncio.Runner, name: str) -> None:
+    """Read with a cold analysis cache."""
+    run_service(benchmark, runner, READS[name])
+
+
+@pytest.mark.benchmark(group="service-read-cached")
+@pytest.mark.parametrize("name", CACHED_READS)
+def test_read_cached(benchmark: Any, runner: asyncio.Runner, name: str) -> None:
+    """Read answered from the analysis cache."""
+    run_service(benchmark, runner, READS[name], cached=True)
+
+
+# ============ Writes ============
+
+WRITES: dict[str, Callable[[BudgetService], Awaitable[Any]]] = {
+    "set_monthly_income": lambda s: s.set_monthly_income(WRITE_MONTH, 3_500_000.0),
+    "update_savings": lambda s: s.update_savings(WRITE_MONTH, 10_000.0),
+    "add_daily_expense": lambda s: s.add_daily_expense(f"{WRITE_MONTH}-15", 12_000.0, "식비"),
+    "add_daily_expenses_100": lambda s: s.add_daily_expenses(
+        [
+            DailyExpenseCreate(date=f"{WRITE_MONTH}-{i % 28 + 1:02d}", amount=5_000.0, category="교통")
+            for i in range(100)
+        ]
+    ),
+}
+
+
+@pytest.mark.benchmark(group="service-write")
+@pytest.mark.parametrize("name", list(WRITES))
+def test_write(benchmark: Any, runner: asyncio.Runner, name: str) -> None:
+    """Write through BudgetService (commits and invalidates the cache)."""
+    run_service(benchmark, runner, WRITES[name])
+
+
+@pytest.mark.benchmark(group="service-write")
+def test_rebuild_category_rollup(benchmark: Any, runner: asyncio.Runner) -> None:
+    """Recompute the month/category rollup from every daily expense."""
+
+    async def rebuild() -> int:
+        async with SessionLocal() as db:
+            return await BudgetService(db).rebuild_category_rollup()
+
+    benchmark.pedantic(lambda: runner.run(rebuild()), rounds=3, iterations=1)
+
+
+# ============ Tools ============
+
+
+def test_every_tool_has_arguments() -> None:
+    """Keep TOOL_ARGS in step with the registry."""
+    assert set(TOOL_ARGS) == {tool.name for tool in tool_registry.get_all()}
+
+
+@pytest.mark.benchmark(group="tool")
+@pytest.mark.parametrize("name", sorted(TOOL_ARGS))
+def test_tool(benchmark: Any, runner: asyncio.Runner, name: str) -> None:
+    """Execute a tool through the registry, as the agent does, with cold caches."""
+
+    async def once() -> str:
+        budget_cache.invalidate_all()
+        if tool_registry.cache is not None:
+            tool_registry.cache.clear()
+        return await tool_registry.execute(name, **TOOL_ARGS[name])
+
+    result = benchmark(lambda: runner.run(once()))
+    assert not is_error_result(result), result
+
+
+@pytest.mark.benchmark(group="tool-cached")
+@pytest.mark.parametrize(
+    "name", sorted(name for name in TOOL_ARGS if tool_registry.get(name).read_only)
+)
+def test_tool_cached(benchmark: Any, runner: asyncio.Runner, name: str) -> None:
+    """Repeat a read-only tool call answered from the tool result cache."""
+    if tool_registry.cache is None:
+        pytest.skip("TOOL_CACHE_ENABLED is off")
+
+    async def once() -> str:
+        return await tool_registry.execute(name, **TOOL_ARGS[name])
+
+    runner.run(once())
+    result = benchmark(lambda: runner.run(once()))
+    assert not is_error_result(result), result
@@ -0,0 +1,201 @@
+"""Benchmark of malformed tool call handling on the mock vLLM harness.
+
+The mock model sends tool call arguments that are not valid JSON: cut off
+mid-string, wrapped in a code fence, written with single quotes or with an
+unquoted value. The parser repairs the code fence on its own. The others
+either go back to the model as an error (the mock's repair step costs an
+extra agent iteration), or, with guided tool calls on, are regenerated by
+a short request constrained to the tool's schema. Reports agent
+iterations, LLM requests and tokens per message for both modes.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_guided_tool_calls
+    python -m benchmarks.bench_guided_tool_calls --messages 40 --ttft 0.2
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Any
+
+YEAR_MONTH = "2024-05"
+
+
+def _call(name: str, raw_arguments: str | None = None, **arguments: Any) -> dict[str, Any]:
+    """A scripted tool call step, optionally sent as malformed text."""
+    call: dict[str, Any] = {"name": name, "arguments": arguments}
+    if raw_arguments is not None:
+        call["raw_arguments"] = raw_arguments
+    return {"tool_calls": [call]}
+
+
+SCRIPTS: list[dict[str, Any]] = [
+    {
+        "match": ["점심"],
+        "steps": [
+            # Cut off mid-member: not repairable
+            {
+                **_call(
+                    "add_daily_expense",
+                    raw_arguments='{"date": "2024-05-03", "amount": 12000, "category": "식비", "desc',
+                    date="2024-05-03",
+                    amount=12000,
+                    category="식비",
+                ),
+                "repair": _call(
+                    "add_daily_expense", date="2024-05-03", amount=12000, category="식비"
+                ),
+            },
+            {"content": "점심 12,000원을 기록했습니다."},
+        ],
+    },
+    {
+        "match": ["요약"],
+        "steps": [
+            # Code fence: repaired by the parser
+            _call(
+                "get_monthly_summary",
+                raw_arguments=f'```json\n{{"year_month": "{YEAR_MONTH}"}}\n```',
+                year_month=YEAR_MONTH,
+            ),
+            {"content": "5월 요약입니다."},
+        ],
+    },
+    {
+        "match": ["일주일"],
+        "steps": [
+            # Single quotes: not repairable
+            {
+                **_call(
+                    "get_expenses_by_period",
+                    raw_arguments="{'start_date': '2024-05-01', 'end_date': '2024-05-07'}",
+                    start_date="2024-05-01",
+                    end_date="2024-05-07",
+                ),
+                "repair": _call(
+                    "get_expenses_by_period", start_date="2024-05-01", end_date="2024-05-07"
+                ),
+            },
+            {"content": "첫 주 지출 내역입니다."},
+        ],
+    },
+    {
+        "match": [],
+        "steps": [
+            # Unquoted value: not repairable
+            {
+                **_call(
+                    "get_budget_status",
+                    raw_arguments='{"year_month": 2024-05}',
+                    year_month=YEAR_MONTH,
+                ),
+                "repair": _call("get_budget_status", year_month=YEAR_MONTH),
+            },
+            {"content": "5월 예산 현황입니다."},
+        ],
+    },
+]
+MESSAGES = [
+    "5월 3일 점심 12,000원",
+    "5월 요약해줘",
+    "5월 첫 일주일 지출 보여줘",
+    "5월 예산 현황",
+]
+
+
+async def run_messages(count: int) -> dict[str, float]:
+    """Send the scripted messages through the agent and measure the LLM work."""
+    from app.agent.executor import AgentExecutor
+    from app.monitoring.metrics import agent_iterations, llm_completion_tokens, llm_prompt_tokens
+
+    before = (
+        agent_iterations.sum(),
+        llm_prompt_tokens.count(),
+        llm_prompt_tokens.sum(),
+        llm_completion_tokens.sum(),
+    )
+    latencies = []
+    for i in range(count):
+        started = time.perf_counter()
+        await AgentExecutor().run(MESSAGES[i % len(MESSAGES)])
+        latencies.append(time.perf_counter() - started)
+
+    iterations, requests, prompt_tokens, completion_tokens = (
+        after - start
+        for after, start in zip(
+            (
+                agent_iterations.sum(),
+                llm_prompt_tokens.count(),
+                llm_prompt_tokens.sum(),
+                llm_completion_tokens.sum(),
+            ),
+            before,
+        )
+    )
+    return {
+        "iterations": iterations / count,
+        "requests": requests / count,
+        "prompt_tokens": prompt_tokens / count,
+        "completion_tokens": completion_tokens / count,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the messages without and with guided tool calls."""
+    import httpx
+
+    import app.tools.builtin  # noqa: F401
+    from app.db.database import SessionLocal, init_db
+    from app.llm.client import vllm_client
+    from app.monitoring.metrics import llm_invalid_tool_calls
+    from app.services.budget_service import BudgetService
+    from app.tools.registry import tool_registry
+    from benchmarks.mock_vllm import MockConfig, create_app
+
+    mock = create_app(
+        MockConfig(ttft=args.ttft, tokens_per_second=args.tokens_per_second, scripts=SCRIPTS)
+    )
+    vllm_client.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=mock), timeout=60.0)
+    await init_db()
+    async with SessionLocal() as db:
+        await BudgetService(db).set_monthly_income(YEAR_MONTH, 3_000_000.0)
+
+    for guided in (False, True):
+        vllm_client.guided_tool_calls = guided
+        if tool_registry.cache is not None:
+            tool_registry.cache.clear()
+        outcomes = {
+            outcome: llm_invalid_tool_calls.get(outcome=outcome)
+            for outcome in ("repaired", "guided", "failed")
+        }
+        row = await run_messages(args.messages)
+        handled = ", ".join(
+            f"{int(llm_invalid_tool_calls.get(outcome=outcome) - count)} {outcome}"
+            for outcome, count in outcomes.items()
+        )
+        print(
+            f"guided {'on ' if guided else 'off'}: "
+            f"{row['iterations']:.2f} iterations, {row['requests']:.2f} LLM requests, "
+            f"{row['prompt_tokens']:.0f} prompt + {row['completion_tokens']:.0f} completion "
+            f"tokens, {row['mean_ms']:.1f}ms per message ({handled})"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--ttft", type=float, default=0.05, help="mock LLM time to first token (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0, help="mock LLM decode rate")
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="budget-guided-"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("TRACING_ENABLED", "false")
+    os.environ.setdefault("INTENT_ROUTER_ENABLED", "false")
+
+    asyncio.run(main(args))
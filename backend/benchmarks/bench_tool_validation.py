@@ -0,0 +1,212 @@
+"""Benchmark of tool argument validation.
+
+Two parts:
+
+1. The cost of validating and coercing arguments, per tool call, for
+   well-formed and sloppy arguments (microseconds).
+2. LLM round trips per chat message on the mock vLLM harness, with
+   validation off and on. The mock model sends arguments the way models
+   often get them slightly wrong ("12,000원", "2024/05/03", "2024년 5월",
+   a missing argument). Every step has a repair that the mock sends when
+   the tool calls failed, so each failed call costs one extra round trip.
+   With validation, coercible arguments are fixed before the tool runs;
+   the rest come back as a structured error the repair fixes in one shot.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_tool_validation
+    python -m benchmarks.bench_tool_validation --messages 50 --ttft 0.2
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Any
+
+YEAR_MONTH = "2024-05"
+DAY = f"{YEAR_MONTH}-03"
+
+
+def _call(name: str, **arguments: Any) -> dict[str, Any]:
+    """A scripted tool call step."""
+    return {"tool_calls": [{"name": name, "arguments": arguments}]}
+
+
+# Each script sends sloppy arguments first, and well-formed ones as the repair
+SCRIPTS: list[dict[str, Any]] = [
+    {
+        "match": ["점심"],
+        "steps": [
+            {
+                **_call(
+                    "add_daily_expense",
+                    date=DAY.replace("-", "/"),
+                    amount="12,000원",
+                    category="식비",
+                    description="점심",
+                ),
+                "repair": _call(
+                    "add_daily_expense", date=DAY, amount=12000, category="식비", description="점심"
+                ),
+            },
+            {"content": "점심 12,000원을 기록했습니다."},
+        ],
+    },
+    {
+        "match": ["월급"],
+        "steps": [
+            {
+                **_call("set_monthly_income", year_month="2024년 5월", amount="350만"),
+                "repair": _call("set_monthly_income", year_month=YEAR_MONTH, amount=3500000),
+            },
+            {"content": "5월 수입을 350만원으로 설정했습니다."},
+        ],
+    },
+    {
+        "match": ["일주일"],
+        "steps": [
+            {
+                **_call(
+                    "get_expenses_by_period",
+                    start_date="2024.05.01",
+                    end_date="20240507",
+                ),
+                "repair": _call(
+                    "get_expenses_by_period", start_date="2024-05-01", end_date="2024-05-07"
+                ),
+            },
+            {"content": "첫 주 지출 내역입니다."},
+        ],
+    },
+    {
+        "match": ["택시"],
+        "steps": [
+            {
+                # Not coercible: the category is missing either way
+                **_call("add_daily_expense", date=DAY, amount=8000),
+                "repair": _call("add_daily_expense", date=DAY, amount=8000, category="교통"),
+            },
+            {"content": "택시비 8,000원을 기록했습니다."},
+        ],
+    },
+    {
+        "match": [],
+        "steps": [
+            {
+                **_call("get_budget_status", year_month=YEAR_MONTH),
+                "repair": _call("get_budget_status", year_month=YEAR_MONTH),
+            },
+            {"content": "5월 예산 현황입니다."},
+        ],
+    },
+]
+MESSAGES = [
+    "5월 3일 점심 12,000원",
+    "5월 월급 350만원 들어왔어",
+    "5월 첫 일주일 지출 보여줘",
+    "5월 3일 택시 8,000원",
+    "5월 예산 현황",
+]
+
+# Arguments for the validator microbenchmark
+CLEAN = {"date": DAY, "amount": 12000, "category": "식비", "description": "점심"}
+SLOPPY = {"date": "2024년 5월 3일", "amount": "₩12,000원", "category": "식비", "extra": 1}
+
+
+def bench_validator(rounds: int) -> dict[str, float]:
+    """Microseconds per validation of add_daily_expense arguments."""
+    import app.tools.builtin  # noqa: F401
+    from app.tools.registry import tool_registry
+    from app.tools.validation import ArgumentValidator
+
+    validator = ArgumentValidator(tool_registry.get("add_daily_expense").parameters)
+    report = {}
+    for label, arguments in (("clean", CLEAN), ("sloppy", SLOPPY)):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            validator.validate(arguments)
+        report[label] = (time.perf_counter() - started) / rounds * 1e6
+    return report
+
+
+async def run_messages(count: int) -> dict[str, float]:
+    """Send the scripted messages through the agent and measure round trips."""
+    from app.agent.executor import AgentExecutor
+    from app.monitoring.metrics import agent_iterations, tool_argument_errors, tool_errors
+    from app.tools.registry import tool_registry
+
+    def tool_failures() -> float:
+        return sum(
+            counter.get(tool=tool.name)
+            for counter in (tool_errors, tool_argument_errors)
+            for tool in tool_registry.get_all()
+        )
+
+    iterations_before = agent_iterations.sum()
+    runs_before = agent_iterations.count()
+    failures_before = tool_failures()
+    latencies = []
+    for i in range(count):
+        started = time.perf_counter()
+        await AgentExecutor().run(MESSAGES[i % len(MESSAGES)])
+        latencies.append(time.perf_counter() - started)
+
+    runs = agent_iterations.count() - runs_before
+    return {
+        "iterations": (agent_iterations.sum() - iterations_before) / runs,
+        "failed_tool_calls": tool_failures() - failures_before,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run both parts and print the report."""
+    import httpx
+
+    from app.db.database import SessionLocal, init_db
+    from app.llm.client import vllm_client
+    from app.services.budget_service import BudgetService
+    from app.tools.registry import tool_registry
+    from benchmarks.mock_vllm import MockConfig, create_app
+
+    for label, micros in bench_validator(args.rounds).items():
+        print(f"validate add_daily_expense ({label}): {micros:.2f}µs")
+
+    mock = create_app(
+        MockConfig(ttft=args.ttft, tokens_per_second=args.tokens_per_second, scripts=SCRIPTS)
+    )
+    vllm_client.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=mock), timeout=60.0)
+    await init_db()
+    async with SessionLocal() as db:
+        await BudgetService(db).set_monthly_income(YEAR_MONTH, 3_000_000.0)
+
+    for validate in (False, True):
+        tool_registry.validate = validate
+        if tool_registry.cache is not None:
+            tool_registry.cache.clear()
+        row = await run_messages(args.messages)
+        print(
+            f"validation {'on ' if validate else 'off'}: "
+            f"{row['iterations']:.2f} LLM round trips/message, "
+            f"{int(row['failed_tool_calls'])} failed tool calls, "
+            f"{row['mean_ms']:.1f}ms/message"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=25)
+    parser.add_argument("--rounds", type=int, default=100_000, help="validator microbenchmark")
+    parser.add_argument("--ttft", type=float, default=0.05, help="mock LLM time to first token (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0, help="mock LLM decode rate")
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="budget-validation-"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("TRACING_ENABLED", "false")
+    os.environ.setdefault("INTENT_ROUTER_ENABLED", "false")
+
+    asyncio.run(main(args))
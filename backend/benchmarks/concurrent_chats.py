@@ -0,0 +1,162 @@
+"""Budget tool latency under concurrent chats.
+
+Compares the legacy blocking session path ("sync", how the budget tools
+queried the database before the async layer) with the async BudgetService
+("async"). Each simulated chat waits on a fake LLM call, runs the three
+analysis tools a typical budget question triggers, then waits on the LLM
+again. A heartbeat task measures event-loop lag, which is the delay every
+other request on the same worker sees.
+
+Usage (from the backend directory):
+    python -m benchmarks.concurrent_chats --chats 50 --expenses 50000
+"""
+
+import argparse
+import asyncio
+import datetime
+import os
+import random
+import statistics
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="budget-bench-")
+DB_PATH = os.path.join(_tmpdir, "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+from sqlalchemy import String, create_engine, func, insert, select, type_coerce  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.db.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.budget import (  # noqa: E402
+    DailyExpense,
+    FixedExpense,
+    MonthlyIncome,
+    SavingsPlan,
+)
+from app.services.budget_service import BudgetService  # noqa: E402
+
+YEAR_MONTH = "2024-06"
+CATEGORIES = ["식비", "교통", "쇼핑", "문화/여가", "의료", "교육", "기타"]
+LLM_LATENCY = 0.05
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def seed(sync_engine, expenses: int) -> None:
+    """Create tables and seed one year of data."""
+    Base.metadata.create_all(sync_engine)
+    rng = random.Random(42)
+    rows = []
+    for _ in range(expenses):
+        day = datetime.date(2024, rng.randint(1, 12), rng.randint(1, 28))
+        rows.append(
+            {
+                "date": day,
+                "year_month": day.strftime("%Y-%m"),
+                "amount": float(rng.randint(1, 100) * 1000),
+                "category": rng.choice(CATEGORIES),
+                "description": None,
+            }
+        )
+    with Session(sync_engine) as session:
+        session.add(MonthlyIncome(year_month=YEAR_MONTH, amount=3_000_000.0))
+        session.add(SavingsPlan(year_month=YEAR_MONTH, target_amount=500_000.0, actual_amount=0.0))
+        session.add(FixedExpense(name="월세", amount=500_000.0, category="주거", is_active=True))
+        session.execute(insert(DailyExpense), rows)
+        session.commit()
+
+
+def legacy_analysis(sync_engine, year_month: str) -> None:
+    """Run the queries of one analysis tool call the way they used to run.
+
+    Blocking session, string LIKE filters on the date and every expense row
+    of the month loaded into Python.
+    """
+    with Session(sync_engine) as session:
+        session.scalars(select(MonthlyIncome).where(MonthlyIncome.year_month == year_month)).first()
+        session.scalars(select(SavingsPlan).where(SavingsPlan.year_month == year_month)).first()
+        session.scalar(select(func.sum(FixedExpense.amount)).where(FixedExpense.is_active == True))
+        month_filter = type_coerce(DailyExpense.date, String).like(f"{year_month}%")
+        session.scalar(select(func.sum(DailyExpense.amount)).where(month_filter))
+        session.scalars(select(DailyExpense).where(month_filter)).all()
+
+
+async def async_analysis(year_month: str) -> None:
+    """Run one analysis tool call on the async service."""
+    async with SessionLocal() as db:
+        service = BudgetService(db)
+        await service.get_monthly_summary(year_month)
+        await service.get_category_analysis(year_month)
+
+
+async def chat(mode: str, sync_engine) -> float:
+    """Simulate one chat: LLM call, three analysis tools, LLM call."""
+    start = time.perf_counter()
+    await asyncio.sleep(LLM_LATENCY)
+    for _ in range(3):
+        if mode == "sync":
+            legacy_analysis(sync_engine, YEAR_MONTH)
+        else:
+            await async_analysis(YEAR_MONTH)
+    await asyncio.sleep(LLM_LATENCY)
+    return time.perf_counter() - start
+
+
+async def heartbeat(stop: asyncio.Event, lags: list[float], interval: float = 0.01) -> None:
+    """Record how late the event loop wakes us up."""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run_mode(mode: str, chats: int, sync_engine) -> dict[str, list[float]]:
+    """Run all chats concurrently in one mode."""
+    stop = asyncio.Event()
+    lags: list[float] = []
+    beat = asyncio.create_task(heartbeat(stop, lags))
+    latencies = await asyncio.gather(*(chat(mode, sync_engine) for _ in range(chats)))
+    stop.set()
+    await beat
+    return {"chat": list(latencies), "loop_lag": lags or [0.0]}
+
+
+def report(mode: str, results: dict[str, list[float]]) -> None:
+    """Print percentiles in milliseconds."""
+    for name, values in results.items():
+        print(
+            f"{mode:>5} {name:>9}: "
+            f"p50={percentile(values, 50) * 1000:8.1f}ms "
+            f"p95={percentile(values, 95) * 1000:8.1f}ms "
+            f"p99={percentile(values, 99) * 1000:8.1f}ms "
+            f"mean={statistics.fmean(values) * 1000:8.1f}ms"
+        )
+
+
+async def main(chats: int, expenses: int) -> None:
+    """Seed the database and benchmark both modes."""
+    sync_engine = create_engine(f"sqlite:///{DB_PATH}")
+    seed(sync_engine, expenses)
+    async with SessionLocal() as db:
+        await BudgetService(db).rebuild_category_rollup()
+    print(f"{chats} concurrent chats, {expenses} expenses ({DB_PATH})")
+
+    for mode in ("sync", "async"):
+        report(mode, await run_mode(mode, chats, sync_engine))
+
+    sync_engine.dispose()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chats", type=int, default=50)
+    parser.add_argument("--expenses", type=int, default=50_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.chats, args.expenses))
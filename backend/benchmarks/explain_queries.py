@@ -0,0 +1,88 @@
+"""Check that daily expense queries use index range scans.
+
+Runs every date-filtered BudgetService read against an empty SQLite
+database, captures the SQL it issues and prints SQLite's EXPLAIN QUERY PLAN
+for each statement. Exits non-zero if any of them falls back to a full
+scan of daily_expenses. tests/test_query_plans.py asserts the same plans.
+
+Usage (from the backend directory):
+    python -m benchmarks.explain_queries
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+QUERIES: dict[str, Callable[[Any], Awaitable[Any]]] = {
+    "get_expenses_by_date": lambda s: s.get_expenses_by_date("2024-06-15"),
+    "get_expenses_by_period": lambda s: s.get_expenses_by_period("2024-06-01", "2024-06-30"),
+    "get_monthly_daily_expenses": lambda s: s.get_monthly_daily_expenses("2024-06"),
+    "rebuild_category_rollup": lambda s: s.rebuild_category_rollup(),
+}
+
+
+def is_full_scan(detail: str) -> bool:
+    """Whether a plan line scans daily_expenses without an index."""
+    return detail.startswith("SCAN daily_expenses") and "INDEX" not in detail
+
+
+async def query_plans() -> dict[str, list[str]]:
+    """Get the plan lines of the daily_expenses statements each query issues.
+
+    Uses the configured database, which must be SQLite.
+    """
+    from sqlalchemy import event
+
+    from app.db.database import SessionLocal, engine, init_db
+    from app.services.budget_service import BudgetService
+
+    await init_db()
+    plans: dict[str, list[str]] = {}
+
+    for name, call in QUERIES.items():
+        statements: list[tuple[str, tuple]] = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if "daily_expenses" in statement and "EXPLAIN" not in statement:
+                statements.append((statement, parameters))
+
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            async with SessionLocal() as db:
+                await call(BudgetService(db))
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        plans[name] = []
+        async with engine.connect() as conn:
+            for statement, parameters in statements:
+                if not statement.lstrip().upper().startswith(("SELECT", "INSERT")):
+                    continue
+                plan = await conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)
+                )
+                plans[name].extend(row[-1] for row in plan)
+
+    await engine.dispose()
+    return plans
+
+
+async def explain() -> bool:
+    """Print query plans; return False if any statement scans daily_expenses."""
+    ok = True
+    for name, details in (await query_plans()).items():
+        print(f"== {name}")
+        for detail in details:
+            full_scan = is_full_scan(detail)
+            ok = ok and not full_scan
+            print(f"   {'FULL SCAN ' if full_scan else ''}{detail}")
+    return ok
+
+
+if __name__ == "__main__":
+    _tmpdir = tempfile.mkdtemp(prefix="budget-explain-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'explain.db')}"
+    sys.exit(0 if asyncio.run(explain()) else 1)
@@ -0,0 +1,268 @@
+"""Load test for the chat and dashboard endpoints.
+
+Many synthetic users run concurrently, each sending a mix of chat
+messages (kept in one conversation for a few turns) and dashboard reads
+(revalidated with If-None-Match, like a browser), for a fixed duration.
+Reports throughput, p50/p95/p99 latency and error rate per endpoint.
+
+By default everything runs in-process against a temporary database, with
+the LLM served by benchmarks.mock_vllm, so results are reproducible
+without a GPU or open ports. Pass --url to load a running backend instead
+(start it against the mock with VLLM_BASE_URL pointing at mock_vllm).
+
+Usage (from the backend directory):
+    python -m benchmarks.loadtest --users 50 --duration 20
+    python -m benchmarks.loadtest --url http://localhost:8080 --stream --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+CHAT_MESSAGES = [
+    "이번 달 예산 현황 알려줘",
+    "이번 달 지출 요약해줘",
+    "카테고리별로 분석해줘",
+    "오늘 점심에 만 이천원 썼어",
+    "안녕하세요",
+]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class Results:
+    """Latencies and outcomes per endpoint."""
+
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    statuses: dict[str, dict[int, int]] = field(default_factory=dict)
+
+    def record(self, endpoint: str, seconds: float, status: int | None) -> None:
+        """Record one request; status None means it raised."""
+        self.latencies.setdefault(endpoint, []).append(seconds)
+        code = status or 0
+        counts = self.statuses.setdefault(endpoint, {})
+        counts[code] = counts.get(code, 0) + 1
+        if status is None or status >= 400:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        """Summarize per endpoint (latencies in milliseconds)."""
+        summary = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            summary[endpoint] = {
+                "requests": len(values),
+                "throughput_rps": round(len(values) / elapsed, 2),
+                "p50_ms": round(percentile(values, 50) * 1000, 1),
+                "p95_ms": round(percentile(values, 95) * 1000, 1),
+                "p99_ms": round(percentile(values, 99) * 1000, 1),
+                "mean_ms": round(statistics.fmean(values) * 1000, 1),
+                "error_rate": round(self.errors.get(endpoint, 0) / len(values), 4),
+                "statuses": {
+                    str(code): count for code, count in sorted(self.statuses[endpoint].items())
+                },
+            }
+        return summary
+
+
+async def chat(
+    client: httpx.AsyncClient,
+    message: str,
+    conversation_id: str | None,
+    stream: bool,
+) -> tuple[int, str | None]:
+    """Send one chat message. Returns the status and conversation id."""
+    body = {"content": message, "conversation_id": conversation_id}
+    if not stream:
+        response = await client.post("/api/v1/chat", json=body)
+        if response.status_code == 200:
+            return response.status_code, response.json()["conversation_id"]
+        return response.status_code, conversation_id
+
+    async with client.stream("POST", "/api/v1/chat/stream", json=body) as response:
+        async for line in response.aiter_lines():
+            if line.startswith("data:") and conversation_id is None:
+                conversation_id = json.loads(line[5:]).get("conversation_id", conversation_id)
+        return response.status_code, conversation_id
+
+
+async def user(
+    user_id: int,
+    client: httpx.AsyncClient,
+    results: Results,
+    deadline: float,
+    args: argparse.Namespace,
+) -> None:
+    """One synthetic user: chats and dashboard reads until the deadline."""
+    rng = random.Random(args.seed * 100_003 + user_id)
+    conversation_id: str | None = None
+    turns = 0
+    etags: dict[str, str] = {}
+    chat_endpoint = "chat_stream" if args.stream else "chat"
+
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        if rng.random() < args.dashboard_ratio:
+            year_month = rng.choice(args.months)
+            headers = {"If-None-Match": etags[year_month]} if year_month in etags else {}
+            try:
+                response = await client.get(
+                    "/api/v1/dashboard", params={"year_month": year_month}, headers=headers
+                )
+                if "etag" in response.headers:
+                    etags[year_month] = response.headers["etag"]
+                status: int | None = response.status_code
+            except httpx.HTTPError:
+                status = None
+            results.record("dashboard", time.perf_counter() - started, status)
+        else:
+            if turns >= args.turns:
+                conversation_id, turns = None, 0
+            try:
+                status, conversation_id = await chat(
+                    client, rng.choice(CHAT_MESSAGES), conversation_id, args.stream
+                )
+                turns += 1
+            except httpx.HTTPError:
+                status = None
+            results.record(chat_endpoint, time.perf_counter() - started, status)
+
+        if args.think_time:
+            await asyncio.sleep(rng.expovariate(1 / args.think_time))
+
+
+async def seed_in_process(months: list[str]) -> None:
+    """Create tables and give each month some data."""
+    from app.db.database import SessionLocal, init_db
+    from app.services.budget_service import BudgetService
+
+    await init_db()
+    async with SessionLocal() as db:
+        service = BudgetService(db)
+        await service.add_fixed_expense("월세", 500_000.0, "주거")
+        for year_month in months:
+            await service.set_monthly_income(year_month, 3_000_000.0)
+            await service.set_savings_plan(year_month, 500_000.0)
+            await service.add_daily_expense(f"{year_month}-01", 12_000.0, "식비")
+
+
+async def make_client(args: argparse.Namespace) -> httpx.AsyncClient:
+    """Client for a remote backend, or an in-process one wired to the mock LLM."""
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    if args.url:
+        return httpx.AsyncClient(base_url=args.url, timeout=timeout, limits=limits)
+
+    from app.llm.client import vllm_client
+    from app.main import app
+    from benchmarks.mock_vllm import MockConfig, create_app
+
+    mock = create_app(
+        MockConfig(
+            ttft=args.ttft,
+            tokens_per_second=args.tokens_per_second,
+            jitter=args.jitter,
+            seed=args.seed,
+        )
+    )
+    vllm_client.client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=mock), timeout=timeout
+    )
+    await seed_in_process(args.months)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://backend", timeout=timeout
+    )
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test and print the report."""
+    client = await make_client(args)
+    results = Results()
+
+    started = time.perf_counter()
+    deadline = started + args.duration
+    async with client:
+        await asyncio.gather(*(user(i, client, results, deadline, args) for i in range(args.users)))
+    elapsed = time.perf_counter() - started
+
+    summary = results.summary(elapsed)
+    target = args.url or f"in-process (mock LLM ttft={args.ttft}s, {args.tokens_per_second} tok/s)"
+    print(f"{args.users} users for {elapsed:.1f}s against {target}")
+    for endpoint, row in summary.items():
+        print(
+            f"{endpoint:>12}: {row['requests']:6d} req {row['throughput_rps']:8.1f} req/s "
+            f"p50={row['p50_ms']:8.1f}ms p95={row['p95_ms']:8.1f}ms p99={row['p99_ms']:8.1f}ms "
+            f"errors={row['error_rate']:.2%} {row['statuses']}"
+        )
+    report = {"users": args.users, "duration_s": round(elapsed, 2), "endpoints": summary}
+
+    if not args.url:
+        from app.monitoring.metrics import llm_cached_prompt_tokens, llm_prompt_tokens
+
+        prompt_tokens = llm_prompt_tokens.sum()
+        cached_tokens = llm_cached_prompt_tokens.sum()
+        report["llm"] = {
+            "requests": llm_prompt_tokens.count(),
+            "prompt_tokens": int(prompt_tokens),
+            "cached_prompt_tokens": int(cached_tokens),
+            "prefix_cache_hit_rate": round(cached_tokens / prompt_tokens, 4) if prompt_tokens else 0.0,
+        }
+        print(
+            f"{'llm':>12}: {report['llm']['requests']:6d} req "
+            f"prompt={report['llm']['prompt_tokens']} tokens, "
+            f"{report['llm']['prefix_cache_hit_rate']:.1%} from the prefix cache"
+        )
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="backend base URL (default: in-process)")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--dashboard-ratio", type=float, default=0.3)
+    parser.add_argument("--turns", type=int, default=5, help="chat turns per conversation")
+    parser.add_argument("--think-time", type=float, default=0.0, help="mean pause between requests (s)")
+    parser.add_argument("--stream", action="store_true", help="use /api/v1/chat/stream")
+    parser.add_argument("--months", nargs="+", default=["2024-05", "2024-06"])
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ttft", type=float, default=0.05, help="mock LLM time to first token (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0, help="mock LLM decode rate")
+    parser.add_argument("--jitter", type=float, default=0.0, help="mock LLM delay jitter fraction")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--max-error-rate", type=float, help="exit non-zero above this error rate")
+    args = parser.parse_args()
+
+    if not args.url:
+        # Keep the in-process run off the real database, and quiet
+        db_path = os.path.join(tempfile.mkdtemp(prefix="budget-load-"), "load.db")
+        os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+        os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    report = asyncio.run(main(args))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.max_error_rate is not None:
+        worst = max((row["error_rate"] for row in report["endpoints"].values()), default=0.0)
+        if worst > args.max_error_rate:
+            print(f"Error rate {worst:.2%} exceeds {args.max_error_rate:.2%}")
+            sys.exit(1)
@@ -0,0 +1,375 @@
+"""Deterministic stand-in for the vLLM OpenAI-compatible server.
+
+Answers /v1/chat/completions with scripted tool calls and answers, so the
+agent loop can be benchmarked without a GPU. The script is picked by
+keywords in the latest user message; the step is the number of assistant
+turns since that message, so a script of N steps takes N LLM round trips.
+Latency is modeled as a fixed time to first token plus completion tokens
+at a fixed decode rate, with optional seeded jitter. Streaming, tool-call
+argument deltas and ``stream_options.include_usage`` are supported.
+Prefix caching is approximated over the request bytes, and reported in
+``usage.prompt_tokens_details.cached_tokens`` like vLLM does with
+``--enable-prompt-tokens-details``.
+
+Usage (from the backend directory):
+    python -m benchmarks.mock_vllm --port 8001 --ttft 0.2 --tokens-per-second 50
+    VLLM_BASE_URL=http://localhost:8001 uvicorn app.main:app
+
+Custom scripts are a JSON list of ``{"match": [keywords], "steps": [...]}``
+where a step is ``{"content": "..."}`` or ``{"tool_calls": [{"name": ...,
+"arguments": {...}}]}``; ``{year_month}`` and ``{today}`` are substituted.
+A step may also carry a ``"repair"`` step, sent instead of moving on when
+the tool calls of the previous turn returned errors, to model a model
+correcting its own arguments (that retry is the one extra round trip).
+A tool call with ``"raw_arguments"`` sends that text verbatim instead of
+its ``arguments`` (e.g. malformed JSON); a request with a ``json_schema``
+response format is answered with the ``arguments`` of such a call, as
+guided decoding would produce them.
+"""
+
+import argparse
+import asyncio
+import datetime
+import hashlib
+import json
+import random
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.agent.tokens import estimate_tokens
+from app.tools.registry import is_error_result
+
+MODEL = "mock-model"
+
+# Characters per prefix cache block (vLLM uses 16-token blocks)
+PREFIX_BLOCK_CHARS = 64
+
+DEFAULT_SCRIPTS: list[dict[str, Any]] = [
+    {
+        "match": ["요약", "분석", "summary"],
+        "steps": [
+            {
+                "tool_calls": [
+                    {"name": "get_monthly_summary", "arguments": {"year_month": "{year_month}"}},
+                    {"name": "get_category_analysis", "arguments": {"year_month": "{year_month}"}},
+                ]
+            },
+            {
+                "content": "이번 달 수입과 지출을 정리했습니다. "
+                "식비 비중이 가장 높으니 외식을 조금 줄여보세요."
+            },
+        ],
+    },
+    {
+        "match": ["썼", "지출 기록", "spent"],
+        "steps": [
+            {
+                "tool_calls": [
+                    {
+                        "name": "add_daily_expense",
+                        "arguments": {
+                            "date": "{today}",
+                            "amount": 12000,
+                            "category": "식비",
+                            "description": "점심",
+                        },
+                    }
+                ]
+            },
+            {"content": "오늘 식비 12,000원을 기록했습니다."},
+        ],
+    },
+    {
+        "match": ["예산", "현황", "status"],
+        "steps": [
+            {
+                "tool_calls": [
+                    {"name": "get_budget_status", "arguments": {"year_month": "{year_month}"}}
+                ]
+            },
+            {"content": "현재 예산 현황입니다. 남은 금액 안에서 계획대로 지출하고 계십니다."},
+        ],
+    },
+    {
+        "match": [],
+        "steps": [{"content": "안녕하세요! 가계부 관리에 대해 무엇이든 물어보세요."}],
+    },
+]
+
+
+@dataclass
+class MockConfig:
+    """Latency model and scripts of the mock server."""
+
+    ttft: float = 0.1
+    tokens_per_second: float = 100.0
+    jitter: float = 0.0
+    seed: int = 0
+    scripts: list[dict[str, Any]] = field(default_factory=lambda: DEFAULT_SCRIPTS)
+    prefix_cache: bool = True
+
+
+class PrefixCache:
+    """Approximation of vLLM's automatic prefix caching.
+
+    The prompt is split into fixed-size blocks, each keyed by a hash chained
+    over every block before it, as vLLM does with token blocks. The cached
+    part of a prompt is its run of leading blocks seen before, so any byte
+    that changes early in the prompt (e.g. a timestamp in the system
+    prompt) invalidates everything after it.
+    """
+
+    def __init__(self, max_blocks: int = 100_000) -> None:
+        """Initialize an empty cache."""
+        self.max_blocks = max_blocks
+        self._blocks: OrderedDict[bytes, None] = OrderedDict()
+
+    def lookup(self, prompt: str) -> int:
+        """Get the number of leading characters cached, then cache the prompt."""
+        cached = 0
+        hit = True
+        digest = b""
+        for start in range(0, len(prompt) - PREFIX_BLOCK_CHARS + 1, PREFIX_BLOCK_CHARS):
+            block = prompt[start : start + PREFIX_BLOCK_CHARS]
+            digest = hashlib.blake2b(digest + block.encode(), digest_size=16).digest()
+            if hit and digest in self._blocks:
+                self._blocks.move_to_end(digest)
+                cached = start + PREFIX_BLOCK_CHARS
+                continue
+            hit = False
+            self._blocks[digest] = None
+            if len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+        return cached
+
+
+def render_prompt(body: dict[str, Any]) -> str:
+    """Render the parts of a request that make up the prompt, as sent."""
+    parts = [json.dumps(body.get("tools") or [], ensure_ascii=False)]
+    parts.extend(json.dumps(message, ensure_ascii=False) for message in body.get("messages", []))
+    return "".join(parts)
+
+
+def _substitute(value: Any) -> Any:
+    """Fill ``{year_month}`` and ``{today}`` placeholders."""
+    today = datetime.date.today()
+    if isinstance(value, str):
+        return value.replace("{year_month}", today.strftime("%Y-%m")).replace(
+            "{today}", today.isoformat()
+        )
+    if isinstance(value, dict):
+        return {key: _substitute(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item) for item in value]
+    return value
+
+
+def pick_step(scripts: list[dict[str, Any]], messages: list[dict[str, Any]]) -> dict[str, Any]:
+    """Pick the scripted reply to a conversation."""
+    last_user = max(
+        (i for i, message in enumerate(messages) if message.get("role") == "user"),
+        default=-1,
+    )
+    user_text = str(messages[last_user].get("content") or "") if last_user >= 0 else ""
+    script = next(
+        (s for s in scripts if any(keyword in user_text for keyword in s["match"])),
+        scripts[-1],
+    )
+    steps = script["steps"]
+
+    # Each assistant turn moves to the next step, unless its tool calls
+    # failed and the step has a repair (tried once)
+    step = 0
+    repairing = False
+    turn = messages[last_user + 1 :]
+    for i, message in enumerate(turn):
+        if message.get("role") != "assistant":
+            continue
+        results = []
+        for reply in turn[i + 1 :]:
+            if reply.get("role") != "tool":
+                break
+            results.append(str(reply.get("content") or ""))
+        current = steps[min(step, len(steps) - 1)]
+        if "repair" in current and not repairing and any(map(is_error_result, results)):
+            repairing = True
+        else:
+            step += 1
+            repairing = False
+
+    current = steps[min(step, len(steps) - 1)]
+    return _substitute(current["repair"] if repairing else current)
+
+
+def create_app(config: MockConfig) -> FastAPI:
+    """Create the mock server app."""
+    app = FastAPI(title="Mock vLLM")
+    rng = random.Random(config.seed)
+    prefix_cache = PrefixCache()
+
+    def delay(seconds: float) -> float:
+        if config.jitter:
+            seconds *= 1 + rng.uniform(-config.jitter, config.jitter)
+        return max(seconds, 0.0)
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/v1/models")
+    async def models() -> dict[str, Any]:
+        return {"object": "list", "data": [{"id": MODEL, "object": "model"}]}
+
+    @app.post("/v1/chat/completions", response_model=None)
+    async def chat_completions(request: Request) -> JSONResponse | StreamingResponse:
+        body = await request.json()
+        messages = body.get("messages", [])
+        step = pick_step(config.scripts, messages)
+
+        content = step.get("content")
+        tool_calls = [
+            {
+                "id": f"call_{uuid.uuid4().hex[:12]}",
+                "type": "function",
+                "function": {
+                    "name": call["name"],
+                    "arguments": call.get("raw_arguments")
+                    or json.dumps(call["arguments"], ensure_ascii=False),
+                },
+            }
+            for call in step.get("tool_calls", [])
+        ]
+        if (body.get("response_format") or {}).get("type") == "json_schema":
+            guided = [call for call in step.get("tool_calls", []) if "raw_arguments" in call]
+            content = json.dumps(guided[0]["arguments"] if guided else {}, ensure_ascii=False)
+            tool_calls = []
+        prompt_tokens = estimate_tokens(json.dumps(messages, ensure_ascii=False))
+        completion_tokens = estimate_tokens(content or "") + sum(
+            estimate_tokens(tc["function"]["name"] + tc["function"]["arguments"])
+            for tc in tool_calls
+        )
+        usage: dict[str, Any] = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        if config.prefix_cache:
+            prompt = render_prompt(body)
+            cached_tokens = estimate_tokens(prompt[: prefix_cache.lookup(prompt)])
+            usage["prompt_tokens_details"] = {"cached_tokens": min(cached_tokens, prompt_tokens)}
+        finish_reason = "tool_calls" if tool_calls else "stop"
+        response_id = f"chatcmpl-{uuid.uuid4().hex[:16]}"
+
+        if not body.get("stream"):
+            await asyncio.sleep(delay(config.ttft + completion_tokens / config.tokens_per_second))
+            message: dict[str, Any] = {"role": "assistant", "content": content}
+            if tool_calls:
+                message["tool_calls"] = tool_calls
+            return JSONResponse(
+                {
+                    "id": response_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": MODEL,
+                    "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+                    "usage": usage,
+                }
+            )
+
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+
+        async def stream() -> AsyncIterator[str]:
+            def chunk(delta: dict[str, Any], finish: str | None = None) -> str:
+                data = {
+                    "id": response_id,
+                    "object": "chat.completion.chunk",
+                    "model": MODEL,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+                }
+                return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+            await asyncio.sleep(delay(config.ttft))
+            yield chunk({"role": "assistant"})
+
+            # A few characters per chunk, paced at the decode rate
+            for start in range(0, len(content or ""), 4):
+                piece = content[start : start + 4]
+                await asyncio.sleep(delay(estimate_tokens(piece) / config.tokens_per_second))
+                yield chunk({"content": piece})
+
+            for index, tc in enumerate(tool_calls):
+                arguments = tc["function"]["arguments"]
+                yield chunk(
+                    {
+                        "tool_calls": [
+                            {
+                                "index": index,
+                                "id": tc["id"],
+                                "type": "function",
+                                "function": {"name": tc["function"]["name"], "arguments": ""},
+                            }
+                        ]
+                    }
+                )
+                for start in range(0, len(arguments), 8):
+                    piece = arguments[start : start + 8]
+                    await asyncio.sleep(delay(estimate_tokens(piece) / config.tokens_per_second))
+                    yield chunk(
+                        {"tool_calls": [{"index": index, "function": {"arguments": piece}}]}
+                    )
+
+            yield chunk({}, finish_reason)
+            if include_usage:
+                data = {
+                    "id": response_id,
+                    "object": "chat.completion.chunk",
+                    "model": MODEL,
+                    "choices": [],
+                    "usage": usage,
+                }
+                yield f"data: {json.dumps(data)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return app
+
+
+def load_scripts(path: str | None) -> list[dict[str, Any]]:
+    """Load scripts from a JSON file, or use the built-in ones."""
+    if path is None:
+        return DEFAULT_SCRIPTS
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--ttft", type=float, default=0.1, help="time to first token (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=100.0)
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- fraction of each delay")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--script", help="JSON file with custom scripts")
+    parser.add_argument("--no-prefix-cache", action="store_true", help="report no cached tokens")
+    args = parser.parse_args()
+
+    mock_config = MockConfig(
+        ttft=args.ttft,
+        tokens_per_second=args.tokens_per_second,
+        jitter=args.jitter,
+        seed=args.seed,
+        scripts=load_scripts(args.script),
+        prefix_cache=not args.no_prefix_cache,
+    )
+    uvicorn.run(create_app(mock_config), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,209 @@
+"""Synthetic multi-year budget history for benchmarks.
+
+Generates a deterministic (seeded) household history: monthly income with
+raises and bonus months, fixed expenses (some cancelled), savings plans,
+and daily expenses spread over many categories with weekday/weekend and
+payday patterns and log-normal amounts. Rows are inserted in large
+executemany batches on a blocking engine, then the month/category rollup
+is rebuilt, so millions of rows take a minute or two on SQLite.
+
+Usage (from the backend directory):
+    python -m benchmarks.seed_data --database-url sqlite:///./bench.db --rows 2000000
+"""
+
+import argparse
+import datetime
+import math
+import random
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy import create_engine, delete, func, insert, select
+from sqlalchemy.engine import Engine
+
+from app.db.database import Base
+from app.models.budget import DailyExpense, FixedExpense, MonthlyIncome, SavingsPlan
+from app.models.rollup import MonthlyCategoryRollup
+from app.services.versioning import ALL_MONTHS, bump_statement
+
+BATCH_SIZE = 20_000
+
+# (category, relative frequency, median amount in won, descriptions)
+CATEGORIES: list[tuple[str, float, float, list[str]]] = [
+    ("식비", 30, 9_000, ["점심", "저녁", "장보기", "배달", "간식"]),
+    ("카페", 14, 5_000, ["커피", "디저트"]),
+    ("교통", 16, 2_500, ["버스", "지하철", "택시", "주유"]),
+    ("쇼핑", 8, 35_000, ["옷", "생활용품", "온라인 쇼핑"]),
+    ("문화/여가", 6, 20_000, ["영화", "공연", "여행", "취미"]),
+    ("의료", 3, 15_000, ["병원", "약국"]),
+    ("교육", 2, 50_000, ["도서", "강의"]),
+    ("경조사", 1.5, 50_000, ["축의금", "조의금", "선물"]),
+    ("반려동물", 2, 25_000, ["사료", "병원"]),
+    ("통신", 1, 30_000, ["데이터 추가"]),
+    ("미용", 2, 20_000, ["미용실", "화장품"]),
+    ("기타", 4.5, 10_000, [None]),
+]
+
+FIXED_EXPENSES = [
+    ("월세", 650_000.0, "주거"),
+    ("관리비", 120_000.0, "주거"),
+    ("휴대폰 요금", 55_000.0, "통신"),
+    ("인터넷", 33_000.0, "통신"),
+    ("보험", 140_000.0, "보험"),
+    ("OTT 구독", 17_000.0, "구독"),
+    ("음악 스트리밍", 11_000.0, "구독"),
+    ("헬스장", 70_000.0, "건강"),
+]
+
+
+def month_starts(start: datetime.date, months: int) -> Iterator[datetime.date]:
+    """Yield the first day of ``months`` consecutive months."""
+    year, month = start.year, start.month
+    for _ in range(months):
+        yield datetime.date(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def spending_factor(day: datetime.date) -> float:
+    """Relative spending of a day: more on weekends and just after payday (the 25th)."""
+    factor = 1.3 if day.weekday() >= 5 else 1.0
+    if 25 <= day.day <= 28:
+        factor *= 1.2
+    return factor
+
+
+def daily_expense_rows(
+    rng: random.Random,
+    start: datetime.date,
+    days: int,
+    rows: int,
+) -> Iterator[dict[str, Any]]:
+    """Yield about ``rows`` daily expenses over ``days`` days."""
+    names = [c[0] for c in CATEGORIES]
+    weights = [c[1] for c in CATEGORIES]
+    by_name = {c[0]: c for c in CATEGORIES}
+    all_days = [start + datetime.timedelta(days=offset) for offset in range(days)]
+    per_day = rows / sum(spending_factor(day) for day in all_days)
+
+    for day in all_days:
+        expected = per_day * spending_factor(day)
+        count = max(0, round(rng.gauss(expected, math.sqrt(expected))))
+        year_month = day.strftime("%Y-%m")
+        for category in rng.choices(names, weights, k=count):
+            _, _, median, descriptions = by_name[category]
+            amount = round(median * rng.lognormvariate(0, 0.6), -2) or 100.0
+            yield {
+                "date": day,
+                "year_month": year_month,
+                "amount": amount,
+                "category": category,
+                "description": rng.choice(descriptions),
+            }
+
+
+def seed(engine: Engine, rows: int, years: int, seed_value: int = 42) -> int:
+    """Replace the database contents with a synthetic history.
+
+    Returns the number of daily expenses inserted.
+    """
+    rng = random.Random(seed_value)
+    Base.metadata.create_all(engine)
+    today = datetime.date.today()
+    start = datetime.date(today.year - years, today.month, 1)
+    months = list(month_starts(start, years * 12 + 1))
+
+    with engine.begin() as conn:
+        for model in (
+            DailyExpense,
+            MonthlyCategoryRollup,
+            FixedExpense,
+            MonthlyIncome,
+            SavingsPlan,
+        ):
+            conn.execute(delete(model))
+
+        salary = 3_200_000.0
+        income_rows, savings_rows = [], []
+        for first in months:
+            if first.month == 1:
+                salary = round(salary * rng.uniform(1.02, 1.06), -4)
+            bonus = salary if first.month in (1, 7) else 0.0
+            year_month = first.strftime("%Y-%m")
+            income_rows.append(
+                {
+                    "year_month": year_month,
+                    "amount": salary + bonus,
+                    "description": "급여 + 상여" if bonus else "급여",
+                }
+            )
+            target = round(salary * 0.2, -4)
+            savings_rows.append(
+                {
+                    "year_month": year_month,
+                    "target_amount": target,
+                    "actual_amount": round(target * rng.uniform(0.5, 1.2), -3),
+                }
+            )
+        conn.execute(insert(MonthlyIncome), income_rows)
+        conn.execute(insert(SavingsPlan), savings_rows)
+        conn.execute(
+            insert(FixedExpense),
+            [
+                {
+                    "name": name,
+                    "amount": amount,
+                    "category": category,
+                    "is_active": rng.random() < 0.8,
+                }
+                for name, amount, category in FIXED_EXPENSES
+            ],
+        )
+
+    inserted = 0
+    batch: list[dict[str, Any]] = []
+    days = (today - start).days + 1
+    for row in daily_expense_rows(rng, start, days, rows):
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            with engine.begin() as conn:
+                conn.execute(insert(DailyExpense), batch)
+            inserted += len(batch)
+            batch = []
+    if batch:
+        with engine.begin() as conn:
+            conn.execute(insert(DailyExpense), batch)
+        inserted += len(batch)
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(MonthlyCategoryRollup).from_select(
+                ["year_month", "category", "total", "count"],
+                select(
+                    DailyExpense.year_month,
+                    DailyExpense.category,
+                    func.sum(DailyExpense.amount),
+                    func.count(),
+                ).group_by(DailyExpense.year_month, DailyExpense.category),
+            )
+        )
+        # Invalidates running servers' caches and dashboard ETags
+        conn.execute(bump_statement(engine.dialect.name, [ALL_MONTHS]))
+
+    return inserted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite:///./bench.db")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="daily expenses")
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    sync_engine = create_engine(args.database_url)
+    count = seed(sync_engine, args.rows, args.years, args.seed)
+    sync_engine.dispose()
+    elapsed = time.perf_counter() - started
+    print(f"Seeded {count} daily expenses over {args.years} years in {elapsed:.1f}s")
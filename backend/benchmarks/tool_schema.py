@@ -0,0 +1,52 @@
+"""Per-iteration cost of building the tools part of a chat request.
+
+"rebuild" is what every agent iteration used to do: build each tool's
+ToolDefinition, convert it to OpenAI format and JSON-encode the request.
+"cached" uses the registry's compiled tool list and pre-encoded JSON.
+
+Usage (from the backend directory):
+    python -m benchmarks.tool_schema --iterations 2000
+"""
+
+import argparse
+import json
+import timeit
+
+import app.tools.builtin  # noqa: F401
+from app.llm.client import VLLMClient
+from app.tools.registry import tool_registry
+
+MESSAGES = [
+    {"role": "system", "content": "당신은 가계부 관리를 도와주는 AI 어시스턴트입니다."},
+    {"role": "user", "content": "이번 달 예산 현황 알려줘"},
+]
+
+
+def rebuild() -> bytes:
+    """Old path: rebuild schemas, then encode the whole payload."""
+    tools = [tool.to_openai_format() for tool in tool_registry.get_all()]
+    payload = {"model": "m", "messages": MESSAGES, "tools": tools, "tool_choice": "auto"}
+    return json.dumps(payload).encode()
+
+
+def cached(client: VLLMClient) -> bytes:
+    """New path: cached schemas spliced into the encoded payload."""
+    payload = client._build_payload(MESSAGES, None, 0.7, 2048)
+    return client._encode_body(payload, tool_registry.get_openai_tools_json())
+
+
+def main(iterations: int) -> None:
+    """Time both paths."""
+    client = VLLMClient(base_url="http://localhost:0")
+    cases = {"rebuild": rebuild, "cached": lambda: cached(client)}
+
+    print(f"{len(tool_registry.get_all())} tools, {iterations} iterations")
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=iterations, repeat=5))
+        print(f"{name:>8}: {seconds / iterations * 1e6:8.1f} us/iteration, {len(fn())} bytes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    main(parser.parse_args().iterations)
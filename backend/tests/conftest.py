@@ -0,0 +1,42 @@
+"""Shared fixtures; points the app at a throwaway database before any test imports it.
+
+The app reads its settings at import time, so this has to happen here.
+"""
+
+import asyncio
+import os
+import tempfile
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import pytest
+
+os.environ["DATABASE_URL"] = (
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='budget-tests-'), 'test.db')}"
+)
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("TRACING_ENABLED", "false")
+
+T = TypeVar("T")
+
+
+@pytest.fixture
+def run() -> Callable[[Awaitable[T]], T]:
+    """Run a coroutine on a fresh event loop against an initialized database.
+
+    Pooled connections belong to the loop that opened them, so the engine
+    is disposed before the loop closes.
+    """
+    from app.db.database import engine, init_db
+
+    def run(coro: Awaitable[T]) -> T:
+        async def main() -> T:
+            try:
+                await init_db()
+                return await coro
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
@@ -0,0 +1,126 @@
+"""Admission control: concurrency limit, queueing and rejections."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.agent.admission import AdmissionController, AdmissionRejected
+from app.api.v1 import chat as chat_module
+
+
+def make_controller(**overrides: float) -> AdmissionController:
+    limits = {
+        "max_concurrency": 1,
+        "max_queue": 1,
+        "queue_timeout": 1.0,
+        "max_pending_per_conversation": 2,
+        "retry_after": 7,
+    }
+    limits.update(overrides)
+    return AdmissionController(**limits)
+
+
+def test_too_many_requests_on_one_conversation_is_429() -> None:
+    controller = make_controller(max_concurrency=4)
+
+    async def scenario() -> AdmissionRejected:
+        first = await controller.acquire("conv")
+        second = asyncio.create_task(controller.acquire("conv"))
+        await asyncio.sleep(0.01)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("conv")
+        first.release()
+        (await second).release()
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+    assert rejected.status_code == 429
+    assert rejected.retry_after == 7
+    assert controller.active == 0
+    assert controller._conversations == {}
+
+
+def test_requests_on_one_conversation_run_one_at_a_time() -> None:
+    controller = make_controller(max_concurrency=4)
+
+    async def scenario() -> list[str]:
+        order: list[str] = []
+        first = await controller.acquire("conv")
+        second = asyncio.create_task(controller.acquire("conv"))
+        other = await controller.acquire("other")
+        await asyncio.sleep(0.01)
+        order.append(f"second done: {second.done()}")
+        first.release()
+        admission = await second
+        order.append(f"second done: {second.done()}")
+        admission.release()
+        other.release()
+        return order
+
+    assert asyncio.run(scenario()) == ["second done: False", "second done: True"]
+
+
+def test_full_queue_is_503() -> None:
+    controller = make_controller()
+
+    async def scenario() -> AdmissionRejected:
+        running = await controller.acquire("a")
+        queued = asyncio.create_task(controller.acquire("b"))
+        await asyncio.sleep(0.01)
+        assert controller.waiting == 1
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("c")
+        running.release()
+        (await queued).release()
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+    assert rejected.status_code == 503
+    assert controller.active == 0
+    assert controller.waiting == 0
+
+
+def test_queue_timeout_is_503_and_frees_the_queue() -> None:
+    controller = make_controller(queue_timeout=0.01)
+
+    async def scenario() -> AdmissionRejected:
+        running = await controller.acquire("a")
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("b")
+        running.release()
+        (await controller.acquire("b")).release()
+        return rejected.value
+
+    assert asyncio.run(scenario()).status_code == 503
+    assert controller.waiting == 0
+    assert controller._conversations == {}
+
+
+def test_release_is_idempotent() -> None:
+    controller = make_controller()
+
+    async def scenario() -> None:
+        admission = await controller.acquire("a")
+        admission.release()
+        admission.release()
+        (await controller.acquire("b")).release()
+
+    asyncio.run(scenario())
+    assert controller.active == 0
+
+
+def test_endpoint_rejection_carries_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    controller = make_controller(max_pending_per_conversation=1)
+    monkeypatch.setattr(chat_module, "admission_controller", controller)
+
+    async def scenario() -> HTTPException:
+        admission = await chat_module.admit("conv")
+        with pytest.raises(HTTPException) as rejected:
+            await chat_module.admit("conv")
+        admission.release()
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+    assert rejected.status_code == 429
+    assert rejected.headers == {"Retry-After": "7"}
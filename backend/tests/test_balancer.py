@@ -0,0 +1,84 @@
+"""Load balancer routing and ejection."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.llm.balancer import LoadBalancer
+
+URLS = ["http://vllm-0", "http://vllm-1", "http://vllm-2"]
+
+
+def test_same_conversation_sticks_to_one_backend() -> None:
+    balancer = LoadBalancer(URLS)
+    chosen = {balancer.choose("conv-1").url for _ in range(20)}
+    assert len(chosen) == 1
+    spread = {balancer.choose(f"conv-{i}").url for i in range(50)}
+    assert len(spread) > 1
+
+
+def test_busy_backend_loses_stickiness() -> None:
+    balancer = LoadBalancer(URLS, sticky_slack=2)
+    preferred = balancer.choose("conv-1")
+    preferred.outstanding = 2
+    assert balancer.choose("conv-1") is preferred
+    preferred.outstanding = 3
+    assert balancer.choose("conv-1") is not preferred
+
+
+def test_without_key_picks_least_loaded() -> None:
+    balancer = LoadBalancer(URLS)
+    balancer.backends[0].outstanding = 2
+    balancer.backends[1].outstanding = 1
+    assert {balancer.choose().url for _ in range(20)} == {"http://vllm-2"}
+
+
+def test_repeated_failures_eject_the_backend() -> None:
+    balancer = LoadBalancer(URLS, eject_after_failures=3)
+    backend = balancer.choose("conv-1")
+    balancer.record_failure(backend)
+    balancer.record_success(backend)
+    balancer.record_failure(backend)
+    balancer.record_failure(backend)
+    assert backend.available
+
+    balancer.record_failure(backend)
+    assert not backend.available
+    assert all(balancer.choose("conv-1") is not backend for _ in range(20))
+
+
+def test_all_backends_ejected_still_routes() -> None:
+    balancer = LoadBalancer(URLS, eject_after_failures=1)
+    for backend in balancer.backends:
+        balancer.record_failure(backend)
+    assert balancer.choose("conv-1") in balancer.backends
+
+
+@pytest.mark.parametrize("failure", ["status", "error"])
+def test_probe_ejects_and_readmits(failure: str) -> None:
+    balancer = LoadBalancer(URLS[:2], eject_after_failures=3)
+    healthy = {url: True for url in URLS[:2]}
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        url = f"{request.url.scheme}://{request.url.host}"
+        if healthy[url]:
+            return httpx.Response(200)
+        if failure == "error":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(503)
+
+    async def probe() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as client:
+            await balancer.probe(client)
+
+    down, up = balancer.backends
+    healthy[down.url] = False
+    asyncio.run(probe())
+    assert not down.available
+    assert up.available
+
+    healthy[down.url] = True
+    asyncio.run(probe())
+    assert down.available
+    assert down.consecutive_failures == 0
@@ -0,0 +1,47 @@
+"""Dashboard ETags and cached reads must follow writes made outside this process."""
+
+import asyncio
+
+import httpx
+
+from app.db.database import engine, init_db
+from app.main import app
+from app.models.budget import MonthlyIncome
+from app.services.versioning import bump_statement
+
+YEAR_MONTH = "2031-02"
+
+
+def test_etag_changes_on_writes_from_other_workers() -> None:
+    async def scenario() -> None:
+        await init_db()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+            async def get(etag: str | None = None) -> httpx.Response:
+                headers = {"If-None-Match": etag} if etag else {}
+                return await client.get(
+                    "/api/v1/dashboard", params={"year_month": YEAR_MONTH}, headers=headers
+                )
+
+            first = await get()
+            assert first.status_code == 200
+            assert first.json()["income"] is None
+            etag = first.headers["etag"]
+            assert (await get(etag)).status_code == 304
+
+            # Another worker or a command line tool: only the database changes
+            async with engine.begin() as conn:
+                await conn.execute(
+                    MonthlyIncome.__table__.insert().values(year_month=YEAR_MONTH, amount=1000.0)
+                )
+                await conn.execute(bump_statement(conn.dialect.name, [YEAR_MONTH]))
+
+            second = await get(etag)
+            assert second.status_code == 200
+            assert second.headers["etag"] != etag
+            assert second.json()["income"]["amount"] == 1000.0
+            assert (await get(second.headers["etag"])).status_code == 304
+        await engine.dispose()
+
+    asyncio.run(scenario())
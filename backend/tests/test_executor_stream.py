@@ -0,0 +1,97 @@
+"""Streaming agent runs send tool results as the calls finish."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+from app.agent.executor import AgentEvent, AgentExecutor
+from app.tools.base import BaseTool, ToolParameter
+from app.tools.registry import ToolRegistry
+
+
+class Echo(BaseTool):
+    """A read-only tool that answers after ``delay`` seconds."""
+
+    name = "echo"
+    description = "Echo the text."
+    parameters = [ToolParameter(name="text", type="string", description="Text")]
+    read_only = True
+
+    async def execute(self, text: str, **kwargs: Any) -> str:
+        await asyncio.sleep(float(text))
+        return f"echo {text}"
+
+
+def tool_call(index: int, text: str) -> dict[str, Any]:
+    return {
+        "choices": [
+            {
+                "delta": {
+                    "tool_calls": [
+                        {
+                            "index": index,
+                            "id": f"call_{index}",
+                            "function": {"name": "echo", "arguments": f'{{"text": "{text}"}}'},
+                        }
+                    ]
+                },
+                "finish_reason": None,
+            }
+        ]
+    }
+
+
+def finish(content: str | None, reason: str) -> dict[str, Any]:
+    return {"choices": [{"delta": {"content": content}, "finish_reason": reason}]}
+
+
+class SlowStreamLLM:
+    """Calls two tools, then keeps generating until the first result is sent."""
+
+    guided_tool_calls = False
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.result_seen = asyncio.Event()
+        self.waited_for_result = False
+
+    async def chat_completion_stream(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        self.requests += 1
+        if self.requests > 1:
+            yield finish("끝", "stop")
+            return
+        yield tool_call(0, "0.01")
+        yield tool_call(1, "0.2")
+        try:
+            await asyncio.wait_for(self.result_seen.wait(), timeout=2)
+            self.waited_for_result = True
+        except asyncio.TimeoutError:
+            pass
+        yield finish(None, "tool_calls")
+
+
+def test_results_are_sent_as_calls_finish() -> None:
+    llm = SlowStreamLLM()
+    tools = ToolRegistry()
+    tools.register(Echo())
+    executor = AgentExecutor(llm_client=llm, tools=tools, system_prompt="test")
+
+    async def collect() -> list[AgentEvent]:
+        events = []
+        async for event in executor.run_stream("hi"):
+            events.append(event)
+            if event.type == "tool_result":
+                llm.result_seen.set()
+        return events
+
+    events = asyncio.run(collect())
+    assert llm.waited_for_result
+    assert [(e.type, e.data.get("id")) for e in events if e.type.startswith("tool")] == [
+        ("tool_start", "call_0"),
+        ("tool_start", "call_1"),
+        ("tool_result", "call_0"),
+        ("tool_result", "call_1"),
+    ]
+    assert events[-1].data["content"] == "끝"
+    tool_messages = [m for m in executor.memory.get_messages() if m["role"] == "tool"]
+    assert [m["content"] for m in tool_messages] == ["echo 0.01", "echo 0.2"]
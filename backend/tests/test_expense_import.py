@@ -0,0 +1,110 @@
+"""Tests for the streaming bulk import parsers."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from app.services.expense_import import (
+    MAX_CSV_ROW_CHARS,
+    ImportFormatError,
+    iter_csv_rows,
+    iter_json_array,
+)
+
+
+def parse(data: bytes, chunk_size: int, parser: Any = iter_json_array) -> list[Any]:
+    """Run a parser over an upload split into chunks of ``chunk_size`` bytes."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+
+    async def collect() -> list[Any]:
+        return [record async for record in parser(chunks())]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"[]", []),
+        (b"[1, 2, 3]", [1, 2, 3]),
+        (
+            '[12345, true, null, {"a": "가\\u00e9"}, -1.5e3]'.encode(),
+            [12345, True, None, {"a": "가é"}, -1500.0],
+        ),
+    ],
+)
+def test_json_array_any_chunking(data: bytes, expected: list[Any]) -> None:
+    for chunk_size in range(1, len(data) + 1):
+        assert parse(data, chunk_size) == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"[1,,,2]", b"[1,]", b"[,1]", b"[1 2]", b"[1, 2", b'{"a": 1}', b"[tru]"],
+)
+def test_json_array_malformed(data: bytes) -> None:
+    for chunk_size in range(1, len(data) + 1):
+        with pytest.raises(ImportFormatError):
+            parse(data, chunk_size)
+
+
+def test_json_array_fails_without_buffering_the_rest() -> None:
+    seen: list[int] = []
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b"[1, x"
+        for index in range(100):
+            seen.append(index)
+            yield b"y" * 100
+
+    async def collect() -> list[Any]:
+        return [record async for record in iter_json_array(chunks())]
+
+    with pytest.raises(ImportFormatError):
+        asyncio.run(collect())
+    assert len(seen) <= 1
+
+
+@pytest.mark.parametrize("parser", [iter_json_array, iter_csv_rows])
+def test_invalid_utf8(parser: Any) -> None:
+    data = b'date,amount,category\n2024-05-01,1,"\xff"\n' if parser is iter_csv_rows else b'[1, "\xff"]'
+    with pytest.raises(ImportFormatError):
+        parse(data, 4, parser)
+
+
+def test_csv_rows_any_chunking() -> None:
+    data = (
+        "\ufeffDate,Amount,Category,Description\n"
+        '2024-05-01,12000,식비,"점심, 김밥"\n'
+        '2024-05-02,4500,카페,"두 줄\n메모 ""인용"""\n'
+        "2024-05-03,3000,교통,\n"
+    ).encode()
+    expected = [
+        {"date": "2024-05-01", "amount": "12000", "category": "식비", "description": "점심, 김밥"},
+        {"date": "2024-05-02", "amount": "4500", "category": "카페", "description": '두 줄\n메모 "인용"'},
+        {"date": "2024-05-03", "amount": "3000", "category": "교통", "description": None},
+    ]
+    for chunk_size in range(1, len(data) + 1):
+        assert parse(data, chunk_size, iter_csv_rows) == expected
+
+
+def test_csv_unclosed_quote_fails_without_buffering_the_rest() -> None:
+    seen: list[int] = []
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b'date,amount,category\n2024-05-01,1,"'
+        for index in range(100):
+            seen.append(index)
+            yield b"x" * (MAX_CSV_ROW_CHARS // 10)
+
+    async def collect() -> list[Any]:
+        return [record async for record in iter_csv_rows(chunks())]
+
+    with pytest.raises(ImportFormatError):
+        asyncio.run(collect())
+    assert len(seen) <= 11
@@ -0,0 +1,145 @@
+"""VLLMClient retries and backoff."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.llm import client as client_module
+from app.llm.client import VLLMClient
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+CHUNK = {"choices": [{"delta": {"content": "안녕"}, "finish_reason": "stop"}]}
+COMPLETION = {"choices": [{"message": {"content": "안녕"}, "finish_reason": "stop"}]}
+
+
+class Body(httpx.AsyncByteStream):
+    """A response body that records when it is closed."""
+
+    def __init__(self, data: bytes, log: list[str]) -> None:
+        self.data = data
+        self.log = log
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.data
+
+    async def aclose(self) -> None:
+        self.log.append("closed")
+
+
+def make_client(
+    statuses: list[int | type[Exception]], log: list[str], monkeypatch: pytest.MonkeyPatch
+) -> VLLMClient:
+    """A client whose server answers with ``statuses`` (or raises them) in turn, then 200."""
+    replies = iter(statuses)
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        status = next(replies, 200)
+        log.append(f"request {status if isinstance(status, int) else status.__name__}")
+        if not isinstance(status, int):
+            raise status("connection failed", request=request)
+        if json.loads(request.content).get("stream"):
+            data = f"data: {json.dumps(CHUNK)}\n\ndata: [DONE]\n\n" if status == 200 else ""
+        else:
+            data = json.dumps(COMPLETION) if status == 200 else ""
+        headers = {"Retry-After": "1"} if status == 429 else {}
+        return httpx.Response(status, headers=headers, stream=Body(data.encode(), log))
+
+    async def sleep(delay: float) -> None:
+        log.append(f"sleep {delay:g}")
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", sleep)
+    llm = VLLMClient(base_url="http://vllm", max_retries=2)
+    llm.client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    return llm
+
+
+def stream(llm: VLLMClient) -> list[dict[str, Any]]:
+    async def collect() -> list[dict[str, Any]]:
+        return [chunk async for chunk in llm.chat_completion_stream(MESSAGES)]
+
+    return asyncio.run(collect())
+
+
+def test_stream_retry_sleeps_after_closing_the_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    log: list[str] = []
+    llm = make_client([503, 429], log, monkeypatch)
+    assert stream(llm) == [CHUNK]
+    assert log[0] == "request 503"
+    assert log[1] == "closed"
+    assert log[2].startswith("sleep")
+    assert log[3:] == ["request 429", "closed", "sleep 1", "request 200", "closed"]
+
+
+def complete(llm: VLLMClient) -> dict[str, Any]:
+    return asyncio.run(llm.chat_completion(MESSAGES))
+
+
+def test_retries_transient_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    log: list[str] = []
+    llm = make_client([httpx.ConnectError, 502], log, monkeypatch)
+    assert complete(llm) == COMPLETION
+    assert [entry for entry in log if entry.startswith("request")] == [
+        "request ConnectError",
+        "request 502",
+        "request 200",
+    ]
+    assert sum(entry.startswith("sleep") for entry in log) == 2
+
+
+def test_gives_up_after_max_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    log: list[str] = []
+    llm = make_client([503, 503, 503, 503], log, monkeypatch)
+    with pytest.raises(httpx.HTTPStatusError):
+        complete(llm)
+    assert log.count("request 503") == 3
+
+
+def test_does_not_retry_client_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    log: list[str] = []
+    llm = make_client([400], log, monkeypatch)
+    with pytest.raises(httpx.HTTPStatusError):
+        stream(llm)
+    assert log == ["request 400", "closed"]
+
+
+def test_stream_is_not_retried_once_started(monkeypatch: pytest.MonkeyPatch) -> None:
+    log: list[str] = []
+    llm = make_client([], log, monkeypatch)
+
+    class BrokenBody(Body):
+        async def __aiter__(self) -> AsyncIterator[bytes]:
+            yield f"data: {json.dumps(CHUNK)}\n\n".encode()
+            raise httpx.ReadError("connection reset")
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        log.append("request")
+        return httpx.Response(200, stream=BrokenBody(b"", log))
+
+    llm.client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    chunks: list[dict[str, Any]] = []
+
+    async def collect() -> None:
+        async for chunk in llm.chat_completion_stream(MESSAGES):
+            chunks.append(chunk)
+
+    with pytest.raises(httpx.ReadError):
+        asyncio.run(collect())
+    assert chunks == [CHUNK]
+    assert log.count("request") == 1
+
+
+def test_backoff_delay() -> None:
+    settings = get_settings()
+    llm = VLLMClient(base_url="http://vllm")
+    retry_after = httpx.Response(429, headers={"Retry-After": "3"})
+    assert llm._retry_delay(0, retry_after) == 3.0
+    too_long = httpx.Response(429, headers={"Retry-After": "3600"})
+    assert llm._retry_delay(0, too_long) == settings.vllm_retry_backoff_max
+    for attempt in range(8):
+        ceiling = min(settings.vllm_retry_backoff_base * 2**attempt, settings.vllm_retry_backoff_max)
+        assert all(0 <= llm._retry_delay(attempt) <= ceiling for _ in range(50))
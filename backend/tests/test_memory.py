@@ -0,0 +1,84 @@
+"""Conversation memory trimming by token budget and whole turns."""
+
+from typing import Any
+
+from app.agent.memory import ConversationMemory
+
+
+def add_turn(memory: ConversationMemory, index: int, tool_calls: int = 2) -> None:
+    """A question, an assistant message calling tools, their results and an answer."""
+    memory.add_user_message(f"질문 {index} " + "가" * 40)
+    calls = [
+        {
+            "id": f"call_{index}_{n}",
+            "type": "function",
+            "function": {"name": "get_monthly_income", "arguments": "{}"},
+        }
+        for n in range(tool_calls)
+    ]
+    memory.add_assistant_message(content=None, tool_calls=calls)
+    for call in calls:
+        memory.add_tool_result(call["id"], "get_monthly_income", "결과 " + "나" * 60)
+    memory.add_assistant_message(content=f"답변 {index}")
+
+
+def assert_tool_results_follow_their_calls(messages: list[dict[str, Any]]) -> None:
+    called: set[str] = set()
+    for message in messages:
+        for call in message.get("tool_calls") or []:
+            called.add(call["id"])
+        if message["role"] == "tool":
+            assert message["tool_call_id"] in called, message
+
+
+def test_trims_whole_turns_to_the_token_budget() -> None:
+    memory = ConversationMemory(system_prompt="system", max_tokens=1500, token_counter=len)
+    for index in range(20):
+        add_turn(memory, index)
+        assert memory.count_tokens() <= 1500
+        assert memory.messages[0].role == "user"
+        assert_tool_results_follow_their_calls(memory.get_messages())
+
+    # The latest turns are kept, the oldest dropped
+    questions = [m.content.split()[1] for m in memory.messages if m.role == "user"]
+    assert questions == [str(index) for index in range(20 - len(questions), 20)]
+    assert 1 < len(questions) < 20
+
+
+def test_keeps_the_current_turn_even_over_budget() -> None:
+    memory = ConversationMemory(system_prompt="system", max_tokens=100, token_counter=len)
+    add_turn(memory, 0)
+    add_turn(memory, 1, tool_calls=5)
+    assert memory.messages[0].content.startswith("질문 1")
+    assert len(memory.messages) == 8
+    assert_tool_results_follow_their_calls(memory.get_messages())
+
+
+def test_trims_by_message_count() -> None:
+    memory = ConversationMemory(system_prompt="system", max_messages=10)
+    for index in range(5):
+        add_turn(memory, index)
+    # 5 messages per turn: only the last two turns fit
+    assert [m.content for m in memory.messages if m.role == "user"] == [
+        "질문 3 " + "가" * 40,
+        "질문 4 " + "가" * 40,
+    ]
+
+
+def test_dropped_turns_are_summarized_within_budget() -> None:
+    memory = ConversationMemory(
+        system_prompt="system",
+        max_tokens=600,
+        token_counter=len,
+        summarize=True,
+        summary_max_tokens=120,
+    )
+    for index in range(10):
+        add_turn(memory, index)
+    assert memory.summary
+    assert "[도구: get_monthly_income]" in memory.summary[-1]
+    assert "답변" in memory.summary[-1]
+    messages = memory.get_messages()
+    assert [m["role"] for m in messages[:2]] == ["system", "system"]
+    assert_tool_results_follow_their_calls(messages)
+    assert memory.count_tokens() <= 600
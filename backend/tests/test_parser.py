@@ -0,0 +1,99 @@
+"""Tests for tool call parsing and argument repair."""
+
+from typing import Any
+
+import pytest
+
+from app.llm.parser import StreamAccumulator, parse_response, repair_json_arguments
+
+
+def response(arguments: str, finish_reason: str = "tool_calls") -> dict[str, Any]:
+    """A chat completion with one add_daily_expense call."""
+    return {
+        "choices": [
+            {
+                "message": {
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "function": {"name": "add_daily_expense", "arguments": arguments},
+                        }
+                    ],
+                },
+                "finish_reason": finish_reason,
+            }
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('```json\n{"a": 1}\n```', {"a": 1}),
+        ('{"a": 1} and some text', {"a": 1}),
+        ('{"a": 1,}', {"a": 1}),
+        ('{"a": {"b": [1, 2,],}, }', {"a": {"b": [1, 2]}}),
+        ('{"a": "x, y}", "b": "z"}', {"a": "x, y}", "b": "z"}),
+    ],
+)
+def test_repair(text: str, expected: dict[str, Any]) -> None:
+    assert repair_json_arguments(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # Stopped early: no member is dropped or completed
+        '{"date": "2024-05-03", "amount": 120',
+        '{"date": "2024-05-03", "amount": 12000, "description": "점',
+        '{"a": 1, "b":',
+        '{"a": 1, "b": {"c": 2}',
+        '{"a": "x, y", "b": "z',
+        '{"year_month": "2024-0',
+        '{"amount": 120',
+        '{"a": [1, 2',
+        "{'a': 1}",
+        '{"a": 2024-05}',
+        "[1, 2]",
+        "nope",
+    ],
+)
+def test_repair_gives_up(text: str) -> None:
+    assert repair_json_arguments(text) is None
+
+
+def test_invalid_arguments_are_reported_not_dropped() -> None:
+    parsed = parse_response(response('{"year_month": 2024-05}'))
+    assert len(parsed.tool_calls) == 1
+    assert parsed.tool_calls[0].arguments == {}
+    assert parsed.tool_calls[0].invalid_arguments == '{"year_month": 2024-05}'
+
+
+@pytest.mark.parametrize("finish_reason", ["tool_calls", "stop", "length"])
+def test_unterminated_arguments_are_invalid(finish_reason: str) -> None:
+    arguments = '{"date": "2024-05-03", "amount": 12000, "description": "점심'
+    tool_call = parse_response(response(arguments, finish_reason)).tool_calls[0]
+    assert tool_call.arguments == {}
+    assert tool_call.invalid_arguments == arguments
+
+
+def test_length_cutoff_is_not_repaired() -> None:
+    arguments = '```json\n{"year_month": "2024-05"}\n```'
+    assert parse_response(response(arguments)).tool_calls[0].arguments == {
+        "year_month": "2024-05"
+    }
+    tool_call = parse_response(response(arguments, finish_reason="length")).tool_calls[0]
+    assert tool_call.arguments == {}
+    assert tool_call.invalid_arguments == arguments
+
+
+def test_stream_length_cutoff_is_not_repaired() -> None:
+    accumulator = StreamAccumulator()
+    first = {"index": 0, "id": "call_1", "function": {"name": "x", "arguments": '{"date": '}}
+    rest = {"index": 0, "function": {"arguments": '"2024-05-03", "amount": 120'}}
+    for tool_call in (first, rest):
+        accumulator.feed({"choices": [{"delta": {"tool_calls": [tool_call]}, "finish_reason": None}]})
+    completed = accumulator.feed({"choices": [{"delta": {}, "finish_reason": "length"}]})[1]
+    assert len(completed) == 1
+    assert completed[0].invalid_arguments == '{"date": "2024-05-03", "amount": 120'
@@ -0,0 +1,27 @@
+"""Daily expense reads must stay index range scans (EXPLAIN QUERY PLAN)."""
+
+import asyncio
+
+import pytest
+
+from benchmarks.explain_queries import is_full_scan, query_plans
+
+
+@pytest.fixture(scope="module")
+def plans() -> dict[str, list[str]]:
+    return asyncio.run(query_plans())
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["get_expenses_by_date", "get_expenses_by_period", "get_monthly_daily_expenses"],
+)
+def test_date_queries_use_date_index(plans: dict[str, list[str]], query: str) -> None:
+    assert plans[query], f"{query} issued no daily_expenses statement"
+    for detail in plans[query]:
+        assert "USING INDEX ix_daily_expenses_date" in detail, detail
+
+
+def test_no_full_scans(plans: dict[str, list[str]]) -> None:
+    for query, details in plans.items():
+        assert not any(is_full_scan(detail) for detail in details), (query, details)
@@ -0,0 +1,95 @@
+"""Intent router: time references and tool matching."""
+
+import datetime
+import re
+
+import pytest
+
+import app.tools.builtin  # noqa: F401  (registers the tools)
+from app.agent.router import IntentRouter, IntentRule, resolve_time
+
+TODAY = datetime.date(2024, 3, 15)  # a Friday
+
+
+@pytest.mark.parametrize(
+    ("text", "month", "date", "period"),
+    [
+        ("이번 달", "2024-03", None, None),
+        ("지난달", "2024-02", None, None),
+        ("1월", "2024-01", None, None),
+        ("2023년 12월", "2023-12", None, None),
+        ("2023.11", "2023-11", None, None),
+        ("13월", None, None, None),
+        ("5월 3일", None, "2024-05-03", None),
+        ("2024-02-29", None, "2024-02-29", None),
+        ("2023-02-29", None, None, None),
+        ("어제", None, "2024-03-14", None),
+        ("그저께", None, "2024-03-13", None),
+        ("이번 주", None, None, ("2024-03-11", "2024-03-15")),
+        ("지난 주", None, None, ("2024-03-04", "2024-03-10")),
+        ("최근 7일", None, None, ("2024-03-09", "2024-03-15")),
+    ],
+)
+def test_resolve_time(
+    text: str, month: str | None, date: str | None, period: tuple[str, str] | None
+) -> None:
+    refs = resolve_time(text, TODAY)
+    assert (refs.month, refs.date, refs.period) == (month, date, period)
+
+
+@pytest.mark.parametrize(
+    ("text", "tool", "arguments"),
+    [
+        ("이번 달 예산 현황", "get_budget_status", {"year_month": "2024-03"}),
+        ("2023년 12월 예산", "get_budget_status", {"year_month": "2023-12"}),
+        ("지난 달 요약", "get_monthly_summary", {"year_month": "2024-02"}),
+        ("1월 수입", "get_monthly_income", {"year_month": "2024-01"}),
+        ("카테고리별 분석", "get_category_analysis", {"year_month": "2024-03"}),
+        ("고정 지출 목록", "list_fixed_expenses", {}),
+        ("어제 쓴 돈", "get_expenses_by_date", {"date": "2024-03-14"}),
+        ("3월 5일 지출", "get_expenses_by_date", {"date": "2024-03-05"}),
+        (
+            "최근 7일 지출",
+            "get_expenses_by_period",
+            {"start_date": "2024-03-09", "end_date": "2024-03-15"},
+        ),
+    ],
+)
+def test_lookups_are_routed(text: str, tool: str, arguments: dict[str, str]) -> None:
+    match = IntentRouter().match(text, TODAY)
+    assert match is not None
+    assert (match.tool, match.arguments) == (tool, arguments)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "점심 12000원 썼어",
+        "이번 달 예산 50만원으로 설정해줘",
+        "예산 줄이려면 어떻게 해",
+        "지난 달이랑 이번 달 비교해줘",
+        "안녕",
+        # Spending without a day or period: the tool's arguments are unknown
+        "지출",
+        # Too long to be a simple lookup
+        "이번 달 예산 현황이랑 카테고리별 지출 분석, 고정 지출 목록까지 한꺼번에 정리해서 보여줘",
+    ],
+)
+def test_writes_advice_and_unclear_messages_go_to_the_agent(text: str) -> None:
+    assert IntentRouter().match(text, TODAY) is None
+
+
+def test_ambiguous_match_goes_to_the_agent() -> None:
+    how_much = re.compile(r"얼마")
+    router = IntentRouter(
+        rules=[
+            IntentRule("get_budget_status", [(how_much, 1.0)], arguments=lambda refs: {}),
+            IntentRule("get_monthly_summary", [(how_much, 1.0)], arguments=lambda refs: {}),
+        ]
+    )
+    assert router.match("얼마야", TODAY) is None
+
+
+def test_write_tools_are_never_routed() -> None:
+    router = IntentRouter(rules=[IntentRule("add_daily_expense", [(re.compile(r"커피"), 2.0)])])
+    assert router.match("커피", TODAY) is None
@@ -0,0 +1,101 @@
+"""Tool calls of one turn: concurrent reads, ordered writes, results in call order."""
+
+import asyncio
+from typing import Any
+
+from app.agent.scheduler import ToolCallScheduler
+from app.llm.parser import ToolCall
+from app.tools.base import BaseTool
+from app.tools.registry import ToolRegistry
+
+
+class Tool(BaseTool):
+    """A tool that is only scheduled, never executed through the registry."""
+
+    description = "Test tool."
+    parameters = []
+
+    def __init__(self, name: str, read_only: bool) -> None:
+        self._name = name
+        self._read_only = read_only
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+    async def execute(self, **kwargs: Any) -> str:
+        raise NotImplementedError
+
+
+class Recorder:
+    """Executes calls by sleeping ``arguments["delay"]``, logging starts and ends."""
+
+    def __init__(self) -> None:
+        self.log: list[str] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, tc: ToolCall) -> str:
+        self.log.append(f"start {tc.id}")
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(tc.arguments.get("delay", 0))
+        self.running -= 1
+        self.log.append(f"end {tc.id}")
+        return f"result {tc.id}"
+
+
+def registry() -> ToolRegistry:
+    tools = ToolRegistry()
+    tools.register(Tool("read", read_only=True))
+    tools.register(Tool("write", read_only=False))
+    return tools
+
+
+def call(id: str, name: str, delay: float = 0.0) -> ToolCall:
+    return ToolCall(id=id, name=name, arguments={"delay": delay})
+
+
+def run(calls: list[ToolCall], max_concurrency: int = 4) -> tuple[list[str], Recorder]:
+    recorder = Recorder()
+
+    async def schedule() -> list[str]:
+        scheduler = ToolCallScheduler(registry(), recorder, max_concurrency=max_concurrency)
+        for tc in calls:
+            scheduler.submit(tc)
+        return await scheduler.results()
+
+    return asyncio.run(schedule()), recorder
+
+
+def test_results_in_call_order() -> None:
+    results, recorder = run([call("a", "read", 0.05), call("b", "read", 0.01), call("c", "read")])
+    assert results == ["result a", "result b", "result c"]
+    # They ran concurrently: the slow first call finished last
+    assert recorder.log[-1] == "end a"
+
+
+def test_concurrency_cap() -> None:
+    results, recorder = run([call(str(i), "read", 0.01) for i in range(10)], max_concurrency=3)
+    assert len(results) == 10
+    assert recorder.max_running == 3
+
+
+def test_writes_wait_for_earlier_calls_and_block_later_ones() -> None:
+    _, recorder = run(
+        [
+            call("r1", "read", 0.03),
+            call("r2", "read", 0.01),
+            call("w", "write"),
+            call("r3", "read"),
+            call("unknown", "missing"),
+        ]
+    )
+    log = recorder.log
+    assert log.index("start w") > max(log.index("end r1"), log.index("end r2"))
+    assert log.index("start r3") > log.index("end w")
+    assert log.index("start unknown") > log.index("end w")
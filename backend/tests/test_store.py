@@ -0,0 +1,148 @@
+"""Conversation stores: optimistic saves, eviction and loading."""
+
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from app.agent import store as store_module
+from app.agent.store import (
+    ConversationConflict,
+    ConversationStore,
+    DatabaseConversationStore,
+    InMemoryConversationStore,
+)
+from app.api.v1 import chat
+from app.db.database import SessionLocal
+from app.models.conversation import ConversationRecord
+
+
+@pytest.fixture(params=["memory", "database"])
+def store(request: pytest.FixtureRequest) -> ConversationStore:
+    if request.param == "memory":
+        return InMemoryConversationStore()
+    return DatabaseConversationStore()
+
+
+def state(*contents: str) -> dict:
+    return {"messages": [{"role": "user", "content": content} for content in contents]}
+
+
+def test_saves_name_the_version_they_loaded(store: ConversationStore, run: Callable) -> None:
+    conversation_id = uuid.uuid4().hex
+
+    async def scenario() -> None:
+        assert await store.get(conversation_id) is None
+        assert await store.save(conversation_id, state("a")) == 1
+        with pytest.raises(ConversationConflict):
+            await store.save(conversation_id, state("b"))
+        assert await store.save(conversation_id, state("a", "b"), 1) == 2
+        with pytest.raises(ConversationConflict):
+            await store.save(conversation_id, state("a", "c"), 1)
+
+        stored = await store.get(conversation_id)
+        assert stored is not None
+        assert (stored.state, stored.version) == (state("a", "b"), 2)
+
+    run(scenario())
+
+
+def test_concurrent_turns_are_both_kept(
+    store: ConversationStore, run: Callable, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(chat, "conversation_store", store)
+    conversation_id = uuid.uuid4().hex
+
+    async def scenario() -> list[str]:
+        await store.save(conversation_id, state("첫 질문"))
+        # Two workers load the same version and run a turn each
+        first, version = await chat.get_executor(conversation_id)
+        second, _ = await chat.get_executor(conversation_id)
+        for executor, question in ((first, "수입 알려줘"), (second, "지출 알려줘")):
+            executor.memory.add_user_message(question)
+            executor.memory.add_assistant_message(content=f"{question}: 답")
+
+        await chat.save_conversation(conversation_id, first, version)
+        await chat.save_conversation(conversation_id, second, version)
+        stored = await store.get(conversation_id)
+        assert stored is not None and stored.version == 3
+        return [message["content"] for message in stored.state["messages"]]
+
+    assert run(scenario()) == [
+        "첫 질문",
+        "수입 알려줘",
+        "수입 알려줘: 답",
+        "지출 알려줘",
+        "지출 알려줘: 답",
+    ]
+
+
+def test_memory_store_evicts_least_recently_used(run: Callable) -> None:
+    store = InMemoryConversationStore(max_entries=2)
+
+    async def scenario() -> list[bool]:
+        await store.save("a", state("a"))
+        await store.save("b", state("b"))
+        await store.get("a")  # "b" is now the least recently used
+        await store.save("c", state("c"))
+        return [await store.get(key) is not None for key in "abc"]
+
+    assert run(scenario()) == [True, False, True]
+
+
+def test_memory_store_expires_idle_conversations(
+    run: Callable, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(store_module.time, "monotonic", lambda: now[0])
+    store = InMemoryConversationStore(ttl_seconds=60)
+
+    async def scenario() -> list[bool]:
+        await store.save("a", state("a"))
+        await store.save("b", state("b"))
+        now[0] += 50
+        found = [await store.get("a") is not None]  # slides a's expiry
+        now[0] += 50
+        found += [await store.get("a") is not None, await store.get("b") is not None]
+        return found + [await store.count() == 1]
+
+    assert run(scenario()) == [True, True, False, True]
+
+
+def test_database_store_loads_conversations_saved_by_another_worker(run: Callable) -> None:
+    conversation_id = uuid.uuid4().hex
+    saved = {**state("질문"), "summary": ["- 사용자: 이전"], "offered_tools": ["get_monthly_income"]}
+
+    async def scenario() -> tuple[dict, int] | None:
+        await DatabaseConversationStore().save(conversation_id, saved)
+        stored = await DatabaseConversationStore().get(conversation_id)
+        return None if stored is None else (stored.state, stored.version)
+
+    assert run(scenario()) == (saved, 1)
+
+
+def test_database_store_expires_and_purges(run: Callable) -> None:
+    store = DatabaseConversationStore(ttl_seconds=60)
+    expired, fresh = uuid.uuid4().hex, uuid.uuid4().hex
+
+    async def scenario() -> list:
+        await store.save(expired, state("old"))
+        await store.save(fresh, state("new"))
+        async with SessionLocal() as db:
+            await db.execute(
+                update(ConversationRecord)
+                .where(ConversationRecord.id == expired)
+                .values(updated_at=datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=2))
+            )
+            await db.commit()
+        return [
+            await store.get(expired) is None,
+            await store.get(fresh) is not None,
+            await store.purge_expired(),
+            # An expired conversation starts over
+            await store.save(expired, state("again")),
+        ]
+
+    assert run(scenario()) == [True, True, 1, 1]
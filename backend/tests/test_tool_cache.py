@@ -0,0 +1,94 @@
+"""Read-only tool results are cached until their data changes in the database."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy import delete, insert
+
+import app.tools.builtin  # noqa: F401
+from app.db.database import engine
+from app.models.budget import MonthlyIncome
+from app.services.versioning import INCOME, bump_statement
+from app.tools import cache as cache_module
+from app.tools.base import BaseTool, ToolParameter
+from app.tools.cache import ToolResultCache
+from app.tools.registry import ToolRegistry, tool_registry
+
+
+def registry(*tools: BaseTool) -> ToolRegistry:
+    """A registry of the builtin tools (and ``tools``) with its own cache."""
+    result = ToolRegistry(cache=ToolResultCache(max_entries=16, default_ttl=60.0))
+    for tool in (*tool_registry.get_all(), *tools):
+        result.register(tool)
+    return result
+
+
+async def set_income(year_month: str, amount: float) -> None:
+    """Write income the way another worker would: only the database changes."""
+    async with engine.begin() as conn:
+        await conn.execute(delete(MonthlyIncome).where(MonthlyIncome.year_month == year_month))
+        await conn.execute(insert(MonthlyIncome).values(year_month=year_month, amount=amount))
+        await conn.execute(bump_statement(conn.dialect.name, [INCOME, year_month]))
+
+
+class SlowIncomeRead(BaseTool):
+    """A read-only income tool during which a write is committed."""
+
+    name = "slow_income_read"
+    description = "Read income while another worker writes it."
+    parameters = [ToolParameter(name="year_month", type="string", description="Month")]
+    domains = (INCOME,)
+    read_only = True
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def execute(self, **kwargs: Any) -> str:
+        self.calls += 1
+        await set_income(kwargs["year_month"], 1000.0 * self.calls)
+        return f"call {self.calls}"
+
+
+def test_hit_until_a_write_is_committed(run: Callable) -> None:
+    tools = registry()
+
+    async def scenario() -> list[str]:
+        results = [await tools.execute("get_monthly_income", year_month="2032-01")]
+        results.append(await tools.execute("get_monthly_income", year_month="2032-01"))
+        await set_income("2032-01", 2_500_000.0)
+        results.append(await tools.execute("get_monthly_income", year_month="2032-01"))
+        return results
+
+    before, cached, after = run(scenario())
+    assert cached == before
+    assert after == "2032-01의 월 수입: ₩2,500,000"
+    assert tools.cache.stats() == {"entries": 1, "hits": 1, "misses": 2}
+
+
+def test_entries_expire(run: Callable, monkeypatch: pytest.MonkeyPatch) -> None:
+    tools = registry()
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    async def scenario() -> None:
+        await tools.execute("get_monthly_income", year_month="2032-02")
+        now[0] += 59.0
+        await tools.execute("get_monthly_income", year_month="2032-02")
+        now[0] += 2.0
+        await tools.execute("get_monthly_income", year_month="2032-02")
+
+    run(scenario())
+    assert tools.cache.stats()["hits"] == 1
+    assert tools.cache.stats()["misses"] == 2
+
+
+def test_result_read_across_a_write_is_not_stored(run: Callable) -> None:
+    slow = SlowIncomeRead()
+    tools = registry(slow)
+
+    async def scenario() -> list[str]:
+        return [await tools.execute("slow_income_read", year_month="2032-03") for _ in range(2)]
+
+    assert run(scenario()) == ["call 1", "call 2"]
+    assert tools.cache.stats()["entries"] == 0
@@ -0,0 +1,48 @@
+"""The tools offered in a conversation only grow, keeping the prompt prefix stable."""
+
+import app.tools.builtin  # noqa: F401
+from app.agent.executor import AgentExecutor
+from app.agent.tool_selection import tool_selector
+
+EXPENSE = "어제 점심 12000원 썼어"
+INCOME = "이번 달 수입 알려줘"
+
+
+def test_offered_tools_are_sticky() -> None:
+    executor = AgentExecutor(selector=tool_selector)
+    expense_tools = executor._select_tools(EXPENSE)
+    expense_prompt = executor.memory.system_prompt
+    offered = list(executor.memory.offered_tools)
+
+    both_tools = executor._select_tools(INCOME)
+    both_prompt = executor.memory.system_prompt
+    assert set(offered) < set(executor.memory.offered_tools)
+    assert (both_tools, both_prompt) != (expense_tools, expense_prompt)
+
+    # Back to the first topic: nothing is withdrawn, the prefix is unchanged
+    assert executor._select_tools(EXPENSE) == both_tools
+    assert executor.memory.system_prompt == both_prompt
+
+
+def test_offered_tools_survive_the_conversation_store() -> None:
+    executor = AgentExecutor(selector=tool_selector)
+    executor._select_tools(EXPENSE)
+    executor._select_tools(INCOME)
+
+    restored = AgentExecutor(selector=tool_selector)
+    restored.memory.load_state(executor.memory.to_state())
+    assert restored._select_tools(EXPENSE) == executor._select_tools(EXPENSE)
+    assert restored.memory.system_prompt == executor.memory.system_prompt
+
+
+def test_messages_matching_nothing_keep_the_offered_tools() -> None:
+    executor = AgentExecutor(selector=tool_selector)
+    all_tools = executor.tools.get_openai_tools_json()
+    assert executor._select_tools("안녕하세요") == all_tools
+    assert executor.memory.offered_tools == []
+
+    expense_tools = executor._select_tools(EXPENSE)
+    offered = list(executor.memory.offered_tools)
+    for greeting in ("안녕하세요", "고마워", "응 그렇게 해줘"):
+        assert executor._select_tools(greeting) == expense_tools
+    assert executor.memory.offered_tools == offered
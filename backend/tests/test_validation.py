@@ -0,0 +1,149 @@
+"""Tool argument coercion and validation."""
+
+import json
+from typing import Any
+
+import pytest
+
+from app.tools.base import ToolParameter
+from app.tools.validation import ArgumentValidator, format_argument_errors
+
+
+def validator(**fields: Any) -> ArgumentValidator:
+    """A validator for one parameter named ``value``."""
+    return ArgumentValidator([ToolParameter(name="value", description="", **fields)])
+
+
+def coerce(value: Any, **fields: Any) -> Any:
+    arguments, errors = validator(**fields).validate({"value": value})
+    assert errors == []
+    return arguments["value"]
+
+
+def error(value: Any, **fields: Any) -> str:
+    arguments, errors = validator(**fields).validate({"value": value})
+    assert arguments == {}
+    [argument_error] = errors
+    return argument_error.message
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (15000, 15000),
+        (12.5, 12.5),
+        ("15000", 15000),
+        ("15,000원", 15000),
+        ("₩15,000", 15000),
+        ("1만 5천", 15000),
+        ("1만5천원", 15000),
+        ("3만", 30000),
+        ("1.5만", 15000),
+        ("2억", 200_000_000),
+        ("-3000", -3000),
+    ],
+)
+def test_amounts(value: Any, expected: int | float) -> None:
+    assert coerce(value, type="number") == expected
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-Infinity", "abc", "", True, "만천"])
+def test_non_amounts_are_rejected(value: Any) -> None:
+    assert error(value, type="number") in ("expected a number", "expected a finite number")
+
+
+def test_integers() -> None:
+    assert coerce("3", type="integer") == 3
+    assert coerce(4.0, type="integer") == 4
+    assert error(4.5, type="integer") == "expected an integer"
+
+
+def test_lower_bounds() -> None:
+    assert coerce(0, type="number", minimum=0) == 0
+    assert error(-1, type="number", minimum=0) == "must be at least 0"
+    assert coerce("1원", type="number", exclusive_minimum=0) == 1
+    assert error("0원", type="number", exclusive_minimum=0) == "must be greater than 0"
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2024-01-15", "2024/01/15", "2024.1.15", "2024년 1월 15일", "20240115", " 2024-01-15 "],
+)
+def test_dates(value: str) -> None:
+    assert coerce(value, type="string", format="date") == "2024-01-15"
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        ("2023-02-29", "not a valid calendar date"),
+        ("2024-13-01", "not a valid calendar date"),
+        ("15 January", "expected a date in YYYY-MM-DD format"),
+        ("2024-01", "expected a date in YYYY-MM-DD format"),
+    ],
+)
+def test_invalid_dates(value: str, message: str) -> None:
+    assert error(value, type="string", format="date") == message
+
+
+@pytest.mark.parametrize(
+    "value", ["2024-01", "2024-1", "2024/01", "2024년 1월", "202401", "2024-01-31"]
+)
+def test_year_months(value: str) -> None:
+    assert coerce(value, type="string", format="year_month") == "2024-01"
+
+
+@pytest.mark.parametrize("value", ["2024-13", "202400", "January", "2024-02-30"])
+def test_invalid_year_months(value: str) -> None:
+    assert error(value, type="string", format="year_month") == "expected a month in YYYY-MM format"
+
+
+def test_enum() -> None:
+    assert coerce("food", type="string", enum=["food", "transport"]) == "food"
+    assert error("rent", type="string", enum=["food", "transport"]) == (
+        "expected one of: food, transport"
+    )
+
+
+def test_arrays_sent_as_json_strings() -> None:
+    assert coerce('["a", "b"]', type="array") == ["a", "b"]
+    assert error("a, b", type="array") == "expected an array"
+
+
+def test_missing_null_and_unknown_arguments() -> None:
+    validator = ArgumentValidator(
+        [
+            ToolParameter(name="amount", type="number", description=""),
+            ToolParameter(name="memo", type="string", description="", required=False),
+        ]
+    )
+    arguments, errors = validator.validate({"memo": None, "category": "food"})
+    assert arguments == {}
+    assert [(e.argument, e.message) for e in errors] == [("amount", "required argument is missing")]
+
+    arguments, errors = validator.validate({"amount": "5천원", "memo": "점심", "category": "food"})
+    assert (arguments, errors) == ({"amount": 5000, "memo": "점심"}, [])
+
+
+def test_error_report_is_valid_json() -> None:
+    validator = ArgumentValidator(
+        [
+            ToolParameter(name="amount", type="number", description=""),
+            ToolParameter(name="date", type="string", description="", format="date"),
+        ]
+    )
+    _, errors = validator.validate({"amount": float("nan"), "date": "어제"})
+    report = json.loads(format_argument_errors("add_daily_expense", errors))
+    assert report == {
+        "error": "invalid_arguments",
+        "tool": "add_daily_expense",
+        "details": [
+            {"argument": "amount", "message": "expected a finite number", "received": "nan"},
+            {
+                "argument": "date",
+                "message": "expected a date in YYYY-MM-DD format",
+                "received": "어제",
+            },
+        ],
+        "hint": "Call add_daily_expense again with these arguments corrected.",
+    }
@@ -48,4 +48,6 @@ python -m vllm.entrypoints.openai.api_server \
     --gpu-memory-utilization "$GPU_MEMORY" \
     --enable-auto-tool-choice \
     --tool-call-parser "$PARSER" \
+    --enable-prefix-caching \
+    --enable-prompt-tokens-details \
     --trust-remote-code